@@ -3,9 +3,15 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path
 from app.api.deps import get_container
 from app.api.schemas.checklist import (
     ChecklistAcceptedResponse,
+    ChecklistBatchError,
+    ChecklistBatchRequest,
+    ChecklistBatchResponse,
+    ChecklistBatchResult,
     ChecklistRequest,
     ChecklistSyncResponse,
 )
+from app.core.errors import CircuitBreakerOpen
+from app.settings import settings
 
 router = APIRouter(prefix="/api/checklists", tags=["checklists"])
 
@@ -27,10 +33,48 @@ async def create_checklists_sync(
             },
         )
 
-    checklists = await container.checklist_service.generate(case_id="sync_test", keywords=keywords)
+    checklists = await container.checklist_service.generate(template_id="sync_test", keywords=keywords)
     return ChecklistSyncResponse(checklists=checklists)
 
 
+@router.post("/batch", response_model=ChecklistBatchResponse)
+async def create_checklists_batch(
+    body: ChecklistBatchRequest,
+    container=Depends(get_container),
+):
+    if not body.items or len(body.items) > settings.CHECKLIST_BATCH_API_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": {
+                    "code": "INVALID_INPUT",
+                    "message": f"items는 1개 이상 {settings.CHECKLIST_BATCH_API_MAX_ITEMS}개 이하이어야 합니다.",
+                }
+            },
+        )
+
+    results = await container.checklist_service.generate_many(
+        [item.keywords or [] for item in body.items],
+        template_ids=[item.id if item.id is not None else "batch" for item in body.items],
+        return_exceptions=True,
+    )
+
+    response: list[ChecklistBatchResult] = []
+    for item, result in zip(body.items, results, strict=True):
+        if isinstance(result, CircuitBreakerOpen):
+            raise result
+        if isinstance(result, BaseException):
+            response.append(
+                ChecklistBatchResult(
+                    id=item.id,
+                    error=ChecklistBatchError(code="failed", message="체크리스트 생성 중 오류가 발생하였습니다."),
+                )
+            )
+            continue
+        response.append(ChecklistBatchResult(id=item.id, checklists=result))
+    return ChecklistBatchResponse(results=response)
+
+
 async def _run_checklist_and_callback(container, case_id: str, keywords: list[str]):
     try:
         checklists = await container.checklist_service.generate(case_id, keywords)
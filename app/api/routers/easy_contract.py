@@ -2,20 +2,22 @@ from __future__ import annotations
 
 from pathlib import Path as FsPath
 from urllib.parse import urlparse
-from uuid import uuid4
 
 import httpx
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Path, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Path, Request, UploadFile
 from fastapi.responses import PlainTextResponse
 
-from app.api.schemas.easy_contract import EasyContractRequest
 from app.api.deps import get_container
+from app.api.schemas.easy_contract import EasyContractRequest
+from app.api.schemas.job import JobAcceptedResponse, JobError, JobStatusResponse
+from app.core.errors import CircuitBreakerOpen
+from app.services.easy_contract_service import NotLeaseContract
+from app.services.job_service import JOB_FAILED, JOB_SUCCEEDED, JobFailed, JobQueueFull
 
 router = APIRouter(prefix="/api/easycontract", tags=["easycontract"])
 
 ALLOWED_EXT = {".pdf", ".png", ".jpg", ".jpeg"}
-ROOT_DIR = FsPath(__file__).resolve().parents[3]
-S3_DIR = ROOT_DIR / "resources" / "s3"
+JOB_KIND_EASY_CONTRACT = "easy-contract"
 
 
 def _ext_ok(filename: str) -> bool:
@@ -108,7 +110,7 @@ async def _read_docs(files: list[UploadFile], doc_types: list[str]) -> list[dict
     return docs
 
 
-async def _download_file(http: httpx.AsyncClient, url: str, dst_path: FsPath) -> bytes:
+async def _download_file(http: httpx.AsyncClient, url: str) -> bytes:
     try:
         res = await http.get(url)
         res.raise_for_status()
@@ -117,43 +119,27 @@ async def _download_file(http: httpx.AsyncClient, url: str, dst_path: FsPath) ->
             status_code=400,
             detail={"error": {"code": "DOWNLOAD_FAILED", "message": "파일 다운로드에 실패했습니다."}},
         ) from e
-
-    try:
-        dst_path.write_bytes(res.content)
-    except OSError as e:
-        raise HTTPException(
-            status_code=500,
-            detail={"error": {"code": "FAILED_TO_SAVE", "message": "파일 저장 중 오류가 발생하였습니다."}},
-        ) from e
-
     return res.content
 
 
-@router.post(
-    "/sync",
-    response_class=PlainTextResponse,
-    responses={
-        200: {"content": {"text/markdown": {}}},
-        400: {"description": "입력값 오류"},
-    },
-)
-async def create_easy_contract_sync(
-    files: list[UploadFile] = File(..., description="pdf/png/jpg 최대 5개"),
-    doc_types: list[str] = Form(..., description="files와 같은 순서의 타입"),
-    container=Depends(get_container),
-):
-    _validate_inputs(files, doc_types)
-    docs = await _read_docs(files, doc_types)
+async def _download_docs(container, files, resolved_names: list[str]) -> list[dict]:
+    docs: list[dict] = []
+    for meta, filename in zip(files, resolved_names):
+        b = await _download_file(container.http, meta.url)
+        docs.append({"filename": filename, "bytes": b, "doc_type": meta.doc_type})
+    return docs
 
-    try:
-        md = await container.easy_contract_service.generate(case_id=-1, docs=docs)
-        if not md.strip():
-            raise HTTPException(
-                status_code=500,
-                detail={"error": {"code": "failed", "message": "쉬운 계약서 생성 중 오류가 발생하였습니다."}},
-            )
-        return PlainTextResponse(content=md, media_type="text/markdown; charset=utf-8")
 
+async def _generate_markdown(container, easy_contract_id: int, docs: list[dict]) -> str:
+    try:
+        md = await container.easy_contract_service.generate(easy_contract_id=easy_contract_id, docs=docs)
+    except CircuitBreakerOpen:
+        raise
+    except NotLeaseContract as e:
+        raise HTTPException(
+            status_code=422,
+            detail={"error": {"code": "NOT_LEASE_CONTRACT", "message": str(e)}},
+        ) from e
     except RuntimeError as e:
         if str(e) == "UNPROCESSABLE_DOCUMENT":
             raise HTTPException(
@@ -164,31 +150,58 @@ async def create_easy_contract_sync(
                         "message": "문서를 처리할 수 없습니다. 파일이 손상되었거나 암호화되어 있을 수 있습니다.",
                     }
                 },
-            )
+            ) from e
         raise HTTPException(
             status_code=500,
             detail={"error": {"code": "failed", "message": "쉬운 계약서 생성 중 오류가 발생하였습니다."}},
-        )
-
-    except HTTPException:
-        raise
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={"error": {"code": "failed", "message": "쉬운 계약서 생성 중 오류가 발생하였습니다."}},
+        ) from e
 
-    except Exception:
+    if not md.strip():
         raise HTTPException(
             status_code=500,
             detail={"error": {"code": "failed", "message": "쉬운 계약서 생성 중 오류가 발생하였습니다."}},
         )
+    return md
+
+
+def _markdown_response(md: str) -> PlainTextResponse:
+    return PlainTextResponse(content=md, media_type="text/markdown; charset=utf-8")
 
 
 @router.post(
-    "/{id}",
+    "/sync",
     response_class=PlainTextResponse,
     responses={
         200: {"content": {"text/markdown": {}}},
         400: {"description": "입력값 오류"},
     },
 )
-async def create_easy_contract(
+async def create_easy_contract_sync(
+    files: list[UploadFile] = File(..., description="pdf/png/jpg 최대 5개"),
+    doc_types: list[str] = Form(..., description="files와 같은 순서의 타입"),
+    container=Depends(get_container),
+):
+    _validate_inputs(files, doc_types)
+    docs = await _read_docs(files, doc_types)
+    return _markdown_response(await _generate_markdown(container, -1, docs))
+
+
+@router.post(
+    "/{id}/jobs",
+    status_code=202,
+    response_model=JobAcceptedResponse,
+    responses={
+        400: {"description": "입력값 오류"},
+        503: {"description": "대기 중인 작업이 너무 많음"},
+    },
+)
+async def submit_easy_contract_job(
+    request: Request,
     body: EasyContractRequest,
     id: int = Path(..., description="쉬운계약서 식별자(int)"),
     container=Depends(get_container),
@@ -196,58 +209,105 @@ async def create_easy_contract(
     files = body.files or []
     resolved_names = _validate_file_metas(files)
 
-    S3_DIR.mkdir(parents=True, exist_ok=True)
-    saved_paths: list[FsPath] = []
-    docs: list[dict] = []
+    async def run() -> str:
+        try:
+            docs = await _download_docs(container, files, resolved_names)
+            return await _generate_markdown(container, id, docs)
+        except HTTPException as e:
+            error = (e.detail or {}).get("error", {}) if isinstance(e.detail, dict) else {}
+            raise JobFailed(
+                error.get("code", "failed"),
+                error.get("message", "쉬운 계약서 생성 중 오류가 발생하였습니다."),
+            ) from e
+        except CircuitBreakerOpen as e:
+            raise JobFailed("SERVICE_UNAVAILABLE", str(e)) from e
 
     try:
-        for meta, filename in zip(files, resolved_names):
-            ext = FsPath(filename).suffix
-            stored_name = f"{id}_{uuid4().hex}{ext}"
-            stored_path = S3_DIR / stored_name
+        job = await container.job_service.submit(kind=JOB_KIND_EASY_CONTRACT, resource_id=str(id), run=run)
+    except JobQueueFull as e:
+        raise HTTPException(
+            status_code=503,
+            detail={"error": {"code": "TOO_MANY_JOBS", "message": "대기 중인 작업이 많습니다. 잠시 후 다시 시도해주세요."}},
+        ) from e
 
-            b = await _download_file(container.http, meta.url, stored_path)
-            saved_paths.append(stored_path)
-            docs.append({"filename": filename, "bytes": b, "doc_type": meta.doc_type})
+    return JobAcceptedResponse(
+        job_id=job.job_id,
+        status=job.status,
+        status_url=str(request.url_for("get_easy_contract_job", job_id=job.job_id).path),
+        result_url=str(request.url_for("get_easy_contract_job_result", job_id=job.job_id).path),
+    )
 
-        md = await container.easy_contract_service.generate(case_id=id, docs=docs)
-        if not md.strip():
-            raise HTTPException(
-                status_code=500,
-                detail={"error": {"code": "failed", "message": "쉬운 계약서 생성 중 오류가 발생하였습니다."}},
-            )
-        return PlainTextResponse(content=md, media_type="text/markdown; charset=utf-8")
 
-    except RuntimeError as e:
-        if str(e) == "UNPROCESSABLE_DOCUMENT":
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": {
-                        "code": "UNPROCESSABLE_DOCUMENT",
-                        "message": "문서를 처리할 수 없습니다. 파일이 손상되었거나 암호화되어 있을 수 있습니다.",
-                    }
-                },
-            )
+async def _get_job_or_404(container, job_id: str):
+    job = await container.job_service.get(job_id)
+    if job is None or job.kind != JOB_KIND_EASY_CONTRACT:
         raise HTTPException(
-            status_code=500,
-            detail={"error": {"code": "failed", "message": "쉬운 계약서 생성 중 오류가 발생하였습니다."}},
+            status_code=404,
+            detail={"error": {"code": "JOB_NOT_FOUND", "message": "작업을 찾을 수 없습니다."}},
         )
+    return job
 
-    except HTTPException:
-        raise
 
-    except Exception:
+@router.get("/jobs/{job_id}", response_model=JobStatusResponse, name="get_easy_contract_job")
+async def get_easy_contract_job(
+    job_id: str = Path(..., description="작업 식별자"),
+    container=Depends(get_container),
+):
+    job = await _get_job_or_404(container, job_id)
+    return JobStatusResponse(
+        job_id=job.job_id,
+        kind=job.kind,
+        resource_id=job.resource_id,
+        status=job.status,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        error=JobError(code=job.error_code, message=job.error_message) if job.status == JOB_FAILED else None,
+    )
+
+
+@router.get(
+    "/jobs/{job_id}/result",
+    response_class=PlainTextResponse,
+    name="get_easy_contract_job_result",
+    responses={
+        200: {"content": {"text/markdown": {}}},
+        404: {"description": "작업 없음"},
+        409: {"description": "작업이 끝나지 않았거나 실패함"},
+    },
+)
+async def get_easy_contract_job_result(
+    job_id: str = Path(..., description="작업 식별자"),
+    container=Depends(get_container),
+):
+    job = await _get_job_or_404(container, job_id)
+    if job.status == JOB_SUCCEEDED:
+        return _markdown_response(job.result or "")
+    if job.status == JOB_FAILED:
         raise HTTPException(
-            status_code=500,
-            detail={"error": {"code": "failed", "message": "쉬운 계약서 생성 중 오류가 발생하였습니다."}},
+            status_code=409,
+            detail={"error": {"code": job.error_code or "failed", "message": job.error_message or ""}},
         )
+    raise HTTPException(
+        status_code=409,
+        detail={"error": {"code": "JOB_NOT_FINISHED", "message": f"작업이 아직 끝나지 않았습니다. (status={job.status})"}},
+    )
 
-    finally:
-        for path in saved_paths:
-            try:
-                path.unlink()
-            except FileNotFoundError:
-                pass
-            except Exception:
-                pass
+
+@router.post(
+    "/{id}",
+    response_class=PlainTextResponse,
+    responses={
+        200: {"content": {"text/markdown": {}}},
+        400: {"description": "입력값 오류"},
+    },
+)
+async def create_easy_contract(
+    body: EasyContractRequest,
+    id: int = Path(..., description="쉬운계약서 식별자(int)"),
+    container=Depends(get_container),
+):
+    files = body.files or []
+    resolved_names = _validate_file_metas(files)
+    docs = await _download_docs(container, files, resolved_names)
+    return _markdown_response(await _generate_markdown(container, id, docs))
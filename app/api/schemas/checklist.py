@@ -15,3 +15,29 @@ class ChecklistAcceptedResponse(BaseModel):
 
 class ChecklistSyncResponse(BaseModel):
     checklists: list[str]
+
+
+class ChecklistBatchItem(BaseModel):
+    id: str | None = Field(default=None, description="요청 항목 식별자(응답에 그대로 반환)")
+    keywords: list[str] | None = Field(
+        default=None, description="라이프스타일 키워드 목록(자연어 가능)"
+    )
+
+
+class ChecklistBatchRequest(BaseModel):
+    items: list[ChecklistBatchItem] = Field(..., description="키워드 묶음 목록")
+
+
+class ChecklistBatchError(BaseModel):
+    code: str
+    message: str
+
+
+class ChecklistBatchResult(BaseModel):
+    id: str | None = None
+    checklists: list[str] = Field(default_factory=list)
+    error: ChecklistBatchError | None = None
+
+
+class ChecklistBatchResponse(BaseModel):
+    results: list[ChecklistBatchResult]
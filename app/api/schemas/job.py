@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+
+
+class JobError(BaseModel):
+    code: str
+    message: str
+
+
+class JobAcceptedResponse(BaseModel):
+    job_id: str
+    status: str
+    status_url: str = Field(..., description="작업 상태 조회 경로")
+    result_url: str = Field(..., description="작업 결과 조회 경로")
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    kind: str
+    resource_id: str
+    status: str = Field(..., description="queued/running/succeeded/failed")
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    error: JobError | None = None
@@ -1,64 +1,157 @@
 # v2: Docker + MIG rolling update 배포 방식 적용
 # CI/CD pipeline trigger test
+from __future__ import annotations
+
 import asyncio
 import contextlib
 import logging
+import os
+import time
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 import httpx
 from aiolimiter import AsyncLimiter
 
-from app.resources.http.client import create_async_http_client
+from app.core.cpu_executor import CpuTaskExecutor
+from app.core.loop_monitor import LoopLagMonitor
+from app.core.metrics import CANCEL_REGISTRY_SIZE
+from app.resources.hf.tokenizer import TokenCounter
+from app.resources.http.client import HttpPoolConfig, create_dependency_http_client
 from app.resources.ocr.upstage_client import UpstageDocumentParseClient
 from app.resources.rabbitmq.client import QueueBinding, RabbitMQClient
 from app.resources.rabbitmq.result_publisher import RabbitMQResultPublisher
+from app.resources.redis.client import create_redis_client
+from app.resources.vllm.balancer import VLLMEndpointBalancer
 from app.resources.vllm.client import VLLMClient
+from app.resources.vllm.scheduler import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    PriorityClassConfig,
+    VLLMRequestScheduler,
+)
 from app.services.callback_service import CallbackService
 from app.services.cancel_registry import CancelRegistry
-from app.services.checklist_service import ChecklistService
-from app.services.easy_contract_service import EasyContractService
+from app.services.checklist_batcher import ChecklistBatcher
+from app.services.checklist_service import ChecklistService, checklist_graph
+from app.services.easy_contract_service import EasyContractService, easy_contract_graph
+from app.services.idempotency import (
+    IdempotencyGuard,
+    IdempotencyStore,
+    InMemoryIdempotencyStore,
+    RedisIdempotencyStore,
+)
+from app.services.job_checkpoint import (
+    JobCheckpointStore,
+    LocalDiskCheckpointStore,
+    RedisCheckpointStore,
+)
+from app.services.job_service import InMemoryJobStore, JobService, JobStore, RedisJobStore
+from app.services.pipeline import EXECUTOR_LANGGRAPH, PIPELINE_EXECUTORS
 from app.settings import settings
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.hedging import HedgingPolicy
+from app.utils.prompt_budget import PromptBudgeter
 from app.workers.handlers.checklist_handler import ChecklistMessageHandler
 from app.workers.handlers.easy_contract_cancel_handler import EasyContractCancelMessageHandler
 from app.workers.handlers.easy_contract_handler import EasyContractMessageHandler
 from app.workers.mq_worker import RabbitMQWorker
+from app.workers.prefetch_controller import AdaptivePrefetchController, QueueControl, breaker_probe
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass
 class AppContainer:
+    # 파일 다운로드용 풀 (의존성별 풀 전체는 http_pools)
     http: httpx.AsyncClient
     vllm: VLLMClient
     callback: CallbackService
     checklist_service: ChecklistService
     easy_contract_service: EasyContractService
     upstage: UpstageDocumentParseClient
+    job_service: JobService
+    cpu_executor: CpuTaskExecutor | None = None
+    redis: Redis | None = None
     rabbitmq_client: RabbitMQClient | None = None
     rabbitmq_result_publisher: RabbitMQResultPublisher | None = None
     rabbitmq_bindings: list[QueueBinding] = field(default_factory=list)
     cancel_registry: CancelRegistry | None = None
+    idempotency_store: IdempotencyStore | None = None
+    circuit_breakers: dict[str, CircuitBreaker] = field(default_factory=dict)
     rabbitmq_worker: RabbitMQWorker | None = None
+    checklist_batcher: ChecklistBatcher | None = None
+    prefetch_controller: AdaptivePrefetchController | None = None
+    loop_monitor: LoopLagMonitor | None = None
+    http_pools: dict[str, httpx.AsyncClient] = field(default_factory=dict)
     cancel_cleanup_interval_sec: int = 60
+    # aclose 전에 drain 을 부르지 않았을 때 aclose 가 처리 중인 메시지를 기다리는 시간
+    drain_timeout_sec: float = 0.0
+    _drained: bool = field(default=False, init=False, repr=False)
     _cancel_cleanup_task: asyncio.Task | None = field(default=None, init=False, repr=False)
 
     async def startup(self) -> None:
+        if self.loop_monitor is not None:
+            self.loop_monitor.start()
+        # 그래프 컴파일(langgraph import 포함)을 스레드로 돌려 프로세스 풀/브로커 연결 대기와 겹친다
+        graphs_ready = asyncio.create_task(
+            asyncio.to_thread(_compile_graphs, self.checklist_service, self.easy_contract_service)
+        )
+        try:
+            if self.cpu_executor is not None:
+                await self.cpu_executor.start()
+            if len(self.vllm.balancer.endpoints) > 1:
+                await self.vllm.refresh_endpoint_models()
+            if self.rabbitmq_client is not None:
+                await self.rabbitmq_client.connect()
+                for binding in self.rabbitmq_bindings:
+                    await self.rabbitmq_client.ensure_binding(binding)
+        finally:
+            # 첫 메시지가 그래프 컴파일을 기다리며 루프를 막지 않도록 소비 시작 전에 끝낸다
+            await graphs_ready
+        await self._cleanup_checkpoints()
         if self.rabbitmq_client is None:
             return
-        await self.rabbitmq_client.connect()
-        for binding in self.rabbitmq_bindings:
-            await self.rabbitmq_client.ensure_binding(binding)
         if self.rabbitmq_worker is not None:
             await self.rabbitmq_worker.start()
+        if self.prefetch_controller is not None:
+            self.prefetch_controller.start()
         self._start_cancel_cleanup_task()
 
+    async def drain(self, timeout_sec: float) -> bool:
+        """메시지 수신을 멈추고 처리 중인 메시지가 끝나길 기다린다 (종료 신호 직후 aclose 전에 호출).
+
+        timeout_sec 안에 끝나지 않은 메시지는 중단 후 큐에 되돌리고, 체크포인트에서 다른 레플리카가 이어받는다.
+        """
+        self._drained = True
+        if self.prefetch_controller is not None:
+            await self.prefetch_controller.stop()
+        if self.rabbitmq_worker is None:
+            return True
+        return await self.rabbitmq_worker.drain(timeout_sec)
+
     async def aclose(self) -> None:
+        if not self._drained:
+            await self.drain(self.drain_timeout_sec)
         await self._stop_cancel_cleanup_task()
         if self.rabbitmq_worker is not None:
             await self.rabbitmq_worker.stop()
+        if self.checklist_batcher is not None:
+            await self.checklist_batcher.aclose()
         if self.rabbitmq_client is not None:
             await self.rabbitmq_client.close()
-        await self.http.aclose()
+        await self.job_service.aclose()
+        if self.cpu_executor is not None:
+            await self.cpu_executor.aclose()
+        if self.redis is not None:
+            await self.redis.aclose()
+        for client in {id(c): c for c in (self.http, *self.http_pools.values())}.values():
+            await client.aclose()
+        if self.loop_monitor is not None:
+            await self.loop_monitor.stop()
 
     def _start_cancel_cleanup_task(self) -> None:
         if self.cancel_registry is None:
@@ -92,52 +185,255 @@ class AppContainer:
             await asyncio.sleep(self.cancel_cleanup_interval_sec)
             if self.cancel_registry is not None:
                 self.cancel_registry.cleanup_expired()
+            if isinstance(self.idempotency_store, InMemoryIdempotencyStore):
+                self.idempotency_store.cleanup_expired()
+            await self._cleanup_checkpoints()
+
+    async def _cleanup_checkpoints(self) -> None:
+        # Redis 체크포인트는 키 TTL 로 만료되고, 디스크 체크포인트만 직접 지운다
+        store = self.easy_contract_service.checkpoint_store
+        if not isinstance(store, LocalDiskCheckpointStore):
+            return
+        try:
+            await store.cleanup_expired()
+        except Exception:
+            logger.exception("만료된 체크포인트 정리 실패")
+
+
+def _create_circuit_breaker(name: str) -> CircuitBreaker | None:
+    if not settings.CIRCUIT_BREAKER_ENABLED:
+        return None
+    return CircuitBreaker(
+        name,
+        window_sec=settings.CIRCUIT_BREAKER_WINDOW_SEC,
+        min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+        failure_rate_threshold=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+        open_sec=settings.CIRCUIT_BREAKER_OPEN_SEC,
+    )
+
+
+def _create_hedging_policy(name: str, enabled: bool) -> HedgingPolicy | None:
+    if not enabled:
+        return None
+    return HedgingPolicy(
+        name,
+        percentile=settings.HEDGING_PERCENTILE,
+        min_delay_sec=settings.HEDGING_MIN_DELAY_SEC,
+        max_hedge_ratio=settings.HEDGING_MAX_RATIO,
+        min_samples=settings.HEDGING_MIN_SAMPLES,
+    )
+
+
+def _create_http_pools() -> dict[str, httpx.AsyncClient]:
+    common = {
+        "connect_timeout_sec": settings.HTTP_CONNECT_TIMEOUT_SEC,
+        "pool_timeout_sec": settings.HTTP_POOL_TIMEOUT_SEC,
+    }
+    configs = [
+        HttpPoolConfig(
+            name="vllm",
+            read_timeout_sec=settings.HTTP_TIMEOUT_SEC,
+            max_connections=settings.VLLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.VLLM_HTTP_MAX_CONNECTIONS,
+            **common,
+        ),
+        HttpPoolConfig(
+            name="ocr",
+            read_timeout_sec=settings.OCR_HTTP_READ_TIMEOUT_SEC,
+            max_connections=settings.OCR_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OCR_HTTP_MAX_CONNECTIONS,
+            http2=settings.OCR_HTTP2_ENABLED,
+            **common,
+        ),
+        HttpPoolConfig(
+            name="download",
+            read_timeout_sec=settings.DOWNLOAD_HTTP_READ_TIMEOUT_SEC,
+            max_connections=settings.DOWNLOAD_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=max(1, settings.DOWNLOAD_HTTP_MAX_CONNECTIONS // 4),
+            keepalive_expiry_sec=10.0,
+            **common,
+        ),
+        HttpPoolConfig(
+            name="callback",
+            read_timeout_sec=settings.CALLBACK_HTTP_READ_TIMEOUT_SEC,
+            max_connections=settings.CALLBACK_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.CALLBACK_HTTP_MAX_CONNECTIONS,
+            **common,
+        ),
+    ]
+    return {config.name: create_dependency_http_client(config) for config in configs}
+
+
+APP_ROLES = ("all", "api", "worker")
+
+
+def _compile_graphs(checklist_service: ChecklistService, easy_contract_service: EasyContractService) -> None:
+    # inline 실행기를 쓰면 그래프가 필요 없으므로 langgraph 를 import 하지 않는다
+    builders = []
+    if checklist_service.executor == EXECUTOR_LANGGRAPH:
+        builders.append(checklist_graph)
+    if easy_contract_service.executor == EXECUTOR_LANGGRAPH:
+        builders.append(easy_contract_graph)
+    if not builders:
+        return
+    started = time.perf_counter()
+    for build in builders:
+        build()
+    logger.info("LangGraph 그래프 컴파일 완료", extra={"elapsed_sec": round(time.perf_counter() - started, 3)})
 
 
 async def create_container() -> AppContainer:
-    http = create_async_http_client(timeout_sec=settings.HTTP_TIMEOUT_SEC)
+    if settings.APP_ROLE not in APP_ROLES:
+        raise RuntimeError(f"APP_ROLE은 {'/'.join(APP_ROLES)} 중 하나여야 합니다: {settings.APP_ROLE!r}")
+    if settings.PIPELINE_EXECUTOR not in PIPELINE_EXECUTORS:
+        raise RuntimeError(
+            f"PIPELINE_EXECUTOR는 {'/'.join(PIPELINE_EXECUTORS)} 중 하나여야 합니다: {settings.PIPELINE_EXECUTOR!r}"
+        )
+    http_pools = _create_http_pools()
+    http = http_pools["download"]
+
+    vllm_breaker = _create_circuit_breaker("vllm")
+    ocr_breaker = _create_circuit_breaker("ocr")
+    callback_breaker = _create_circuit_breaker("callback")
 
     vllm = VLLMClient(
-        http=http,
+        http=http_pools["vllm"],
         base_url=settings.VLLM_BASE_URL,
         api_key=settings.VLLM_API_KEY,
         model=settings.VLLM_MODEL,
         retry_max_attempts=settings.EXTERNAL_RETRY_MAX_ATTEMPTS,
         retry_backoff_base_sec=settings.EXTERNAL_RETRY_BACKOFF_BASE_SEC,
+        breaker=vllm_breaker,
+        hedging=_create_hedging_policy("vllm", settings.VLLM_HEDGING_ENABLED),
+        scheduler=VLLMRequestScheduler(
+            max_in_flight=settings.VLLM_MAX_IN_FLIGHT,
+            classes={
+                PRIORITY_INTERACTIVE: PriorityClassConfig(
+                    weight=settings.VLLM_INTERACTIVE_WEIGHT,
+                    max_in_flight=settings.VLLM_INTERACTIVE_MAX_IN_FLIGHT,
+                    vllm_priority=0,
+                ),
+                PRIORITY_BATCH: PriorityClassConfig(
+                    weight=settings.VLLM_BATCH_WEIGHT,
+                    max_in_flight=settings.VLLM_BATCH_MAX_IN_FLIGHT,
+                    vllm_priority=10,
+                ),
+            },
+            default_class=PRIORITY_BATCH,
+        ),
+        send_priority=settings.VLLM_PRIORITY_FIELD_ENABLED,
+        balancer=VLLMEndpointBalancer(
+            settings.VLLM_BASE_URLS.split(",") if settings.VLLM_BASE_URLS else [settings.VLLM_BASE_URL],
+            failure_threshold=settings.VLLM_EJECT_FAILURE_THRESHOLD,
+            ejection_sec=settings.VLLM_EJECT_SEC,
+        ),
     )
 
     ocr_limiter = AsyncLimiter(1, time_period=2)
     upstage = UpstageDocumentParseClient(
-        http=http,
+        http=http_pools["ocr"],
         api_key=settings.UPSTAGE_API_KEY,
         url=settings.UPSTAGE_DOCUMENT_PARSE_URL,
         limiter=ocr_limiter,
         retry_max_attempts=settings.EXTERNAL_RETRY_MAX_ATTEMPTS,
         retry_backoff_base_sec=settings.EXTERNAL_RETRY_BACKOFF_BASE_SEC,
+        breaker=ocr_breaker,
+        saturation_wait_sec=settings.OCR_SATURATION_WAIT_SEC,
     )
 
     callback = CallbackService(
-        http=http,
+        http=http_pools["callback"],
         base_url=settings.BACKEND_CALLBACK_BASE_URL,
         token=settings.BACKEND_INTERNAL_TOKEN,
+        breaker=callback_breaker,
     )
 
-    checklist_service = ChecklistService(vllm=vllm)
-    easy_contract_service = EasyContractService(vllm=vllm, ocr=upstage)
+    budgeter = PromptBudgeter(
+        TokenCounter.load(
+            tokenizer_path=settings.TOKENIZER_PATH,
+            tiktoken_encoding=settings.TIKTOKEN_ENCODING,
+        ),
+        context_window=settings.VLLM_MAX_MODEL_LEN,
+        prompt_budget=settings.PROMPT_TOKEN_BUDGET,
+    )
+
+    redis = create_redis_client(settings.REDIS_URL) if settings.REDIS_URL else None
+
+    checkpoint_store: JobCheckpointStore | None = None
+    if settings.EASY_CONTRACT_CHECKPOINT_BACKEND == "disk":
+        checkpoint_store = LocalDiskCheckpointStore(
+            directory=settings.EASY_CONTRACT_CHECKPOINT_DIR,
+            ttl_sec=settings.EASY_CONTRACT_CHECKPOINT_TTL_SEC,
+        )
+    elif settings.EASY_CONTRACT_CHECKPOINT_BACKEND == "redis":
+        if redis is None:
+            raise RuntimeError("EASY_CONTRACT_CHECKPOINT_BACKEND=redis 설정에는 REDIS_URL이 필요합니다.")
+        checkpoint_store = RedisCheckpointStore(redis=redis, ttl_sec=settings.EASY_CONTRACT_CHECKPOINT_TTL_SEC)
+
+    job_store: JobStore
+    if settings.JOB_STORE_BACKEND == "redis":
+        if redis is None:
+            raise RuntimeError("JOB_STORE_BACKEND=redis 설정에는 REDIS_URL이 필요합니다.")
+        job_store = RedisJobStore(redis=redis, ttl_sec=settings.JOB_TTL_SEC)
+    else:
+        job_store = InMemoryJobStore(ttl_sec=settings.JOB_TTL_SEC)
+    job_service = JobService(
+        job_store,
+        max_concurrency=settings.JOB_MAX_CONCURRENCY,
+        max_pending=settings.JOB_MAX_PENDING,
+    )
+
+    cpu_executor: CpuTaskExecutor | None = None
+    if settings.CPU_POOL_ENABLED:
+        cpu_executor = CpuTaskExecutor(
+            max_workers=settings.CPU_POOL_WORKERS or os.cpu_count() or 1,
+            max_pending=settings.CPU_POOL_MAX_PENDING,
+        )
+
+    checklist_service = ChecklistService(vllm=vllm, executor=settings.PIPELINE_EXECUTOR)
+    easy_contract_service = EasyContractService(
+        vllm=vllm,
+        ocr=upstage,
+        budgeter=budgeter,
+        checkpoint_store=checkpoint_store,
+        cpu=cpu_executor,
+        executor=settings.PIPELINE_EXECUTOR,
+    )
 
     rabbitmq_client: RabbitMQClient | None = None
     rabbitmq_result_publisher: RabbitMQResultPublisher | None = None
     rabbitmq_bindings: list[QueueBinding] = []
     cancel_registry: CancelRegistry | None = None
+    idempotency_store: IdempotencyStore | None = None
+    idempotency: IdempotencyGuard | None = None
+    checklist_batcher: ChecklistBatcher | None = None
     rabbitmq_worker: RabbitMQWorker | None = None
+    prefetch_controller: AdaptivePrefetchController | None = None
 
-    if settings.RABBITMQ_ENABLED:
+    # api 역할은 HTTP 요청만 받고 메시지는 별도 워커(python -m app.workers)가 소비한다
+    if settings.RABBITMQ_ENABLED and settings.APP_ROLE != "api":
         rabbitmq_client = RabbitMQClient(
             url=settings.RABBITMQ_URL,
             prefetch_count=settings.RABBITMQ_PREFETCH_COUNT,
             declare_passive=settings.RABBITMQ_DECLARE_PASSIVE,
         )
         cancel_registry = CancelRegistry(ttl_sec=settings.EASY_CONTRACT_CANCEL_TTL_SEC)
+        CANCEL_REGISTRY_SIZE.set_function(cancel_registry.__len__)
+        if settings.IDEMPOTENCY_BACKEND == "memory":
+            idempotency_store = InMemoryIdempotencyStore(
+                ttl_sec=settings.IDEMPOTENCY_TTL_SEC,
+                max_entries=settings.IDEMPOTENCY_MAX_ENTRIES,
+            )
+        elif settings.IDEMPOTENCY_BACKEND == "redis":
+            if redis is None:
+                raise RuntimeError("IDEMPOTENCY_BACKEND=redis 설정에는 REDIS_URL이 필요합니다.")
+            idempotency_store = RedisIdempotencyStore(
+                redis=redis,
+                ttl_sec=settings.IDEMPOTENCY_TTL_SEC,
+                lock_ttl_sec=settings.IDEMPOTENCY_LOCK_TTL_SEC,
+            )
+        if idempotency_store is not None:
+            idempotency = IdempotencyGuard(idempotency_store)
         rabbitmq_result_publisher = RabbitMQResultPublisher(
             client=rabbitmq_client,
             exchange_name=settings.RABBITMQ_RESULT_EXCHANGE,
@@ -172,10 +468,24 @@ async def create_container() -> AppContainer:
             easy_contract_service=easy_contract_service,
             result_publisher=rabbitmq_result_publisher,
             cancel_registry=cancel_registry,
+            idempotency=idempotency,
         )
+        prefetch_counts: dict[str, int] = {}
+        if settings.CHECKLIST_BATCH_ENABLED:
+            checklist_batcher = ChecklistBatcher(
+                checklist_service,
+                max_batch_size=settings.CHECKLIST_BATCH_MAX_SIZE,
+                max_wait_sec=settings.CHECKLIST_BATCH_MAX_WAIT_SEC,
+            )
+            # 한 번에 배치 크기만큼 메시지를 받아야 배치가 채워진다
+            prefetch_counts[settings.RABBITMQ_REQUEST_QUEUE_CHECKLIST] = (
+                settings.CHECKLIST_BATCH_PREFETCH_COUNT or settings.CHECKLIST_BATCH_MAX_SIZE
+            )
         checklist_handler = ChecklistMessageHandler(
             checklist_service=checklist_service,
             result_publisher=rabbitmq_result_publisher,
+            idempotency=idempotency,
+            batcher=checklist_batcher,
         )
         easy_contract_cancel_handler = EasyContractCancelMessageHandler(cancel_registry=cancel_registry)
         rabbitmq_worker = RabbitMQWorker(
@@ -189,19 +499,85 @@ async def create_container() -> AppContainer:
             result_publisher=rabbitmq_result_publisher,
             retry_max_attempts=settings.WORKER_RETRY_MAX_ATTEMPTS,
             retry_backoff_base_sec=settings.WORKER_RETRY_BACKOFF_BASE_SEC,
+            prefetch_counts=prefetch_counts,
+        )
+        if vllm_breaker is not None:
+            # 시험 호출은 다운로드/OCR 이 없는 체크리스트 메시지로 한다
+            rabbitmq_worker.pause_while_open(
+                vllm_breaker,
+                [settings.RABBITMQ_REQUEST_QUEUE_CHECKLIST, settings.RABBITMQ_REQUEST_QUEUE_EASY_CONTRACT],
+            )
+        if ocr_breaker is not None:
+            rabbitmq_worker.pause_while_open(ocr_breaker, [settings.RABBITMQ_REQUEST_QUEUE_EASY_CONTRACT])
+
+        if settings.RABBITMQ_ADAPTIVE_PREFETCH_ENABLED:
+            vllm_probes = [vllm.scheduler.saturation]
+            if vllm_breaker is not None:
+                vllm_probes.append(breaker_probe(vllm_breaker))
+            ocr_probes = [upstage.saturation]
+            if ocr_breaker is not None:
+                ocr_probes.append(breaker_probe(ocr_breaker))
+            prefetch_controller = AdaptivePrefetchController(
+                client=rabbitmq_client,
+                worker=rabbitmq_worker,
+                queues=[
+                    QueueControl(
+                        queue_name=settings.RABBITMQ_REQUEST_QUEUE_EASY_CONTRACT,
+                        min_prefetch=settings.RABBITMQ_PREFETCH_MIN,
+                        max_prefetch=settings.RABBITMQ_PREFETCH_MAX,
+                        probes=vllm_probes + ocr_probes,
+                    ),
+                    QueueControl(
+                        queue_name=settings.RABBITMQ_REQUEST_QUEUE_CHECKLIST,
+                        # 배치 모드에서는 배치를 채울 만큼은 받아야 한다
+                        min_prefetch=max(
+                            settings.RABBITMQ_PREFETCH_MIN,
+                            prefetch_counts.get(settings.RABBITMQ_REQUEST_QUEUE_CHECKLIST, 0),
+                        ),
+                        max_prefetch=max(
+                            settings.RABBITMQ_PREFETCH_MAX,
+                            prefetch_counts.get(settings.RABBITMQ_REQUEST_QUEUE_CHECKLIST, 0),
+                        ),
+                        probes=vllm_probes,
+                    ),
+                ],
+                interval_sec=settings.RABBITMQ_ADAPTIVE_PREFETCH_INTERVAL_SEC,
+                target_drain_sec=settings.AUTOSCALE_TARGET_DRAIN_SEC,
+                min_replicas=settings.AUTOSCALE_MIN_REPLICAS,
+                max_replicas=settings.AUTOSCALE_MAX_REPLICAS,
+            )
+
+    loop_monitor: LoopLagMonitor | None = None
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor = LoopLagMonitor(
+            interval_sec=settings.LOOP_MONITOR_INTERVAL_SEC,
+            threshold_sec=settings.LOOP_LAG_THRESHOLD_SEC,
+            sample_interval_sec=settings.LOOP_MONITOR_SAMPLE_INTERVAL_SEC,
         )
 
     return AppContainer(
         http=http,
+        http_pools=http_pools,
         vllm=vllm,
         callback=callback,
         checklist_service=checklist_service,
         easy_contract_service=easy_contract_service,
         upstage=upstage,
+        job_service=job_service,
+        cpu_executor=cpu_executor,
+        redis=redis,
         rabbitmq_client=rabbitmq_client,
         rabbitmq_result_publisher=rabbitmq_result_publisher,
         rabbitmq_bindings=rabbitmq_bindings,
         cancel_registry=cancel_registry,
+        idempotency_store=idempotency_store,
+        circuit_breakers={
+            breaker.name: breaker for breaker in (vllm_breaker, ocr_breaker, callback_breaker) if breaker is not None
+        },
         rabbitmq_worker=rabbitmq_worker,
+        checklist_batcher=checklist_batcher,
+        prefetch_controller=prefetch_controller,
+        loop_monitor=loop_monitor,
         cancel_cleanup_interval_sec=settings.EASY_CONTRACT_CANCEL_CLEANUP_INTERVAL_SEC,
+        drain_timeout_sec=settings.WORKER_DRAIN_TIMEOUT_SEC,
     )
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import importlib
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+from app.core.metrics import CPU_POOL_QUEUED, CPU_POOL_RUNNING, CPU_TASK_SECONDS
+from app.core.tracing import start_span
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 워커 프로세스가 뜰 때 미리 import 해 첫 작업이 import 비용을 내지 않게 한다
+DEFAULT_PRELOAD_MODULES = (
+    "fitz",
+    "lxml.etree",
+    "bs4",
+    "app.utils.pdf_images",
+    "app.utils.upstage_html",
+    "app.utils.pii_redaction",
+    "app.utils.lease_contract_guard",
+    "app.resources.ocr.postprocess",
+)
+
+
+def _init_worker(modules: tuple[str, ...]) -> None:
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            logger.warning("CPU 워커 모듈 사전 로드 실패", extra={"module": name})
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class CpuTaskExecutor:
+    """PDF 렌더링/HTML 파싱/정규식 마스킹 같은 순수 CPU 작업을 프로세스 풀에서 실행한다.
+
+    max_workers 가 0 이면 풀 없이 호출한 자리에서 바로 실행한다 (기존 동작, 로컬 개발용).
+    풀에 들어간 작업 + 대기 작업이 max_workers + max_pending 을 넘으면 호출자는 자리가 날 때까지 기다린다.
+    함수와 인자는 pickle 되므로 모듈 최상위 함수만 넘길 수 있다.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        max_pending: int,
+        preload_modules: tuple[str, ...] = DEFAULT_PRELOAD_MODULES,
+    ) -> None:
+        self.max_workers = max(0, max_workers)
+        self.max_pending = max(0, max_pending)
+        self.preload_modules = preload_modules
+        self._pool: ProcessPoolExecutor | None = None
+        self._slots = asyncio.Semaphore(self.max_workers + self.max_pending) if self.max_workers else None
+        self._running = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    async def start(self) -> None:
+        if not self.enabled or self._pool is not None:
+            return
+        started = time.perf_counter()
+        self._pool = self._new_pool()
+        # 워커를 모두 띄워 두어 첫 요청이 프로세스 기동/모듈 import 를 기다리지 않게 한다
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(*(loop.run_in_executor(self._pool, _ping) for _ in range(self.max_workers)))
+        logger.info(
+            "CPU 작업 프로세스 풀 시작",
+            extra={
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "worker_pids": sorted(set(pids)),
+                "elapsed_sec": round(time.perf_counter() - started, 3),
+            },
+        )
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # 이벤트 루프/감시 스레드가 도는 프로세스를 fork 하지 않도록 spawn 을 쓴다
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.preload_modules,),
+        )
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        task_name = getattr(fn, "__name__", "task")
+        if self._pool is None or self._slots is None:
+            return fn(*args, **kwargs)
+
+        CPU_POOL_QUEUED.inc()
+        try:
+            await self._slots.acquire()
+        finally:
+            CPU_POOL_QUEUED.dec()
+        pool = self._pool
+        if pool is None:
+            # 기다리는 동안 종료되었다
+            self._slots.release()
+            return fn(*args, **kwargs)
+        started = time.perf_counter()
+        self._running += 1
+        CPU_POOL_RUNNING.inc()
+        try:
+            with start_span(f"cpu.{task_name}", attributes={"cpu.pool_workers": self.max_workers}):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(pool, functools.partial(fn, *args, **kwargs))
+        except BrokenProcessPool:
+            # 워커가 죽으면(OOM, 네이티브 라이브러리 크래시) 풀 전체가 못 쓰게 되므로 새로 만든다
+            # 같은 풀에서 실패한 다른 작업들이 풀을 또 바꾸지 않도록 아직 그 풀일 때만 교체한다
+            if self._pool is pool:
+                logger.exception("CPU 작업 프로세스 풀 손상, 재생성", extra={"task": task_name})
+                self._replace_pool()
+            raise
+        finally:
+            self._running -= 1
+            CPU_POOL_RUNNING.dec()
+            self._slots.release()
+            CPU_TASK_SECONDS.labels(task_name).observe(time.perf_counter() - started)
+
+    def _replace_pool(self) -> None:
+        broken = self._pool
+        self._pool = self._new_pool()
+        if broken is not None:
+            broken.shutdown(wait=False, cancel_futures=True)
+
+    async def aclose(self) -> None:
+        pool = self._pool
+        self._pool = None
+        if pool is None:
+            return
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+        logger.info("CPU 작업 프로세스 풀 종료")
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"max_workers": self.max_workers, "max_pending": self.max_pending, "running": self._running}
@@ -7,3 +7,10 @@ class ExternalServiceRetryExhausted(RuntimeError):
         self.attempts = attempts
         self.detail = detail
         super().__init__(f"{service} 호출 재시도 {attempts}회 실패: {detail}")
+
+
+class CircuitBreakerOpen(RuntimeError):
+    def __init__(self, *, service: str, retry_after_sec: float) -> None:
+        self.service = service
+        self.retry_after_sec = retry_after_sec
+        super().__init__(f"{service} 서비스 장애로 호출이 일시 차단되었습니다. ({retry_after_sec:.0f}초 후 재시도)")
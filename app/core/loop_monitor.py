@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import Counter
+from types import FrameType
+
+from app.core.metrics import EVENT_LOOP_LAG_SECONDS, EVENT_LOOP_STALLS_TOTAL
+
+logger = logging.getLogger(__name__)
+
+_CORRELATION_ID: contextvars.ContextVar[str | None] = contextvars.ContextVar("correlation_id", default=None)
+# 감시 스레드는 루프 스레드의 contextvar 를 직접 읽을 수 없어 태스크별로도 기록해 둔다
+_task_correlation_ids: weakref.WeakKeyDictionary[asyncio.Task, str] = weakref.WeakKeyDictionary()
+
+_STACK_LIMIT = 40
+
+
+def bind_correlation_id(correlation_id: str | None) -> None:
+    """현재 태스크(와 여기서 만들어지는 하위 태스크)가 처리 중인 작업의 correlation_id 를 기록한다."""
+    if not correlation_id:
+        return
+    _CORRELATION_ID.set(correlation_id)
+    task = asyncio.current_task()
+    if task is not None:
+        _task_correlation_ids[task] = correlation_id
+
+
+def correlation_id_for(task: asyncio.Task | None) -> str | None:
+    if task is None:
+        return None
+    correlation_id = _task_correlation_ids.get(task)
+    if correlation_id is not None:
+        return correlation_id
+    # python 3.12+ 는 태스크의 context 를 읽을 수 있어 하위 태스크(LangGraph 노드 등)도 찾는다
+    get_context = getattr(task, "get_context", None)
+    if get_context is None:
+        return None
+    return get_context().get(_CORRELATION_ID)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_filename}:{frame.f_lineno} {code.co_name}"
+
+
+class LoopLagMonitor:
+    """이벤트 루프 스케줄링 지연을 재고, 루프가 멈춘 동안 루프 스레드의 스택을 샘플링한다.
+
+    루프 쪽 태스크는 interval_sec 마다 깨어나 예정보다 늦은 만큼을 지연으로 기록한다.
+    감시 스레드는 sample_interval_sec 마다 루프가 threshold_sec 이상 늦었는지 보고, 늦었으면 루프 스레드의
+    현재 스택과 실행 중인 태스크의 correlation_id 를 모은다. 루프가 다시 돌면 모은 샘플을 한 번에 로그로 남긴다.
+    """
+
+    def __init__(self, *, interval_sec: float, threshold_sec: float, sample_interval_sec: float) -> None:
+        self.interval_sec = max(interval_sec, 0.01)
+        self.threshold_sec = max(threshold_sec, 0.001)
+        self.sample_interval_sec = max(sample_interval_sec, 0.001)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        # 루프 태스크가 다음에 깨어나야 하는 시각 (None 이면 감시하지 않음)
+        self._expected_wake: float | None = None
+        self._samples: list[str] = []
+        self._first_stack: str | None = None
+        self._stalled_task: str | None = None
+        self._stalled_correlation_id: str | None = None
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run(), name="loop-lag-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(
+            "이벤트 루프 지연 감시 시작",
+            extra={"interval_sec": self.interval_sec, "threshold_sec": self.threshold_sec},
+        )
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+        self._expected_wake = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval_sec
+            self._expected_wake = expected
+            await asyncio.sleep(self.interval_sec)
+            lag_sec = max(0.0, time.monotonic() - expected)
+            EVENT_LOOP_LAG_SECONDS.observe(lag_sec)
+            with self._lock:
+                samples, self._samples = self._samples, []
+                first_stack, self._first_stack = self._first_stack, None
+                task_name, self._stalled_task = self._stalled_task, None
+                correlation_id, self._stalled_correlation_id = self._stalled_correlation_id, None
+            if lag_sec >= self.threshold_sec:
+                EVENT_LOOP_STALLS_TOTAL.inc()
+                self._report(lag_sec, samples, first_stack, task_name, correlation_id)
+
+    def _report(
+        self,
+        lag_sec: float,
+        samples: list[str],
+        first_stack: str | None,
+        task_name: str | None,
+        correlation_id: str | None,
+    ) -> None:
+        hot_frames = Counter(samples).most_common(5)
+        logger.warning(
+            "이벤트 루프 지연 감지",
+            extra={
+                "lag_sec": round(lag_sec, 4),
+                "threshold_sec": self.threshold_sec,
+                "correlation_id": correlation_id,
+                "task": task_name,
+                "sample_count": len(samples),
+                "hot_frames": [f"{label} x{count}" for label, count in hot_frames],
+                "stack": first_stack,
+            },
+        )
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.sample_interval_sec):
+            expected = self._expected_wake
+            if expected is None or time.monotonic() - expected < self.threshold_sec:
+                continue
+            try:
+                self._sample()
+            except Exception:
+                logger.exception("이벤트 루프 스택 샘플링 실패")
+
+    def _sample(self) -> None:
+        if self._loop_thread_id is None:
+            return
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        with self._lock:
+            self._samples.append(_frame_label(frame))
+            if self._first_stack is not None:
+                return
+        # 첫 샘플만 전체 스택과 태스크 정보를 남긴다 (이후 샘플은 hot frame 집계용)
+        stack = "".join(traceback.format_stack(frame, limit=_STACK_LIMIT))
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        with self._lock:
+            self._first_stack = stack
+            self._stalled_task = task.get_name() if task is not None else None
+            self._stalled_correlation_id = correlation_id_for(task)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# 의존성별 HTTP 커넥션 풀
+HTTP_POOL_WAIT_SECONDS = Histogram(
+    "dojangkok_http_pool_wait_seconds",
+    "커넥션 풀에서 커넥션을 얻기까지 걸린 시간",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+HTTP_POOL_CONNECTIONS = Gauge(
+    "dojangkok_http_pool_connections",
+    "커넥션 풀의 커넥션 수",
+    ["pool", "state"],
+)
+HTTP_POOL_REQUESTS_IN_FLIGHT = Gauge(
+    "dojangkok_http_pool_requests_in_flight",
+    "커넥션 풀로 진행 중인 요청 수",
+    ["pool"],
+)
+HTTP_POOL_REQUEST_ERRORS = Counter(
+    "dojangkok_http_pool_request_errors_total",
+    "커넥션 풀 요청 중 전송 오류 수",
+    ["pool", "error"],
+)
+
+# RabbitMQ 워커
+WORKER_MESSAGE_SECONDS = Histogram(
+    "dojangkok_worker_message_seconds",
+    "메시지 수신부터 ack/nack 까지 걸린 시간",
+    ["queue"],
+    buckets=(0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+WORKER_MESSAGES_IN_FLIGHT = Gauge(
+    "dojangkok_worker_messages_in_flight",
+    "처리 중인 메시지 수",
+    ["queue"],
+)
+WORKER_HANDOFFS_TOTAL = Counter(
+    "dojangkok_worker_handoffs_total",
+    "드레인 시간 초과로 처리 도중 큐에 되돌린 메시지 수",
+    ["queue"],
+)
+WORKER_HANDLER_OUTCOMES = Counter(
+    "dojangkok_worker_handler_outcomes_total",
+    "핸들러 처리 결과",
+    ["handler", "outcome"],
+)
+CANCEL_REGISTRY_SIZE = Gauge(
+    "dojangkok_cancel_registry_size",
+    "취소 레지스트리에 남아 있는 쉬운 계약서 수",
+)
+
+# OCR
+OCR_PAGES_TOTAL = Counter(
+    "dojangkok_ocr_pages_total",
+    "OCR 처리한 페이지 수",
+    ["status"],
+)
+OCR_PAGE_SECONDS = Histogram(
+    "dojangkok_ocr_page_seconds",
+    "페이지 한 장의 OCR 시간 (재시도 포함)",
+    buckets=(0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0, 120.0),
+)
+OCR_LIMITER_WAIT_SECONDS = Histogram(
+    "dojangkok_ocr_limiter_wait_seconds",
+    "OCR 요청이 처리율 제한기에서 기다린 시간",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+# vLLM
+VLLM_REQUEST_SECONDS = Histogram(
+    "dojangkok_vllm_request_seconds",
+    "vLLM chat 호출 시간 (재시도 포함)",
+    ["model"],
+    buckets=(0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0, 120.0, 300.0),
+)
+VLLM_TOKENS_TOTAL = Counter(
+    "dojangkok_vllm_tokens_total",
+    "vLLM 응답 usage 기준 토큰 수",
+    ["model", "type"],
+)
+VLLM_SCHEDULER_WAIT_SECONDS = Histogram(
+    "dojangkok_vllm_scheduler_wait_seconds",
+    "vLLM 요청이 동시 실행 슬롯을 기다린 시간",
+    ["priority_class"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+# prefetch 조절 / 오토스케일 신호
+RABBITMQ_QUEUE_DEPTH = Gauge(
+    "dojangkok_rabbitmq_queue_depth",
+    "큐에 대기 중인 메시지 수 (passive declare 기준)",
+    ["queue"],
+)
+WORKER_PREFETCH = Gauge(
+    "dojangkok_worker_prefetch",
+    "현재 적용된 컨슈머 prefetch",
+    ["queue"],
+)
+AUTOSCALE_RECOMMENDED_REPLICAS = Gauge(
+    "dojangkok_autoscale_recommended_replicas",
+    "대기열을 목표 시간 안에 비우는 데 필요한 워커 레플리카 수",
+    ["queue"],
+)
+
+# 이벤트 루프 지연 (동기 CPU 작업이 루프를 막은 시간)
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "dojangkok_event_loop_lag_seconds",
+    "이벤트 루프 스케줄링 지연 (예정 시각보다 늦게 깨어난 시간)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+EVENT_LOOP_STALLS_TOTAL = Counter(
+    "dojangkok_event_loop_stalls_total",
+    "지연이 임계치를 넘은 횟수",
+)
+
+# CPU 작업 프로세스 풀
+CPU_POOL_QUEUED = Gauge(
+    "dojangkok_cpu_pool_queued",
+    "CPU 작업 풀 자리를 기다리는 작업 수 (backpressure)",
+)
+CPU_POOL_RUNNING = Gauge(
+    "dojangkok_cpu_pool_running",
+    "CPU 작업 풀에 들어가 있는 작업 수 (실행 + 풀 내부 대기)",
+)
+CPU_TASK_SECONDS = Histogram(
+    "dojangkok_cpu_task_seconds",
+    "CPU 작업 실행 시간 (pickle 전송 포함)",
+    ["task"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any
+
+from opentelemetry import context as otel_context
+from opentelemetry import propagate, trace
+from opentelemetry.propagators.textmap import Getter
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = "dojangkok"
+
+_configured = False
+
+
+def get_tracer() -> trace.Tracer:
+    return trace.get_tracer(TRACER_NAME)
+
+
+def setup_tracing(*, enabled: bool, service_name: str, endpoint: str, sample_ratio: float = 1.0) -> bool:
+    """OTLP(gRPC) exporter 로 span 을 내보내는 TracerProvider 를 전역 등록한다.
+
+    비활성이거나 SDK/exporter 가 없으면 OpenTelemetry 기본 no-op tracer 가 그대로 쓰인다.
+    """
+    global _configured
+    if not enabled or _configured:
+        return _configured
+
+    try:
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    except ImportError:
+        logger.warning("OpenTelemetry SDK/OTLP exporter 가 없어 트레이싱 비활성")
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(min(max(sample_ratio, 0.0), 1.0))),
+    )
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint, insecure=True)))
+    trace.set_tracer_provider(provider)
+    _instrument_httpx()
+    _configured = True
+    logger.info("트레이싱 설정 완료", extra={"service_name": service_name, "otlp_endpoint": endpoint})
+    return True
+
+
+def shutdown_tracing() -> None:
+    provider = trace.get_tracer_provider()
+    shutdown = getattr(provider, "shutdown", None)
+    if callable(shutdown):
+        shutdown()
+
+
+def instrument_fastapi(app: Any) -> None:
+    if not _configured:
+        return
+    try:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    except ImportError:
+        logger.warning("opentelemetry-instrumentation-fastapi 가 없어 HTTP 라우트 span 생략")
+        return
+    FastAPIInstrumentor.instrument_app(app, excluded_urls="health,metrics")
+
+
+def _instrument_httpx() -> None:
+    try:
+        from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    except ImportError:
+        logger.warning("opentelemetry-instrumentation-httpx 가 없어 HTTP 클라이언트 span 생략")
+        return
+    HTTPXClientInstrumentor().instrument()
+
+
+class _HeaderGetter(Getter[Mapping[str, Any]]):
+    # AMQP 헤더 값은 bytes 로 들어올 수 있다
+    def get(self, carrier: Mapping[str, Any], key: str) -> list[str] | None:
+        value = carrier.get(key)
+        if value is None:
+            return None
+        if isinstance(value, bytes):
+            value = value.decode("utf-8", errors="replace")
+        return [str(value)]
+
+    def keys(self, carrier: Mapping[str, Any]) -> list[str]:
+        return list(carrier.keys())
+
+
+_HEADER_GETTER = _HeaderGetter()
+
+
+def inject_headers(headers: dict[str, Any] | None = None) -> dict[str, Any]:
+    """현재 trace context(traceparent 등)를 메시지 헤더에 넣어 돌려준다."""
+    carrier: dict[str, Any] = dict(headers or {})
+    propagate.inject(carrier)
+    return carrier
+
+
+def extract_context(headers: Mapping[str, Any] | None) -> otel_context.Context:
+    return propagate.extract(headers or {}, getter=_HEADER_GETTER)
+
+
+def record_exception(span: Span, exc: BaseException) -> None:
+    span.record_exception(exc)
+    span.set_status(Status(StatusCode.ERROR, type(exc).__name__))
+
+
+@contextmanager
+def start_span(
+    name: str,
+    *,
+    kind: SpanKind = SpanKind.INTERNAL,
+    context: otel_context.Context | None = None,
+    attributes: Mapping[str, Any] | None = None,
+) -> Iterator[Span]:
+    attrs = {k: v for k, v in (attributes or {}).items() if v is not None}
+    with get_tracer().start_as_current_span(
+        name,
+        kind=kind,
+        context=context,
+        attributes=attrs,
+        record_exception=False,
+        set_status_on_exception=False,
+    ) as span:
+        try:
+            yield span
+        except BaseException as exc:
+            record_exception(span, exc)
+            raise
+
+
+def traced_node(name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    """LangGraph 노드 함수를 span 으로 감싼다 (동기/비동기 모두)."""
+    span_name = f"graph.{name}"
+
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(state: Any) -> Any:
+            with start_span(span_name, attributes={"graph.node": name}):
+                return await fn(state)
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def sync_wrapper(state: Any) -> Any:
+        with start_span(span_name, attributes={"graph.node": name}):
+            return fn(state)
+
+    return sync_wrapper
@@ -1,15 +1,26 @@
+import math
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.api.routers.checklist import router as checklist_router
 from app.api.routers.easy_contract import router as easy_contract_router
 from app.bootstrap import create_container
+from app.core.errors import CircuitBreakerOpen
+from app.core.tracing import instrument_fastapi, setup_tracing, shutdown_tracing
 from app.logging_config import setup_json_logging
+from app.settings import settings
 
 # JSON 로깅 설정 (Promtail/Loki 호환)
 setup_json_logging()
+setup_tracing(
+    enabled=settings.TRACING_ENABLED,
+    service_name=settings.OTEL_SERVICE_NAME,
+    endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT,
+    sample_ratio=settings.TRACING_SAMPLE_RATIO,
+)
 
 
 @asynccontextmanager
@@ -20,6 +31,7 @@ async def lifespan(app: FastAPI):
         yield
     finally:
         await app.state.container.aclose()
+        shutdown_tracing()
 
 
 app = FastAPI(
@@ -31,11 +43,21 @@ app = FastAPI(
 
 # Prometheus 메트릭 설정
 Instrumentator().instrument(app).expose(app, endpoint="/metrics")
+instrument_fastapi(app)
 
 app.include_router(checklist_router)
 app.include_router(easy_contract_router)
 
 
+@app.exception_handler(CircuitBreakerOpen)
+async def circuit_breaker_open_handler(request: Request, exc: CircuitBreakerOpen):
+    return JSONResponse(
+        status_code=503,
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after_sec)))},
+        content={"detail": {"error": {"code": "SERVICE_UNAVAILABLE", "message": str(exc)}}},
+    )
+
+
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
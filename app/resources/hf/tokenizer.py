@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# chat template 이 메시지마다 붙이는 role/구분 토큰 대략치
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def _estimate_tokens(text: str) -> int:
+    # 토크나이저를 못 읽었을 때의 보수적 추정: 한글/CJK 는 글자당 1토큰, 나머지는 3글자당 1토큰
+    wide = sum(1 for ch in text if ord(ch) > 0x2E7F)
+    return wide + math.ceil((len(text) - wide) / 3)
+
+
+def _load_hf_tokenizer(path: str) -> Callable[[str], int] | None:
+    target = Path(path)
+    tokenizer_json = target / "tokenizer.json" if target.is_dir() else target
+    if tokenizer_json.is_file():
+        try:
+            from tokenizers import Tokenizer
+
+            tok = Tokenizer.from_file(str(tokenizer_json))
+            return lambda text: len(tok.encode(text, add_special_tokens=False).ids)
+        except ImportError:
+            pass
+    try:
+        from transformers import AutoTokenizer
+
+        tok = AutoTokenizer.from_pretrained(path, local_files_only=True)
+        return lambda text: len(tok.encode(text, add_special_tokens=False))
+    except ImportError:
+        return None
+
+
+def _load_tiktoken(encoding_name: str) -> Callable[[str], int] | None:
+    try:
+        import tiktoken
+
+        enc = tiktoken.get_encoding(encoding_name)
+    except Exception:
+        return None
+    return lambda text: len(enc.encode(text, disallowed_special=()))
+
+
+class TokenCounter:
+    """모델 토크나이저 기반 토큰 수 계산기 (텍스트별 결과 캐시).
+
+    로컬 HF 토크나이저 -> tiktoken 인코딩 -> 글자수 기반 추정 순으로 사용한다.
+    HF 토크나이저는 로컬 파일에서만 읽는다 (tiktoken 은 TIKTOKEN_CACHE_DIR 에 미리 받아둘 것).
+    """
+
+    def __init__(
+        self,
+        count_fn: Callable[[str], int] | None = None,
+        *,
+        backend: str = "estimate",
+        cache_size: int = 2048,
+    ) -> None:
+        self.backend = backend
+        self._count_fn = count_fn or _estimate_tokens
+        self._count_cached = lru_cache(maxsize=cache_size)(self._count_uncached)
+
+    @classmethod
+    def load(cls, tokenizer_path: str = "", tiktoken_encoding: str = "", cache_size: int = 2048) -> TokenCounter:
+        if tokenizer_path:
+            try:
+                count_fn = _load_hf_tokenizer(tokenizer_path)
+            except Exception:
+                logger.exception("토크나이저 로드 실패", extra={"tokenizer_path": tokenizer_path})
+                count_fn = None
+            if count_fn is not None:
+                logger.info("토크나이저 로드 완료", extra={"backend": "hf", "tokenizer_path": tokenizer_path})
+                return cls(count_fn, backend="hf", cache_size=cache_size)
+
+        if tiktoken_encoding:
+            count_fn = _load_tiktoken(tiktoken_encoding)
+            if count_fn is not None:
+                logger.info("토크나이저 로드 완료", extra={"backend": "tiktoken", "encoding": tiktoken_encoding})
+                return cls(count_fn, backend="tiktoken", cache_size=cache_size)
+
+        logger.warning("토크나이저를 찾지 못해 글자수 기반 추정 사용")
+        return cls(backend="estimate", cache_size=cache_size)
+
+    def _count_uncached(self, text: str) -> int:
+        return self._count_fn(text)
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return self._count_cached(text)
+
+    def count_messages(self, messages: list[dict[str, str]]) -> int:
+        return sum(self.count(m.get("content") or "") + _MESSAGE_OVERHEAD_TOKENS for m in messages)
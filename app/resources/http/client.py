@@ -1,8 +1,129 @@
+from __future__ import annotations
+
+import importlib.util
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+
 import httpx
 
+from app.core.metrics import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_REQUEST_ERRORS,
+    HTTP_POOL_REQUESTS_IN_FLIGHT,
+    HTTP_POOL_WAIT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# 요청 헤더 전송 시작 = 커넥션 확보 완료 (새 커넥션이면 TCP 연결 시작 시점)
+_CONNECTION_ACQUIRED_EVENTS = {
+    "connection.connect_tcp.started",
+    "http11.send_request_headers.started",
+    "http2.send_request_headers.started",
+}
+
+
+@dataclass(frozen=True)
+class HttpPoolConfig:
+    name: str
+    read_timeout_sec: float
+    max_connections: int
+    max_keepalive_connections: int
+    connect_timeout_sec: float = 5.0
+    write_timeout_sec: float = 30.0
+    pool_timeout_sec: float = 30.0
+    keepalive_expiry_sec: float = 30.0
+    http2: bool = False
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class _ObservedStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close()
 
-def create_async_http_client(timeout_sec: float) -> httpx.AsyncClient:
+
+class InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """커넥션 대기 시간, 사용 중 커넥션 수를 풀 이름 라벨로 기록하는 transport."""
+
+    def __init__(self, pool_name: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.pool_name = pool_name
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        acquired = False
+        parent_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict) -> None:
+            nonlocal acquired
+            if not acquired and event_name in _CONNECTION_ACQUIRED_EVENTS:
+                acquired = True
+                HTTP_POOL_WAIT_SECONDS.labels(self.pool_name).observe(time.perf_counter() - started)
+            if parent_trace is not None:
+                await parent_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        HTTP_POOL_REQUESTS_IN_FLIGHT.labels(self.pool_name).inc()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException as exc:
+            if isinstance(exc, httpx.TransportError):
+                HTTP_POOL_REQUEST_ERRORS.labels(self.pool_name, exc.__class__.__name__).inc()
+            self._finish_request()
+            raise
+        # 커넥션은 응답 본문을 다 읽고 닫을 때 풀로 돌아가므로 그때 집계한다
+        response.stream = _ObservedStream(response.stream, self._finish_request)
+        return response
+
+    def _finish_request(self) -> None:
+        HTTP_POOL_REQUESTS_IN_FLIGHT.labels(self.pool_name).dec()
+        self._observe_connections()
+
+    def _observe_connections(self) -> None:
+        connections = self._pool.connections
+        idle = sum(1 for conn in connections if conn.is_idle())
+        HTTP_POOL_CONNECTIONS.labels(self.pool_name, "in_use").set(len(connections) - idle)
+        HTTP_POOL_CONNECTIONS.labels(self.pool_name, "idle").set(idle)
+
+
+def create_dependency_http_client(config: HttpPoolConfig) -> httpx.AsyncClient:
+    """의존성(vLLM, OCR, 파일 다운로드, 콜백)마다 별도 커넥션 풀을 가진 클라이언트를 만든다."""
+    http2 = config.http2
+    if http2 and not _http2_available():
+        logger.warning("h2 패키지가 없어 HTTP/1.1 로 대체", extra={"pool": config.name})
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry_sec,
+    )
+    transport = InstrumentedTransport(config.name, limits=limits, http2=http2)
     return httpx.AsyncClient(
-        timeout=httpx.Timeout(timeout_sec),
-        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        timeout=httpx.Timeout(
+            connect=config.connect_timeout_sec,
+            read=config.read_timeout_sec,
+            write=config.write_timeout_sec,
+            pool=config.pool_timeout_sec,
+        ),
+        transport=transport,
     )
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+# Upstage document-parse 요소 카테고리 중 요약에 쓸모없는 것들
+_DROP_CATEGORIES = {"footer", "figure", "chart", "index"}
+_HEADING_CATEGORIES = {"heading1", "heading2", "heading3", "header"}
+# 페이지 번호 모양("12", "3/10", "p.4")은 머리글/바닥글에서만 잡음으로 본다 (본문의 숫자 값은 유지)
+_PAGE_NUMBER_CATEGORIES = {"header", "footer"}
+_TAG_CATEGORIES = {
+    "h1": "heading1",
+    "h2": "heading2",
+    "h3": "heading3",
+    "header": "header",
+    "footer": "footer",
+    "p": "paragraph",
+    "caption": "caption",
+    "table": "table",
+    "figure": "figure",
+}
+
+_PAGE_NUMBER = re.compile(r"^[-–—\s]*(?:\d{1,3}|\d{1,3}\s*/\s*\d{1,3}|p\.?\s*\d{1,3})[-–—\s]*$", re.IGNORECASE)
+_WS = re.compile(r"\s+")
+
+RELEVANT_KEYWORDS_BY_DOC_TYPE: dict[str, tuple[str, ...]] = {
+    "contract": (
+        "특약", "보증금", "차임", "월세", "관리비", "계약금", "중도금", "잔금",
+        "임대차기간", "계약기간", "존속기간", "계약일", "위약", "해지", "해제",
+        "수선", "수리", "하자", "원상복구", "원상회복", "임대인", "임차인", "소재지",
+    ),
+    "registry": (
+        "갑구", "을구", "소유권", "소유자", "공유자", "근저당", "채권최고액", "전세권",
+        "임차권", "지상권", "가등기", "가처분", "예고등기", "가압류", "압류", "경매",
+        "신탁",
+    ),
+}
+
+
+class OcrTableCell:
+    __slots__ = ("row", "col", "text", "row_span", "col_span", "is_header")
+
+    def __init__(
+        self,
+        row: int,
+        col: int,
+        text: str,
+        row_span: int = 1,
+        col_span: int = 1,
+        is_header: bool = False,
+    ) -> None:
+        self.row = row
+        self.col = col
+        self.text = text
+        self.row_span = row_span
+        self.col_span = col_span
+        self.is_header = is_header
+
+    def __repr__(self) -> str:
+        return f"OcrTableCell(row={self.row}, col={self.col}, text={self.text!r})"
+
+
+class OcrElement:
+    __slots__ = ("id", "category", "page", "text", "bbox", "cells")
+
+    def __init__(
+        self,
+        id: int,
+        category: str,
+        page: int,
+        text: str,
+        bbox: tuple[float, float, float, float] | None = None,
+        cells: list[OcrTableCell] | None = None,
+    ) -> None:
+        self.id = id
+        self.category = category
+        self.page = page
+        self.text = text
+        self.bbox = bbox
+        self.cells = cells
+
+    @property
+    def is_heading(self) -> bool:
+        return self.category in _HEADING_CATEGORIES
+
+    @property
+    def is_table(self) -> bool:
+        return self.category == "table"
+
+    def __repr__(self) -> str:
+        return f"OcrElement(id={self.id}, category={self.category!r}, text={self.text[:20]!r})"
+
+
+class OcrPage:
+    __slots__ = ("page", "elements")
+
+    def __init__(self, page: int, elements: list[OcrElement]) -> None:
+        self.page = page
+        self.elements = elements
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+
+def _clean(text: str) -> str:
+    return _WS.sub(" ", (text or "").replace("\u00a0", " ")).strip()
+
+
+def _span(tag, attr: str) -> int:
+    try:
+        return max(1, int(tag.get(attr, 1)))
+    except (TypeError, ValueError):
+        return 1
+
+
+def _table_cells(table_tag) -> list[OcrTableCell]:
+    cells: list[OcrTableCell] = []
+    for row_idx, tr in enumerate(table_tag.find_all("tr")):
+        for col_idx, cell in enumerate(tr.find_all(["th", "td"])):
+            cells.append(
+                OcrTableCell(
+                    row=row_idx,
+                    col=col_idx,
+                    text=_clean(cell.get_text(separator=" ", strip=True)),
+                    row_span=_span(cell, "rowspan"),
+                    col_span=_span(cell, "colspan"),
+                    is_header=cell.name == "th",
+                )
+            )
+    return cells
+
+
+def _bbox(coordinates: Any) -> tuple[float, float, float, float] | None:
+    if not isinstance(coordinates, list) or not coordinates:
+        return None
+    try:
+        xs = [float(p["x"]) for p in coordinates]
+        ys = [float(p["y"]) for p in coordinates]
+    except (KeyError, TypeError, ValueError):
+        return None
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _element_from_html(
+    html: str,
+    *,
+    element_id: int,
+    category: str,
+    page: int,
+    bbox: tuple[float, float, float, float] | None,
+) -> OcrElement | None:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "lxml")
+    for img in soup.find_all("img"):
+        img.decompose()
+    for br in soup.find_all("br"):
+        br.replace_with(" ")
+
+    table = soup.find("table")
+    if category == "table" and table is not None:
+        cells = _table_cells(table)
+        text = " ".join(c.text for c in cells if c.text)
+        if not text:
+            return None
+        return OcrElement(element_id, "table", page, text, bbox, cells)
+
+    text = _clean(soup.get_text(separator=" ", strip=True))
+    if not text:
+        return None
+    return OcrElement(element_id, category, page, text, bbox)
+
+
+def _elements_from_document_html(html: str, page: int) -> list[OcrElement]:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "lxml")
+    elements: list[OcrElement] = []
+    for idx, node in enumerate(soup.find_all(list(_TAG_CATEGORIES))):
+        # table 안쪽의 p 등 중첩 노드는 바깥 노드에서 이미 처리됨
+        if node.find_parent(list(_TAG_CATEGORIES)) is not None:
+            continue
+        category = str(node.get("data-category") or _TAG_CATEGORIES[node.name])
+        element = _element_from_html(str(node), element_id=idx, category=category, page=page, bbox=None)
+        if element is not None:
+            elements.append(element)
+    return elements
+
+
+def parse_upstage_page(data: dict, page: int = 1) -> OcrPage:
+    """Upstage 응답을 요소(카테고리/좌표/표 셀) 단위 구조로 변환한다."""
+    elements: list[OcrElement] = []
+    raw_elements = data.get("elements")
+    if isinstance(raw_elements, list) and raw_elements:
+        for idx, el in enumerate(raw_elements):
+            if not isinstance(el, dict):
+                continue
+            content = el.get("content") or {}
+            html = content.get("html", "") if isinstance(content, dict) else ""
+            category = str(el.get("category") or "paragraph")
+            element_id = el.get("id", idx)
+            bbox = _bbox(el.get("coordinates"))
+            if html:
+                element = _element_from_html(
+                    html,
+                    element_id=element_id,
+                    category=category,
+                    page=page,
+                    bbox=bbox,
+                )
+            else:
+                text = _clean(content.get("text", "") if isinstance(content, dict) else "")
+                element = OcrElement(element_id, category, page, text, bbox) if text else None
+            if element is not None:
+                elements.append(element)
+        return OcrPage(page, elements)
+
+    content = data.get("content", {})
+    html = content.get("html", "") if isinstance(content, dict) else ""
+    if html:
+        elements = _elements_from_document_html(html, page)
+    return OcrPage(page, elements)
+
+
+def _is_noise(element: OcrElement) -> bool:
+    if element.category in _DROP_CATEGORIES:
+        return True
+    return element.category in _PAGE_NUMBER_CATEGORIES and bool(_PAGE_NUMBER.match(element.text))
+
+
+def _render_table(element: OcrElement) -> str:
+    rows: dict[int, list[str]] = {}
+    for cell in element.cells or []:
+        rows.setdefault(cell.row, []).append(cell.text)
+    lines = []
+    for row_idx in sorted(rows):
+        values = rows[row_idx]
+        if any(values):
+            lines.append(" | ".join(values))
+    return "\n".join(lines)
+
+
+def _render_element(element: OcrElement) -> str:
+    if element.is_table and element.cells:
+        return _render_table(element)
+    if element.is_heading:
+        return f"# {element.text}"
+    return element.text
+
+
+def render_page_text(page: OcrPage) -> str:
+    """요소 구조를 유지한 채 잡음(페이지 번호/바닥글/그림)을 뺀 압축 텍스트를 만든다."""
+    chunks = [_render_element(el) for el in page.elements if not _is_noise(el)]
+    return "\n".join(chunk for chunk in chunks if chunk)
+
+
+def _matches(text: str, keywords: tuple[str, ...]) -> bool:
+    return any(kw in text for kw in keywords)
+
+
+def render_relevant_text(page: OcrPage, doc_type: str) -> str:
+    """문서 타입별 핵심 섹션(특약, 보증금 표, 갑구/을구 등)만 골라 렌더링한다.
+
+    섹션은 제목 요소로 나누므로 키워드가 들어간 제목이 하나도 없으면(제목 없이 인식된 스캔본 등)
+    키워드 없는 조항 본문/금액/날짜를 잘라 내지 않도록 빈 문자열을 반환한다. 호출자는 전체 텍스트로 대체해야 한다.
+    """
+    keywords = RELEVANT_KEYWORDS_BY_DOC_TYPE.get(doc_type)
+    if not keywords:
+        return ""
+
+    chunks: list[str] = []
+    section_relevant = False
+    found_section = False
+    pending_heading: OcrElement | None = None
+
+    for el in page.elements:
+        if _is_noise(el):
+            continue
+        if el.is_heading:
+            section_relevant = _matches(el.text, keywords)
+            found_section = found_section or section_relevant
+            pending_heading = None if section_relevant else el
+            if section_relevant:
+                chunks.append(_render_element(el))
+            continue
+        if section_relevant or _matches(el.text, keywords):
+            if pending_heading is not None:
+                chunks.append(_render_element(pending_heading))
+                pending_heading = None
+            chunks.append(_render_element(el))
+
+    if not found_section:
+        return ""
+    return "\n".join(chunk for chunk in chunks if chunk)
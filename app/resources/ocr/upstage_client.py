@@ -1,7 +1,13 @@
+import time
+
 import httpx
 from aiolimiter import AsyncLimiter
+from opentelemetry.trace import SpanKind
 
-from app.core.errors import ExternalServiceRetryExhausted
+from app.core.errors import CircuitBreakerOpen, ExternalServiceRetryExhausted
+from app.core.metrics import OCR_LIMITER_WAIT_SECONDS, OCR_PAGE_SECONDS, OCR_PAGES_TOTAL
+from app.core.tracing import start_span
+from app.utils.circuit_breaker import CircuitBreaker, is_http_dependency_failure
 from app.utils.retry import retry_async
 
 
@@ -14,6 +20,8 @@ class UpstageDocumentParseClient:
         limiter: AsyncLimiter | None = None,
         retry_max_attempts: int = 3,
         retry_backoff_base_sec: float = 0.5,
+        breaker: CircuitBreaker | None = None,
+        saturation_wait_sec: float = 30.0,
     ):
         self.http = http
         self.api_key = api_key
@@ -21,6 +29,9 @@ class UpstageDocumentParseClient:
         self.limiter = limiter
         self.retry_max_attempts = max(1, retry_max_attempts)
         self.retry_backoff_base_sec = max(retry_backoff_base_sec, 0.0)
+        self.breaker = breaker
+        self.saturation_wait_sec = max(saturation_wait_sec, 1.0)
+        self.limiter_waiting = 0
 
     async def parse_image(self, image_bytes: bytes, filename: str = "page.png") -> dict:
         headers = {"Authorization": f"Bearer {self.api_key}"}
@@ -29,11 +40,15 @@ class UpstageDocumentParseClient:
         last_retryable_error: Exception | None = None
 
         async def _call_once() -> dict:
-            if self.limiter is None:
-                res = await self.http.post(self.url, headers=headers, files=files, data=data)
-            else:
-                async with self.limiter:
-                    res = await self.http.post(self.url, headers=headers, files=files, data=data)
+            if self.limiter is not None:
+                wait_started = time.perf_counter()
+                self.limiter_waiting += 1
+                try:
+                    await self.limiter.acquire()
+                finally:
+                    self.limiter_waiting -= 1
+                OCR_LIMITER_WAIT_SECONDS.observe(time.perf_counter() - wait_started)
+            res = await self.http.post(self.url, headers=headers, files=files, data=data)
             res.raise_for_status()
             return res.json()
 
@@ -50,22 +65,48 @@ class UpstageDocumentParseClient:
                 return retryable
             return False
 
-        try:
-            return await retry_async(
-                _call_once,
-                is_retryable=_is_retryable,
-                max_attempts=self.retry_max_attempts,
-                backoff_base_sec=self.retry_backoff_base_sec,
-            )
-        except Exception as exc:
-            retry_source = last_retryable_error or exc
-            if _is_retryable(retry_source):
-                raise ExternalServiceRetryExhausted(
-                    service="ocr",
-                    attempts=self.retry_max_attempts,
-                    detail=self._describe_error(retry_source),
-                ) from exc
-            raise
+        async def _guarded_call() -> dict:
+            if self.breaker is None:
+                return await _call_once()
+            return await self.breaker.call(_call_once, is_failure=is_http_dependency_failure)
+
+        with start_span(
+            "ocr.parse_page",
+            kind=SpanKind.CLIENT,
+            attributes={"ocr.filename": filename, "ocr.bytes": len(image_bytes)},
+        ), OCR_PAGE_SECONDS.time():
+            try:
+                result = await retry_async(
+                    _guarded_call,
+                    is_retryable=_is_retryable,
+                    max_attempts=self.retry_max_attempts,
+                    backoff_base_sec=self.retry_backoff_base_sec,
+                )
+                OCR_PAGES_TOTAL.labels("success").inc()
+                return result
+            except CircuitBreakerOpen:
+                OCR_PAGES_TOTAL.labels("rejected").inc()
+                raise
+            except Exception as exc:
+                OCR_PAGES_TOTAL.labels("failed").inc()
+                retry_source = last_retryable_error or exc
+                if _is_retryable(retry_source):
+                    raise ExternalServiceRetryExhausted(
+                        service="ocr",
+                        attempts=self.retry_max_attempts,
+                        detail=self._describe_error(retry_source),
+                    ) from exc
+                raise
+
+    def saturation(self) -> float:
+        """처리율 제한기 대기열을 비우는 데 걸릴 시간 / saturation_wait_sec (1 이상이면 OCR 이 병목).
+
+        제한이 2초당 1건이면 대기 요청이 한두 개 있는 것은 정상 상태이므로 대기 수가 아니라 예상 대기 시간으로 본다.
+        """
+        if self.limiter is None:
+            return 0.0
+        rate_per_sec = self.limiter.max_rate / self.limiter.time_period
+        return self.limiter_waiting / rate_per_sec / self.saturation_wait_sec
 
     def _describe_error(self, exc: Exception) -> str:
         if isinstance(exc, httpx.TimeoutException):
@@ -14,7 +14,9 @@ from aio_pika.abc import (
     AbstractRobustChannel,
     AbstractRobustConnection,
 )
+from opentelemetry.trace import SpanKind
 
+from app.core.tracing import inject_headers, start_span
 from app.resources.rabbitmq.codec import encode_json_message
 
 logger = logging.getLogger(__name__)
@@ -46,6 +48,10 @@ class RabbitMQClient:
         self._connection: AbstractRobustConnection | None = None
         self._channel: AbstractRobustChannel | None = None
         self._queues: dict[str, AbstractQueue] = {}
+        # prefetch 를 따로 두는 컨슈머용 채널/큐 (큐 이름 기준)
+        self._consumer_channels: dict[str, AbstractRobustChannel] = {}
+        self._consumer_queues: dict[str, AbstractQueue] = {}
+        self._consumer_prefetch: dict[str, int] = {}
 
     async def connect(self) -> None:
         if (
@@ -69,6 +75,12 @@ class RabbitMQClient:
             extra={"prefetch_count": self.prefetch_count, "declare_passive": self.declare_passive},
         )
 
+    @property
+    def is_connected(self) -> bool:
+        """브로커와 연결되어 있는지 (robust connection 이 재연결 중이면 False)."""
+        connection = self._connection
+        return connection is not None and not connection.is_closed and connection.connected.is_set()
+
     async def close(self) -> None:
         if self._connection is not None and not self._connection.is_closed:
             await self._connection.close()
@@ -99,14 +111,24 @@ class RabbitMQClient:
             },
         )
 
-    async def consume(self, queue_name: str, handler: MessageHandler) -> str:
-        queue = await self._get_or_declare_queue(queue_name)
+    async def consume(self, queue_name: str, handler: MessageHandler, *, prefetch_count: int | None = None) -> str:
+        if prefetch_count is not None:
+            queue = await self._get_or_declare_dedicated_queue(queue_name, prefetch_count)
+        else:
+            queue = await self._get_or_declare_queue(queue_name)
         consumer_tag = await queue.consume(handler, no_ack=False)
-        logger.info("래빗엠큐 컨슈머 시작", extra={"queue": queue_name, "consumer_tag": consumer_tag})
+        logger.info(
+            "래빗엠큐 컨슈머 시작",
+            extra={
+                "queue": queue_name,
+                "consumer_tag": consumer_tag,
+                "prefetch_count": prefetch_count or self.prefetch_count,
+            },
+        )
         return consumer_tag
 
     async def cancel_consumer(self, queue_name: str, consumer_tag: str) -> None:
-        queue = self._queues.get(queue_name)
+        queue = self._consumer_queues.get(queue_name) or self._queues.get(queue_name)
         if queue is None:
             queue = await self._get_or_declare_queue(queue_name)
         await queue.cancel(consumer_tag)
@@ -125,6 +147,44 @@ class RabbitMQClient:
     ) -> bool:
         payload_size = len(json.dumps(payload, ensure_ascii=False))
 
+        with start_span(
+            f"{exchange_name} publish",
+            kind=SpanKind.PRODUCER,
+            attributes={
+                "messaging.system": "rabbitmq",
+                "messaging.destination.name": exchange_name,
+                "messaging.rabbitmq.destination.routing_key": routing_key,
+                "messaging.message.id": message_id,
+                "messaging.message.conversation_id": correlation_id,
+            },
+        ) as span:
+            # 결과를 소비하는 쪽이 같은 trace 로 이어 붙일 수 있도록 context 를 헤더로 전달한다
+            headers = inject_headers(headers)
+            published = await self._publish_with_retry(
+                exchange_name=exchange_name,
+                routing_key=routing_key,
+                payload=payload,
+                payload_size=payload_size,
+                message_id=message_id,
+                correlation_id=correlation_id,
+                message_type=message_type,
+                headers=headers,
+            )
+            span.set_attribute("messaging.rabbitmq.published", published)
+            return published
+
+    async def _publish_with_retry(
+        self,
+        *,
+        exchange_name: str,
+        routing_key: str,
+        payload: dict[str, Any],
+        payload_size: int,
+        message_id: str | None,
+        correlation_id: str | None,
+        message_type: str | None,
+        headers: dict[str, Any],
+    ) -> bool:
         for attempt in range(1, self._PUBLISH_MAX_RETRIES + 1):
             try:
                 if self._channel is None or self._channel.is_closed:
@@ -210,3 +270,32 @@ class RabbitMQClient:
         )
         self._queues[queue_name] = queue
         return queue
+
+    async def _get_or_declare_dedicated_queue(self, queue_name: str, prefetch_count: int) -> AbstractQueue:
+        queue = self._consumer_queues.get(queue_name)
+        channel = self._consumer_channels.get(queue_name)
+        if queue is not None and channel is not None and not channel.is_closed:
+            if self._consumer_prefetch.get(queue_name) != prefetch_count:
+                await channel.set_qos(prefetch_count=prefetch_count)
+                self._consumer_prefetch[queue_name] = prefetch_count
+            return queue
+        if self._connection is None or self._connection.is_closed:
+            raise RuntimeError("RabbitMQ connection is not initialized. Call connect() first.")
+        channel = await self._connection.channel()
+        await channel.set_qos(prefetch_count=prefetch_count)
+        queue = await channel.declare_queue(
+            queue_name,
+            durable=True,
+            passive=self.declare_passive,
+        )
+        self._consumer_channels[queue_name] = channel
+        self._consumer_queues[queue_name] = queue
+        self._consumer_prefetch[queue_name] = prefetch_count
+        return queue
+
+    async def queue_stats(self, queue_name: str) -> tuple[int, int]:
+        """passive declare 로 (대기 메시지 수, 컨슈머 수)를 조회한다."""
+        channel = self._require_channel()
+        queue = await channel.declare_queue(queue_name, durable=True, passive=True)
+        result = queue.declaration_result
+        return int(result.message_count or 0), int(result.consumer_count or 0)
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+def create_redis_client(url: str) -> Redis:
+    from redis.asyncio import Redis
+
+    return Redis.from_url(url, decode_responses=True)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import logging
+import random
+import time
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class VLLMEndpoint:
+    __slots__ = ("base_url", "outstanding", "consecutive_failures", "ejected_until", "ejections", "loaded_models")
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.outstanding = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.ejections = 0
+        # 이 레플리카에 올라와 있다고 알려진 모델/LoRA 어댑터 이름
+        self.loaded_models: set[str] = set()
+
+    def is_available(self, now: float) -> bool:
+        return self.ejected_until <= now
+
+    def __repr__(self) -> str:
+        return f"VLLMEndpoint({self.base_url!r}, outstanding={self.outstanding})"
+
+
+class VLLMEndpointBalancer:
+    """vLLM 레플리카 목록에 대한 클라이언트 측 라우팅.
+
+    - 진행 중 요청 수 기준 power-of-two-choices
+    - 5xx/타임아웃이 연속되면 일정 시간 제외 (제외가 반복되면 제외 시간을 늘림)
+    - LoRA 어댑터 요청은 해당 어댑터를 이미 올린 레플리카를 우선 (과하게 몰리면 무시)
+    """
+
+    def __init__(
+        self,
+        base_urls: list[str],
+        *,
+        failure_threshold: int = 3,
+        ejection_sec: float = 30.0,
+        max_ejection_sec: float = 300.0,
+        affinity_slack: int = 4,
+        rng: random.Random | None = None,
+    ) -> None:
+        urls = [url.strip() for url in base_urls if url and url.strip()]
+        # 설정이 비어 있어도 기존처럼 앱은 뜰 수 있게 빈 엔드포인트 하나로 둔다
+        self.endpoints = [VLLMEndpoint(url) for url in dict.fromkeys(urls)] or [VLLMEndpoint("")]
+        self.failure_threshold = max(1, failure_threshold)
+        self.ejection_sec = max(ejection_sec, 0.0)
+        self.max_ejection_sec = max(max_ejection_sec, self.ejection_sec)
+        self.affinity_slack = max(affinity_slack, 0)
+        self._rng = rng or random.Random()
+
+    def pick(self, model: str | None = None) -> VLLMEndpoint:
+        if len(self.endpoints) == 1:
+            return self.endpoints[0]
+
+        now = time.monotonic()
+        candidates = [e for e in self.endpoints if e.is_available(now)]
+        if not candidates:
+            # 전부 제외된 상태면 가장 먼저 복귀할 레플리카로 보낸다
+            return min(self.endpoints, key=lambda e: e.ejected_until)
+
+        if model:
+            warm = [e for e in candidates if model in e.loaded_models]
+            if warm:
+                least_warm = min(e.outstanding for e in warm)
+                least_any = min(e.outstanding for e in candidates)
+                if least_warm - least_any <= self.affinity_slack:
+                    candidates = warm
+
+        if len(candidates) == 1:
+            return candidates[0]
+        first, second = self._rng.sample(candidates, 2)
+        return first if first.outstanding <= second.outstanding else second
+
+    def acquire(self, endpoint: VLLMEndpoint) -> None:
+        endpoint.outstanding += 1
+
+    def release(self, endpoint: VLLMEndpoint) -> None:
+        endpoint.outstanding = max(0, endpoint.outstanding - 1)
+
+    def record_success(self, endpoint: VLLMEndpoint, model: str | None = None) -> None:
+        endpoint.consecutive_failures = 0
+        endpoint.ejections = 0
+        if model:
+            endpoint.loaded_models.add(model)
+
+    def record_model_missing(self, endpoint: VLLMEndpoint, model: str) -> None:
+        endpoint.loaded_models.discard(model)
+
+    def record_failure(self, endpoint: VLLMEndpoint) -> None:
+        endpoint.consecutive_failures += 1
+        if len(self.endpoints) == 1 or endpoint.consecutive_failures < self.failure_threshold:
+            return
+        endpoint.ejections += 1
+        endpoint.consecutive_failures = 0
+        duration = min(self.ejection_sec * (2 ** (endpoint.ejections - 1)), self.max_ejection_sec)
+        endpoint.ejected_until = time.monotonic() + duration
+        logger.warning(
+            "vLLM 엔드포인트 일시 제외",
+            extra={"endpoint": endpoint.base_url, "ejection_sec": duration, "ejections": endpoint.ejections},
+        )
+
+    async def refresh_models(self, http: httpx.AsyncClient, api_key: str) -> None:
+        """각 레플리카의 /models 를 조회해 올라와 있는 모델/LoRA 어댑터 목록을 갱신한다."""
+        headers = {"Authorization": f"Bearer {api_key}"}
+        for endpoint in self.endpoints:
+            try:
+                res = await http.get(f"{endpoint.base_url}/models", headers=headers)
+                res.raise_for_status()
+                data = res.json().get("data") or []
+            except Exception:
+                logger.warning("vLLM 모델 목록 조회 실패", extra={"endpoint": endpoint.base_url})
+                continue
+            endpoint.loaded_models = {str(item.get("id")) for item in data if isinstance(item, dict) and item.get("id")}
+
+    def snapshot(self) -> list[dict[str, object]]:
+        now = time.monotonic()
+        return [
+            {
+                "endpoint": e.base_url,
+                "outstanding": e.outstanding,
+                "available": e.is_available(now),
+                "loaded_models": sorted(e.loaded_models),
+            }
+            for e in self.endpoints
+        ]
@@ -1,9 +1,18 @@
 import logging
+import time
 from typing import Any
 
 import httpx
-
-from app.core.errors import ExternalServiceRetryExhausted
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
+
+from app.core.errors import CircuitBreakerOpen, ExternalServiceRetryExhausted
+from app.core.metrics import VLLM_REQUEST_SECONDS, VLLM_SCHEDULER_WAIT_SECONDS, VLLM_TOKENS_TOTAL
+from app.core.tracing import start_span
+from app.resources.vllm.balancer import VLLMEndpoint, VLLMEndpointBalancer
+from app.resources.vllm.scheduler import VLLMRequestScheduler
+from app.utils.circuit_breaker import CircuitBreaker, is_http_dependency_failure
+from app.utils.hedging import HedgingPolicy
 from app.utils.retry import retry_async
 
 logger = logging.getLogger(__name__)
@@ -18,13 +27,23 @@ class VLLMClient:
         model: str,
         retry_max_attempts: int = 3,
         retry_backoff_base_sec: float = 0.5,
+        breaker: CircuitBreaker | None = None,
+        scheduler: VLLMRequestScheduler | None = None,
+        send_priority: bool = False,
+        balancer: VLLMEndpointBalancer | None = None,
+        hedging: HedgingPolicy | None = None,
     ):
         self.http = http
-        self.base_url = base_url.rstrip("/")
+        self.balancer = balancer or VLLMEndpointBalancer([base_url])
+        self.base_url = self.balancer.endpoints[0].base_url
         self.api_key = api_key
         self.model = model
         self.retry_max_attempts = max(1, retry_max_attempts)
         self.retry_backoff_base_sec = max(retry_backoff_base_sec, 0.0)
+        self.breaker = breaker
+        self.scheduler = scheduler
+        self.send_priority = send_priority and scheduler is not None
+        self.hedging = hedging
 
     async def chat(
         self,
@@ -32,8 +51,8 @@ class VLLMClient:
         temperature: float = 0.2,
         max_tokens: int = 1024,
         model: str | None = None,
+        priority_class: str | None = None,
     ) -> str:
-        url = f"{self.base_url}/chat/completions"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         requested_model = self._resolve_model(model)
         last_retryable_error: Exception | None = None
@@ -45,7 +64,44 @@ class VLLMClient:
                 "temperature": temperature,
                 "max_tokens": max_tokens,
             }
-
+            if self.send_priority:
+                payload["priority"] = self.scheduler.vllm_priority(priority_class)
+
+            # 재시도 대기 중에는 슬롯을 잡고 있지 않도록 시도마다 슬롯을 받는다
+            if self.scheduler is None:
+                return await _hedged(payload)
+            wait_started = time.perf_counter()
+            async with self.scheduler.slot(priority_class):
+                VLLM_SCHEDULER_WAIT_SECONDS.labels(priority_class or self.scheduler.default_class).observe(
+                    time.perf_counter() - wait_started
+                )
+                return await _hedged(payload)
+
+        async def _hedged(payload: dict[str, Any]) -> str:
+            # 헤지는 슬롯을 받은 뒤 HTTP 요청에만 건다 (로컬 대기열 시간이 지연 분포에 섞이지 않게,
+            # 헤지가 같은 대기열 뒤에 다시 줄 서지 않게). 헤지는 원 요청의 슬롯을 같이 쓴다.
+            if self.hedging is None:
+                return await _post(payload)
+            # 지연 분포는 출력 길이에 크게 좌우되므로 모델/max_tokens 별로 따로 본다
+            return await self.hedging.run(f"{requested_model}:{max_tokens}", lambda: _post(dict(payload)))
+
+        async def _post(payload: dict[str, Any]) -> str:
+            # 베이스 모델은 모든 레플리카에 있으므로 LoRA 어댑터 요청만 친화도를 본다
+            endpoint = self.balancer.pick(requested_model if requested_model != self.model else None)
+            self.balancer.acquire(endpoint)
+            try:
+                content = await _post_to(endpoint, payload)
+            except Exception as exc:
+                if is_http_dependency_failure(exc):
+                    self.balancer.record_failure(endpoint)
+                raise
+            finally:
+                self.balancer.release(endpoint)
+            self.balancer.record_success(endpoint, payload["model"])
+            return content
+
+        async def _post_to(endpoint: VLLMEndpoint, payload: dict[str, Any]) -> str:
+            url = f"{endpoint.base_url}/chat/completions"
             try:
                 res = await self.http.post(url, json=payload, headers=headers)
                 res.raise_for_status()
@@ -54,13 +110,29 @@ class VLLMClient:
                     raise
                 logger.warning(
                     "LoRA adapter model request failed; retrying with base model",
-                    extra={"requested_model": requested_model, "base_model": self.model},
+                    extra={
+                        "requested_model": requested_model,
+                        "base_model": self.model,
+                        "endpoint": endpoint.base_url,
+                    },
                 )
+                self.balancer.record_model_missing(endpoint, requested_model)
                 payload["model"] = self.model
                 res = await self.http.post(url, json=payload, headers=headers)
                 res.raise_for_status()
 
             data = res.json()
+            usage = data.get("usage") or {}
+            span = trace.get_current_span()
+            span.set_attribute("vllm.endpoint", endpoint.base_url)
+            span.set_attribute("gen_ai.response.model", payload["model"])
+            if usage:
+                prompt_tokens = int(usage.get("prompt_tokens") or 0)
+                completion_tokens = int(usage.get("completion_tokens") or 0)
+                span.set_attribute("gen_ai.usage.input_tokens", prompt_tokens)
+                span.set_attribute("gen_ai.usage.output_tokens", completion_tokens)
+                VLLM_TOKENS_TOTAL.labels(payload["model"], "prompt").inc(prompt_tokens)
+                VLLM_TOKENS_TOTAL.labels(payload["model"], "completion").inc(completion_tokens)
             return data["choices"][0]["message"]["content"]
 
         def _is_retryable(exc: Exception) -> bool:
@@ -76,22 +148,41 @@ class VLLMClient:
                 return retryable
             return False
 
-        try:
-            return await retry_async(
-                _call_once,
-                is_retryable=_is_retryable,
-                max_attempts=self.retry_max_attempts,
-                backoff_base_sec=self.retry_backoff_base_sec,
-            )
-        except Exception as exc:
-            retry_source = last_retryable_error or exc
-            if _is_retryable(retry_source):
-                raise ExternalServiceRetryExhausted(
-                    service="vllm",
-                    attempts=self.retry_max_attempts,
-                    detail=self._describe_error(retry_source),
-                ) from exc
-            raise
+        async def _guarded_call() -> str:
+            if self.breaker is None:
+                return await _call_once()
+            return await self.breaker.call(_call_once, is_failure=is_http_dependency_failure)
+
+        with start_span(
+            "vllm.chat",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "gen_ai.request.model": requested_model,
+                "gen_ai.request.max_tokens": max_tokens,
+                "vllm.priority_class": priority_class,
+            },
+        ), VLLM_REQUEST_SECONDS.labels(requested_model).time():
+            try:
+                return await retry_async(
+                    _guarded_call,
+                    is_retryable=_is_retryable,
+                    max_attempts=self.retry_max_attempts,
+                    backoff_base_sec=self.retry_backoff_base_sec,
+                )
+            except CircuitBreakerOpen:
+                raise
+            except Exception as exc:
+                retry_source = last_retryable_error or exc
+                if _is_retryable(retry_source):
+                    raise ExternalServiceRetryExhausted(
+                        service="vllm",
+                        attempts=self.retry_max_attempts,
+                        detail=self._describe_error(retry_source),
+                    ) from exc
+                raise
+
+    async def refresh_endpoint_models(self) -> None:
+        await self.balancer.refresh_models(self.http, self.api_key)
 
     def _resolve_model(self, model: str | None) -> str:
         if model is None:
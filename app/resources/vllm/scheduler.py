@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BATCH = "batch"
+
+
+@dataclass(frozen=True)
+class PriorityClassConfig:
+    # 대기열 경쟁 시 가중치 (클수록 더 자주 선택)
+    weight: int
+    # 이 클래스가 동시에 점유할 수 있는 최대 요청 수 (0 이면 전체 한도만 적용)
+    max_in_flight: int = 0
+    # vLLM --scheduling-policy priority 용 값 (작을수록 먼저 처리)
+    vllm_priority: int = 0
+
+
+class _ClassState:
+    __slots__ = ("config", "waiters", "in_flight", "virtual_time")
+
+    def __init__(self, config: PriorityClassConfig) -> None:
+        self.config = config
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.in_flight = 0
+        self.virtual_time = 0.0
+
+
+class VLLMRequestScheduler:
+    """호출 클래스(interactive/batch)별 가중 공정 큐로 vLLM 동시 요청 슬롯을 배분한다.
+
+    대기 중인 클래스 중 가상 시간(처리한 요청 수 / 가중치)이 가장 작은 쪽에 다음 슬롯을 준다.
+    """
+
+    def __init__(self, *, max_in_flight: int, classes: dict[str, PriorityClassConfig], default_class: str) -> None:
+        if default_class not in classes:
+            raise ValueError(f"기본 우선순위 클래스가 정의되지 않았습니다: {default_class}")
+        self.max_in_flight = max(1, max_in_flight)
+        self.default_class = default_class
+        self._classes = {name: _ClassState(config) for name, config in classes.items()}
+        self._in_flight = 0
+
+    def _state(self, priority_class: str | None) -> _ClassState:
+        state = self._classes.get(priority_class or self.default_class)
+        return state if state is not None else self._classes[self.default_class]
+
+    def vllm_priority(self, priority_class: str | None) -> int:
+        return self._state(priority_class).config.vllm_priority
+
+    def _has_capacity(self, state: _ClassState) -> bool:
+        if self._in_flight >= self.max_in_flight:
+            return False
+        limit = state.config.max_in_flight
+        return limit <= 0 or state.in_flight < limit
+
+    def _wake(self, state: _ClassState) -> None:
+        # 오래 쉬던 클래스가 밀린 몫을 한꺼번에 가져가지 않도록 가상 시간을 활성 클래스 최소값으로 당긴다
+        active = [s.virtual_time for s in self._classes.values() if s is not state and (s.waiters or s.in_flight)]
+        if active:
+            state.virtual_time = max(state.virtual_time, min(active))
+
+    def _start(self, state: _ClassState) -> None:
+        state.virtual_time += 1.0 / max(state.config.weight, 1)
+        state.in_flight += 1
+        self._in_flight += 1
+
+    def _dispatch(self) -> None:
+        while self._in_flight < self.max_in_flight:
+            candidates = [s for s in self._classes.values() if s.waiters and self._has_capacity(s)]
+            if not candidates:
+                return
+            state = min(candidates, key=lambda s: s.virtual_time)
+            waiter = state.waiters.popleft()
+            if waiter.done():
+                continue
+            self._start(state)
+            waiter.set_result(None)
+
+    async def acquire(self, priority_class: str | None = None) -> None:
+        state = self._state(priority_class)
+        if not state.waiters and not state.in_flight:
+            self._wake(state)
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 돌려준다
+                self._release(state)
+            else:
+                try:
+                    state.waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def _release(self, state: _ClassState) -> None:
+        state.in_flight -= 1
+        self._in_flight -= 1
+        self._dispatch()
+
+    def release(self, priority_class: str | None = None) -> None:
+        self._release(self._state(priority_class))
+
+    @asynccontextmanager
+    async def slot(self, priority_class: str | None = None) -> AsyncIterator[None]:
+        await self.acquire(priority_class)
+        try:
+            yield
+        finally:
+            self.release(priority_class)
+
+    def saturation(self) -> float:
+        """(실행 중 + 대기 중) / 전체 슬롯. 1 이상이면 새 요청은 슬롯을 기다린다."""
+        waiting = sum(len(state.waiters) for state in self._classes.values())
+        return (self._in_flight + waiting) / self.max_in_flight
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        return {
+            name: {"in_flight": state.in_flight, "waiting": len(state.waiters)}
+            for name, state in self._classes.items()
+        }
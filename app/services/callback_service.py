@@ -3,14 +3,27 @@ from typing import Any
 
 import httpx
 
+from app.utils.circuit_breaker import CircuitBreaker, is_http_dependency_failure
+
 logger = logging.getLogger(__name__)
 
 
 class CallbackService:
-    def __init__(self, http: httpx.AsyncClient, base_url: str, token: str):
+    def __init__(self, http: httpx.AsyncClient, base_url: str, token: str, breaker: CircuitBreaker | None = None):
         self.http = http
         self.base_url = base_url.rstrip("/")
         self.token = token
+        self.breaker = breaker
+
+    async def _post(self, url: str, **kwargs: Any) -> httpx.Response:
+        async def _call_once() -> httpx.Response:
+            res = await self.http.post(url, **kwargs)
+            res.raise_for_status()
+            return res
+
+        if self.breaker is None:
+            return await _call_once()
+        return await self.breaker.call(_call_once, is_failure=is_http_dependency_failure)
 
     async def post_checklist_complete(self, case_id: str, payload: dict[str, Any]) -> None:
         logger.info("체크리스트 콜백 시작", extra={"case_id": case_id})
@@ -20,8 +33,7 @@ class CallbackService:
             headers["Authorization"] = f"Bearer {self.token}"
         logger.info("체크리스트 콜백 전송", extra={"case_id": case_id, "payload": payload})
 
-        res = await self.http.post(url, json=payload, headers=headers)
-        res.raise_for_status()
+        await self._post(url, json=payload, headers=headers)
         logger.info("체크리스트 콜백 성공", extra={"case_id": case_id})
 
     async def post_easy_contract_markdown(self, case_id: int, markdown: str) -> None:
@@ -30,8 +42,7 @@ class CallbackService:
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
 
-        res = await self.http.post(url, content=markdown.encode("utf-8"), headers=headers)
-        res.raise_for_status()
+        await self._post(url, content=markdown.encode("utf-8"), headers=headers)
 
     async def post_easy_contract_error(self, case_id: int, code: str, message: str) -> None:
         url = f"{self.base_url}/internal/callbacks/easy-contracts/{case_id}/complete"
@@ -40,5 +51,4 @@ class CallbackService:
             headers["Authorization"] = f"Bearer {self.token}"
 
         payload = {"error": {"code": code, "message": message}}
-        res = await self.http.post(url, json=payload, headers=headers)
-        res.raise_for_status()
\ No newline at end of file
+        await self._post(url, json=payload, headers=headers)
\ No newline at end of file
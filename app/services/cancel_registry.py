@@ -8,6 +8,9 @@ class CancelRegistry:
         self._ttl_sec = ttl_sec
         self._expiry_by_easy_contract_id: dict[int, float] = {}
 
+    def __len__(self) -> int:
+        return len(self._expiry_by_easy_contract_id)
+
     def mark_cancelled(self, easy_contract_id: int) -> None:
         if easy_contract_id < 0:
             return
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from app.services.checklist_service import ChecklistService
+
+logger = logging.getLogger(__name__)
+
+
+class ChecklistBatcher:
+    """짧은 시간 창 안에 들어온 체크리스트 요청을 모아 generate_many 한 번으로 처리한다.
+
+    max_batch_size 개가 모이거나 첫 요청 후 max_wait_sec 이 지나면 배치를 실행한다.
+    각 호출자는 자기 요청의 결과(또는 예외)만 받으므로 메시지별 ack/결과 발행은 기존 흐름을 그대로 따른다.
+    """
+
+    def __init__(self, service: ChecklistService, *, max_batch_size: int, max_wait_sec: float) -> None:
+        self.service = service
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_sec = max(max_wait_sec, 0.0)
+        self._pending: list[tuple[int | str, list[str], asyncio.Future[list[str]]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def generate(self, *, template_id: int | str, keywords: list[str]) -> list[str]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[str]] = loop.create_future()
+        self._pending.append((template_id, keywords, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_sec, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[int | str, list[str], asyncio.Future[list[str]]]]) -> None:
+        # 기다리던 쪽이 이미 취소된 요청은 모델에 보내지 않는다
+        batch = [item for item in batch if not item[2].done()]
+        if not batch:
+            return
+        try:
+            results = await self.service.generate_many(
+                [keywords for _, keywords, _ in batch],
+                template_ids=[template_id for template_id, _, _ in batch],
+                return_exceptions=True,
+            )
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        except Exception as exc:
+            logger.exception("체크리스트 배치 처리 실패", extra={"batch_size": len(batch)})
+            results = [exc] * len(batch)
+
+        for (_, _, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, asyncio.CancelledError):
+                future.cancel()
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def aclose(self) -> None:
+        self._flush()
+        tasks = list(self._tasks)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import logging
 import re
-from typing import TypedDict
-
-from langgraph.graph import END, StateGraph
-
-logger = logging.getLogger(__name__)
+from collections.abc import Callable
+from typing import Any, TypedDict
 
 from app.resources.rabbitmq.codec import now_utc_iso
 from app.resources.vllm.client import VLLMClient
+from app.resources.vllm.scheduler import PRIORITY_INTERACTIVE
+from app.services.pipeline import EXECUTOR_INLINE, EXECUTOR_LANGGRAPH, PipelineState
+from app.services.prompt_templates import PromptTemplate, register_prompt_template
 from app.settings import settings
 
+logger = logging.getLogger(__name__)
 
 COMMON_CHECKLIST: list[str] = [
     "보증금이 주변 시세 대비 과도하지 않은지 확인하세요.",
@@ -39,6 +42,7 @@ COMMON_CHECKLIST: list[str] = [
 
 
 class ChecklistState(TypedDict, total=False):
+    service: ChecklistService
     template_id: int | str
     keywords: list[str]
     checklists: list[str]
@@ -60,50 +64,53 @@ def _normalize_keywords(keywords: list[str]) -> list[str]:
     return out
 
 
-def _build_prompt(keywords: list[str], common: list[str]) -> list[dict[str, str]]:
-    system = (
-        "너는 주택임대차계약을 보조하는 전문 AI다.\n"
-        "입력으로 공통 체크리스트와 사용자 라이프스타일 키워드가 함께 주어진다.\n\n"
-
-        "공통 체크리스트는 '참고 자료'일 뿐이며 그대로 복사하지 마라.\n"
-        "사용자 키워드에 맞춘 체크리스트와, 키워드와 무관한 공통 체크리스트를 함께 생성한다.\n"
-        "최종 출력은 두 종류 항목이 섞인 하나의 리스트여야 한다.\n\n"
-
-        "[출력 규칙]\n"
-        '1. 출력은 JSON 배열(list) 형태로 ["문장1", "문장2"]만 출력한다.\n'
-        "2. JSON 배열 외의 설명, 문장, 코드블록, ```json 표시는 절대 출력하지 마라.\n"
-        "3. 각 항목은 하나의 완결된 문장으로 작성한다.\n"
-        "4. 모든 문장은 반드시 '확인하세요.'로 끝나야 한다.\n"
-        "5. 의미가 같은 항목은 하나로 통합하고 중복을 제거하라.\n\n"
-
-        "[작성 방식]\n"
-        "- 공통 체크리스트 문장을 그대로 복사하지 마라.\n"
-        "- 사용자 키워드를 중심으로 내용을 확장하고 보강하라.\n"
-        "- 공통과 키워드 항목이 자연스럽게 섞이도록 구성하라.\n"
-        "- 형식적인 나열이 아니라 실제 계약 상황에서 유용한 점검 항목처럼 작성하라.\n\n"
-
-        "[공통 체크리스트]\n"
-        "- " + "\n- ".join(common) + "\n\n"
+CHECKLIST_TEMPLATE = register_prompt_template(
+    PromptTemplate(
+        name="checklist.generate",
+        system=(
+            "너는 주택임대차계약을 보조하는 전문 AI다.\n"
+            "입력으로 공통 체크리스트와 사용자 라이프스타일 키워드가 함께 주어진다.\n\n"
+
+            "공통 체크리스트는 '참고 자료'일 뿐이며 그대로 복사하지 마라.\n"
+            "사용자 키워드에 맞춘 체크리스트와, 키워드와 무관한 공통 체크리스트를 함께 생성한다.\n"
+            "최종 출력은 두 종류 항목이 섞인 하나의 리스트여야 한다.\n\n"
+
+            "[출력 규칙]\n"
+            '1. 출력은 JSON 배열(list) 형태로 ["문장1", "문장2"]만 출력한다.\n'
+            "2. JSON 배열 외의 설명, 문장, 코드블록, ```json 표시는 절대 출력하지 마라.\n"
+            "3. 각 항목은 하나의 완결된 문장으로 작성한다.\n"
+            "4. 모든 문장은 반드시 '확인하세요.'로 끝나야 한다.\n"
+            "5. 의미가 같은 항목은 하나로 통합하고 중복을 제거하라.\n\n"
+
+            "[작성 방식]\n"
+            "- 공통 체크리스트 문장을 그대로 복사하지 마라.\n"
+            "- 사용자 키워드를 중심으로 내용을 확장하고 보강하라.\n"
+            "- 공통과 키워드 항목이 자연스럽게 섞이도록 구성하라.\n"
+            "- 형식적인 나열이 아니라 실제 계약 상황에서 유용한 점검 항목처럼 작성하라.\n\n"
+
+            "[공통 체크리스트]\n"
+            "- " + "\n- ".join(COMMON_CHECKLIST) + "\n\n"
+        ),
+        instruction=(
+            "사용자 키워드에서 주택임대차계약과 관련되지 않은 단어는 제외해라.\n"
+            "아래 사용자 키워드를 바탕으로 공통체크리스트와 중복되지 않도록 계약에 대한 체크리스트를 생성하라.\n"
+            "하나의 키워드에 대해 최대 3개의 항목을 생성하라. 같은 키워드에 대한 항목은 연달아 나열한다.\n"
+            "공통 항목은 약 10개 생성한다.\n"
+            "공통 항목은 '모든 임대차 계약자에게 공통'인 내용만 작성한다.\n"
+            "공통 항목에는 사용자 키워드의 단어(또는 유사어)를 포함하지 마라.\n"
+            "체크리스트 전체 항목은 공통 항목과 키워드에 대한 항목을 합쳐서 약 20개이다.\n"
+            "공통 항목은 키워드와 무관한 내용이어야한다. 공통체크리스트의 일부를 이용하여 일반적으로 주택 임대차 계약을 하는 모든 사람에게 해당하는 내용으로 생성한다.\n\n"
+        ),
     )
+)
+
 
-    user = (
+def _build_prompt(keywords: list[str]) -> list[dict[str, str]]:
+    return CHECKLIST_TEMPLATE.render(
         "[사용자 키워드]\n"
-        "- " + "\n- ".join(keywords) + "\n\n"
-        "사용자 키워드에서 주택임대차계약과 관련되지 않은 단어는 제외해라.\n"
-        "위 정보를 바탕으로 공통체크리스트와 중복되지 않도록 계약에 대한 체크리스트를 생성하라.\n"
-        "하나의 키워드에 대해 최대 3개의 항목을 생성하라. 같은 키워드에 대한 항목은 연달아 나열한다.\n"
-        "공통 항목은 약 10개 생성한다.\n"
-        "공통 항목은 '모든 임대차 계약자에게 공통'인 내용만 작성한다.\n"
-        "공통 항목에는 사용자 키워드의 단어(또는 유사어)를 포함하지 마라.\n"
-        "체크리스트 전체 항목은 공통 항목과 키워드에 대한 항목을 합쳐서 약 20개이다.\n"
-        "공통 항목은 키워드와 무관한 내용이어야한다. 공통체크리스트의 일부를 이용하여 일반적으로 주택 임대차 계약을 하는 모든 사람에게 해당하는 내용으로 생성한다."
+        "- " + "\n- ".join(keywords) + "\n"
     )
 
-    return [
-        {"role": "system", "content": system},
-        {"role": "user", "content": user},
-    ]
-
 _BAD_TOKENS = {"", "[", "]"}
 
 def _clean_item(s: str) -> str:
@@ -144,76 +151,23 @@ def _parse_model_output(text: str) -> list[str]:
     return out
 
 
+class ChecklistJob(PipelineState):
+    """inline 실행기용 작업 상태 (ChecklistState 와 같은 키)."""
+
+    __slots__ = ("service", "template_id", "keywords", "checklists")
+
+
 class ChecklistService:
-    def __init__(self, vllm: VLLMClient):
+    def __init__(self, vllm: VLLMClient, executor: str = EXECUTOR_LANGGRAPH):
         self.vllm = vllm
-        self.graph = self._build_graph()
-
-    def _build_graph(self):
-        g = StateGraph(ChecklistState)
-
-        def start(state: ChecklistState) -> ChecklistState:
-            state["keywords"] = _normalize_keywords(state.get("keywords", []))
-            return state
-
-        def route(state: ChecklistState) -> str:
-            return "no_keywords" if len(state.get("keywords", [])) == 0 else "with_keywords"
-
-        def no_keywords(state: ChecklistState) -> ChecklistState:
-            state["checklists"] = COMMON_CHECKLIST
-            return state
-
-        async def with_keywords(state: ChecklistState) -> ChecklistState:
-            msgs = _build_prompt(state["keywords"], COMMON_CHECKLIST)
-            logger.info(
-                "체크리스트 생성 모델 요청",
-                extra={"template_id": state.get("template_id"), "event_time": now_utc_iso()},
-            )
-            content = await self.vllm.chat(
-                msgs,
-                temperature=0.2,
-                max_tokens=1024,
-                model=settings.VLLM_LORA_ADAPTER_CHECKLIST,
-            )
-            logger.info(
-                "체크리스트 생성 모델 응답",
-                extra={
-                    "template_id": state.get("template_id"),
-                    "content_length": len(content),
-                    "event_time": now_utc_iso(),
-                },
-            )
-            items = _parse_model_output(content)
-
-            merged = []
-            seen = set()
-            for x in items + COMMON_CHECKLIST:
-                x2 = _clean_item(x)
-                if x2 and x2 not in seen:
-                    seen.add(x2)
-                    merged.append(x2)
-
-            if not merged:
-                merged = COMMON_CHECKLIST[:]
-
-            state["checklists"] = merged[:30]
-            return state
-
-        g.add_node("start", start)
-        g.add_node("no_keywords", no_keywords)
-        g.add_node("with_keywords", with_keywords)
-
-        g.set_entry_point("start")
-        g.add_conditional_edges(
-            "start", route, {"no_keywords": "no_keywords", "with_keywords": "with_keywords"}
-        )
-        g.add_edge("no_keywords", END)
-        g.add_edge("with_keywords", END)
+        self.executor = executor
 
-        return g.compile()
+    @property
+    def graph(self) -> Any:
+        return checklist_graph()
 
     async def generate(self, template_id: int | str, keywords: list[str]) -> list[str]:
-        out = await self.graph.ainvoke({"template_id": template_id, "keywords": keywords})
+        out = await self._invoke({"service": self, "template_id": template_id, "keywords": keywords})
         logger.info(
             "체크리스트 생성 완료",
             extra={
@@ -223,3 +177,134 @@ class ChecklistService:
             },
         )
         return out.get("checklists", COMMON_CHECKLIST)
+
+    async def _invoke(self, state: ChecklistState) -> dict[str, Any]:
+        if self.executor == EXECUTOR_INLINE:
+            job = await _run_inline(ChecklistJob(**state))
+            return job.to_dict()
+        return await self.graph.ainvoke(state)
+
+    async def generate_many(
+        self,
+        keyword_sets: list[list[str]],
+        *,
+        template_ids: list[int | str] | None = None,
+        return_exceptions: bool = False,
+    ) -> list[list[str] | BaseException]:
+        """여러 키워드 묶음을 한 번에 생성한다. 정규화 후 같은 키워드 집합은 한 번만 모델에 요청한다."""
+        if template_ids is None:
+            template_ids = [-1] * len(keyword_sets)
+
+        unique: dict[tuple[str, ...], int] = {}
+        unique_requests: list[tuple[int | str, list[str]]] = []
+        slots: list[int] = []
+        for template_id, keywords in zip(template_ids, keyword_sets, strict=True):
+            normalized = _normalize_keywords(keywords)
+            key = tuple(sorted(normalized))
+            slot = unique.get(key)
+            if slot is None:
+                slot = unique[key] = len(unique_requests)
+                unique_requests.append((template_id, normalized))
+            slots.append(slot)
+
+        logger.info(
+            "체크리스트 배치 생성 시작",
+            extra={"count": len(keyword_sets), "unique_count": len(unique_requests), "event_time": now_utc_iso()},
+        )
+        results = await asyncio.gather(
+            *(self.generate(template_id=template_id, keywords=keywords) for template_id, keywords in unique_requests),
+            return_exceptions=return_exceptions,
+        )
+        # 중복 요청끼리 같은 리스트 객체를 공유하지 않도록 복사해서 돌려준다
+        return [list(results[slot]) if isinstance(results[slot], list) else results[slot] for slot in slots]
+
+
+@functools.cache
+def checklist_graph() -> Any:
+    """컴파일된 체크리스트 그래프. 프로세스마다 처음 쓸 때 한 번만 만들고 모든 서비스 인스턴스가 같이 쓴다."""
+    return _build_graph()
+
+
+def _build_graph() -> Any:
+    # 기동 시 import 비용을 피하려고 그래프를 처음 만들 때 불러온다
+    from langgraph.graph import END, StateGraph
+
+    nodes = _checklist_nodes()
+    g = StateGraph(ChecklistState)
+    g.add_node("start", nodes["start"])
+    g.add_node("no_keywords", nodes["no_keywords"])
+    g.add_node("with_keywords", nodes["with_keywords"])
+
+    g.set_entry_point("start")
+    g.add_conditional_edges(
+        "start", nodes["route"], {"no_keywords": "no_keywords", "with_keywords": "with_keywords"}
+    )
+    g.add_edge("no_keywords", END)
+    g.add_edge("with_keywords", END)
+
+    return g.compile()
+
+
+async def _run_inline(job: ChecklistJob) -> ChecklistJob:
+    """_build_graph 와 같은 순서로 노드를 직접 호출한다 (inline 실행기)."""
+    nodes = _checklist_nodes()
+    job.apply(nodes["start"](job))
+    if nodes["route"](job) == "no_keywords":
+        job.apply(nodes["no_keywords"](job))
+    else:
+        job.apply(await nodes["with_keywords"](job))
+    return job
+
+
+@functools.cache
+def _checklist_nodes() -> dict[str, Callable[..., Any]]:
+    def start(state: ChecklistState) -> ChecklistState:
+        state["keywords"] = _normalize_keywords(state.get("keywords", []))
+        return state
+
+    def route(state: ChecklistState) -> str:
+        return "no_keywords" if len(state.get("keywords", [])) == 0 else "with_keywords"
+
+    def no_keywords(state: ChecklistState) -> ChecklistState:
+        state["checklists"] = COMMON_CHECKLIST
+        return state
+
+    async def with_keywords(state: ChecklistState) -> ChecklistState:
+        service = state["service"]
+        msgs = _build_prompt(state["keywords"])
+        logger.info(
+            "체크리스트 생성 모델 요청",
+            extra={"template_id": state.get("template_id"), "event_time": now_utc_iso()},
+        )
+        content = await service.vllm.chat(
+            msgs,
+            temperature=0.2,
+            max_tokens=1024,
+            model=settings.VLLM_LORA_ADAPTER_CHECKLIST,
+            priority_class=PRIORITY_INTERACTIVE,
+        )
+        logger.info(
+            "체크리스트 생성 모델 응답",
+            extra={
+                "template_id": state.get("template_id"),
+                "content_length": len(content),
+                "event_time": now_utc_iso(),
+            },
+        )
+        items = _parse_model_output(content)
+
+        merged = []
+        seen = set()
+        for x in items + COMMON_CHECKLIST:
+            x2 = _clean_item(x)
+            if x2 and x2 not in seen:
+                seen.add(x2)
+                merged.append(x2)
+
+        if not merged:
+            merged = COMMON_CHECKLIST[:]
+
+        state["checklists"] = merged[:30]
+        return state
+
+    return {"start": start, "route": route, "no_keywords": no_keywords, "with_keywords": with_keywords}
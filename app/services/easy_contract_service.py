@@ -1,17 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import re
 from collections.abc import Callable
 from typing import Annotated, Any, TypedDict
 
-from langgraph.graph import END, StateGraph
-
+from app.core.cpu_executor import CpuTaskExecutor
+from app.core.loop_monitor import bind_correlation_id
+from app.core.tracing import start_span, traced_node
+from app.resources.hf.tokenizer import TokenCounter
+from app.resources.ocr.postprocess import parse_upstage_page, render_page_text, render_relevant_text
 from app.resources.ocr.upstage_client import UpstageDocumentParseClient
 from app.resources.rabbitmq.codec import now_utc_iso
 from app.resources.vllm.client import VLLMClient
+from app.resources.vllm.scheduler import PRIORITY_BATCH
+from app.services.job_checkpoint import JobCheckpoint, JobCheckpointStore, fingerprint_docs
+from app.services.pipeline import EXECUTOR_INLINE, EXECUTOR_LANGGRAPH, PipelineState, run_parallel
+from app.services.prompt_templates import PromptTemplate, register_prompt_template
 from app.settings import settings
-from app.utils.lease_contract_guard import check_is_lease_contract
+from app.utils.lease_contract_guard import LeaseGuardResult, check_is_lease_contract
 from app.utils.pii_redaction import redact_phone_and_account
+from app.utils.prompt_budget import PromptBudgeter
 from app.utils.upstage_html import extract_plain_text_from_upstage_json
 
 logger = logging.getLogger(__name__)
@@ -21,6 +32,11 @@ OCR_PAGE_LIMITS_BY_DOC_TYPE: dict[str, int] = {
     "registry": 5,
 }
 
+SUMMARY_MAX_TOKENS = 1024
+SECTION_REDUCE_MAX_TOKENS = 768
+FINAL_MAX_TOKENS = 2048
+REGISTRY_HEAD_RATIO = 0.65
+
 
 class EasyContractCancelled(Exception):
     pass
@@ -39,15 +55,18 @@ def list_concat(left: Any, right: Any):
 
 
 class EasyContractState(TypedDict, total=False):
+    # 노드가 쓰는 클라이언트(vllm/ocr/budgeter). 그래프는 프로세스에 하나라 서비스는 상태로 넘긴다
+    service: EasyContractService
     easy_contract_id: int
     correlation_id: str
     is_cancelled: Callable[[int], bool]
+    checkpoint: JobCheckpoint | None
 
     # 입력 파일들(각각 bytes + doc_type)
     docs: list[dict[str, Any]]  # {"filename": str, "bytes": bytes, "doc_type": str}
 
-    # OCR 결과
-    pages_text: list[dict[str, Any]]  # {"doc_type","file","page","text"}
+    # OCR 결과 (focus_text: 문서 타입별 핵심 섹션만 추린 텍스트, 없으면 "")
+    pages_text: list[dict[str, Any]]  # {"doc_type","file","page","text","focus_text"}
 
     # 문서 종류별 요약 결과
     contract_page_summaries: Annotated[list[dict[str, Any]], list_concat]
@@ -60,80 +79,304 @@ class EasyContractState(TypedDict, total=False):
     markdown: str
 
 
+class EasyContractJob(PipelineState):
+    """inline 실행기용 작업 상태 (EasyContractState 와 같은 키)."""
+
+    __slots__ = (
+        "service",
+        "easy_contract_id",
+        "correlation_id",
+        "is_cancelled",
+        "checkpoint",
+        "docs",
+        "pages_text",
+        "contract_page_summaries",
+        "registry_summaries",
+        "page_summaries",
+        "markdown",
+    )
+    _concat_keys = frozenset({"contract_page_summaries", "registry_summaries", "page_summaries"})
+
+
 def _normalize_doc_type(doc_type: Any) -> str:
     normalized = str(doc_type or "").strip().lower()
     return normalized or "contract"
 
 
-def _page_summary_prompt(doc_type: str, page_no: int, text: str) -> list[dict[str, str]]:
-    system = (
-        "너는 주택 임대차 문서를 페이지 단위로 읽고 핵심 정보를 추출하는 도우미다.\n"
-        "규칙:\n"
-        "1) 출력은 간결한 불릿 목록으로만 작성\n"
-        "2) 아래 항목을 우선 추출: 계약일/임대차기간/보증금/월세/관리비/특약/위약금/해지조건/수리·하자/원상복구/당사자 정보\n"
-        "3) 페이지에 없으면 '없음'으로 쓰지 말고 해당 항목은 생략\n"
-        "4) 숫자/날짜는 원문 표현을 최대한 유지\n"
+def _build_page_text(doc_type: str, filename: str, page_no: int, data: dict) -> dict[str, Any]:
+    structured = parse_upstage_page(data, page=page_no)
+    text = render_page_text(structured) or extract_plain_text_from_upstage_json(data)
+    focus_text = ""
+    if settings.EASY_CONTRACT_FOCUS_SECTIONS_ENABLED:
+        focus_text = render_relevant_text(structured, doc_type)
+    return {"doc_type": doc_type, "file": filename, "page": page_no, "text": text, "focus_text": focus_text}
+
+
+def _redact_page(page: dict[str, Any]) -> dict[str, Any]:
+    # 마스킹 결과에는 숫자가 남지 않아 이미 마스킹된 페이지에 다시 적용해도 같다
+    return {
+        **page,
+        "text": redact_phone_and_account(page.get("text") or ""),
+        "focus_text": redact_phone_and_account(page.get("focus_text") or ""),
+    }
+
+
+def _sanitize_and_guard(pages_text: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], LeaseGuardResult]:
+    """개인정보를 마스킹하고 계약서 여부를 판별한다 (CPU 풀에서 한 번에 돌도록 모듈 함수로 둔다)."""
+    sanitized_pages_text: list[dict[str, Any]] = []
+    contract_texts: list[str] = []
+    all_texts: list[str] = []
+
+    for page in pages_text:
+        sanitized_page = _redact_page(page)
+        sanitized_pages_text.append(sanitized_page)
+
+        normalized_doc_type = _normalize_doc_type(page.get("doc_type"))
+        text_for_check = sanitized_page["text"].strip()
+        if not text_for_check:
+            continue
+        all_texts.append(text_for_check)
+        if normalized_doc_type == "contract":
+            contract_texts.append(text_for_check)
+
+    texts_for_guard = contract_texts if contract_texts else all_texts
+    return sanitized_pages_text, check_is_lease_contract(texts_for_guard)
+
+
+def _prompt_text(page: dict[str, Any]) -> str:
+    return (page.get("focus_text") or page.get("text") or "").strip()
+
+
+def _summary_checkpoint_key(summary: dict[str, Any]) -> str:
+    return f"{_normalize_doc_type(summary.get('doc_type'))}:{summary['file']}:{summary['page']}"
+
+
+PAGE_SUMMARY_TEMPLATE = register_prompt_template(
+    PromptTemplate(
+        name="easy_contract.page_summary",
+        system=(
+            "너는 주택 임대차 문서를 페이지 단위로 읽고 핵심 정보를 추출하는 도우미다.\n"
+            "규칙:\n"
+            "1) 출력은 간결한 불릿 목록으로만 작성\n"
+            "2) 아래 항목을 우선 추출: 계약일/임대차기간/보증금/월세/관리비/특약/위약금/해지조건/수리·하자/원상복구/당사자 정보\n"
+            "3) 페이지에 없으면 '없음'으로 쓰지 말고 해당 항목은 생략\n"
+            "4) 숫자/날짜는 원문 표현을 최대한 유지\n"
+        ),
+        instruction=(
+            "아래 OCR 텍스트에서 중요한 조항과 계약일/임대차기간/보증금/월세/관리비/특약/위약금/해지조건/수리·하자/원상복구만 불릿으로 정리해줘.\n"
+            "반드시 OCR 텍스트에 제시된 내용을 정리하고 없는 정보를 만들어내지 마라.\n\n"
+        ),
     )
-    user = (
+)
+
+# system 을 페이지 단건 요약과 똑같이 유지해 같은 작업의 모든 페이지 요청이 접두부를 공유하게 한다.
+PAGE_GROUP_SUMMARY_TEMPLATE = register_prompt_template(
+    PromptTemplate(
+        name="easy_contract.page_group_summary",
+        system=PAGE_SUMMARY_TEMPLATE.system,
+        instruction=(
+            "아래 OCR 텍스트의 각 페이지에서 중요한 조항과 계약일/임대차기간/보증금/월세/관리비/특약/위약금/해지조건/수리·하자/원상복구만 불릿으로 정리해줘.\n"
+            "페이지마다 반드시 '[페이지 N]' 한 줄로 시작하고, 다른 페이지 내용을 섞지 마라.\n"
+            "반드시 OCR 텍스트에 제시된 내용을 정리하고 없는 정보를 만들어내지 마라.\n\n"
+        ),
+    )
+)
+
+REGISTRY_SUMMARY_TEMPLATE = register_prompt_template(
+    PromptTemplate(
+        name="easy_contract.registry_summary",
+        system=(
+            "너는 등기부등본 OCR 텍스트를 사실 기반으로 요약하는 도우미다.\n"
+            "규칙:\n"
+            "1) 출력은 간결한 불릿 목록으로만 작성\n"
+            "2) 갑구의 현재 소유자 정보를 우선 요약\n"
+            "3) 을구의 현재 소유권 이외 권리를 우선 요약\n"
+            "4) 다음 단어가 나오면 반드시 요약에 포함: 가등기, 가처분, 예고등기, 가압류, 압류, 경매개시결정, 신탁, 근저당권\n"
+            "5) 비용/금액 정보가 보이면 함께 요약\n"
+            "6) OCR 텍스트에 없는 정보는 추측하거나 생성하지 말 것\n"
+        ),
+        instruction=(
+            "아래 텍스트 전체를 한 번에 읽고 갑구 현재 소유자와 을구 현재 소유권 이외 권리를 중심으로 요약해줘.\n"
+            "반드시 OCR 텍스트에 제시된 내용을 정리하고 없는 정보를 만들어내지 마라.\n\n"
+            "[문서타입] registry\n"
+        ),
+    )
+)
+
+FINAL_MARKDOWN_TEMPLATE = register_prompt_template(
+    PromptTemplate(
+        name="easy_contract.final_markdown",
+        system=(
+            "너는 주택 임대차 계약서를 쉽게 풀어서 설명하고 분석해서 마크다운으로 출력하는 도우미다.\n"
+            "규칙:\n"
+            "1) 출력은 마크다운만 (설명문/코드블록 금지)\n"
+            "2) 사실에 근거해 작성. 추측 금지\n"
+            "3) 섹션 예시(필요한 것만 포함):\n"
+            "   - 요약(다섯 문장 이하, 불릿)\n"
+            "   - 핵심 조건(표)\n"
+            "   - 중요 조항(불릿)\n"
+            "   - 위험/주의 포인트(불릿)\n"
+            "4) 금액/날짜/기간/당사자/주소 등은 가능한 한 원문 기반으로 명확히하고 월세와 관리비가 모두 있으면 실제 월 납부금액을 핵심조건(표)에 표시\n"
+            "5) 등기부등본 해석은 등기부에 기재된 사실만 설명\n"
+            "6) 시세/시장가/향후 경매 가능성은 추측하지 말 것\n"
+            "7) 위험성은 단정하지 말고 '가능성' 표현으로 제한할 것\n"
+            "8) 계약서 임대인과 등기부 갑구 소유자 비교 결과를 명시할 것\n"
+            "9) 공동소유로 보이면 소유자 전원 계약 여부 확인 필요를 명시할 것\n"
+            "10) 키워드(가등기/가처분/예고등기/가압류/압류/경매개시결정/신탁/근저당권)가 있으면 반드시 주의사항에 반영\n"
+            "11) 근저당권이 있으면 금액을 원문 그대로 표기하고, 시세 비교 없이 '보증금 반환이 어려울 수 있다' 수준으로 표현\n"
+        ),
+        instruction=(
+            "아래 요약들을 종합해 쉬운 계약서 결과를 마크다운으로 작성해줘.\n"
+            "특히 위험/주의 포인트 섹션에는 아래를 반드시 반영해줘.\n"
+            "- 과해석 금지: 등기부 기재 사실만 설명, 시세/시장/향후 경매 추측 금지, 위험은 가능성 표현\n"
+            "- 계약서 임대인과 등기부 갑구 소유자 비교(일치/불일치/확인불가)\n"
+            "- 불일치면 반드시 불일치로 표시\n"
+            "- 공동소유일 경우 전원 계약 여부 확인 필요를 명시\n"
+            "- 키워드(가등기/가처분/예고등기/가압류/압류/경매개시결정/신탁/근저당권) 존재 시 주의사항에 포함\n"
+            "- 근저당 설정 시 금액을 그대로 표기하고 시세 비교는 하지 말 것\n"
+            "반드시 제공된 요약만 근거로 작성하고 없는 정보를 만들어내지 마라.\n\n"
+        ),
+    )
+)
+
+SECTION_REDUCE_TEMPLATE = register_prompt_template(
+    PromptTemplate(
+        name="easy_contract.section_reduce",
+        system=(
+            "너는 주택 임대차 문서의 페이지별 요약을 사실 그대로 하나로 압축하는 도우미다.\n"
+            "규칙:\n"
+            "1) 출력은 간결한 불릿 목록으로만 작성\n"
+            "2) 금액/날짜/기간/당사자/주소/특약은 원문 표현을 그대로 유지\n"
+            "3) 가등기/가처분/예고등기/가압류/압류/경매개시결정/신탁/근저당권 관련 내용은 빠짐없이 유지\n"
+            "4) 같은 내용은 하나로 합치고, 요약에 없는 정보는 추측하거나 생성하지 말 것\n"
+        ),
+        instruction=(
+            "아래 요약들을 중복 없이 하나의 불릿 목록으로 압축해줘.\n"
+            "반드시 제공된 요약만 근거로 작성하고 없는 정보를 만들어내지 마라.\n\n"
+        ),
+    )
+)
+
+_PAGE_GROUP_HEADER = re.compile(r"^[ \t]*(?:#+[ \t]*)?\[?[ \t]*페이지[ \t]*(\d+)[ \t]*\]?[ \t]*:?[ \t]*$", re.MULTILINE)
+
+
+def _page_summary_prompt(doc_type: str, page_no: int, text: str) -> list[dict[str, str]]:
+    return PAGE_SUMMARY_TEMPLATE.render(
         f"[문서타입] {doc_type}\n"
         f"[페이지] {page_no}\n"
-        f"[OCR 텍스트]\n{text}\n\n"
-        "이 페이지에서 중요한 조항과 계약일/임대차기간/보증금/월세/관리비/특약/위약금/해지조건/수리·하자/원상복구만 불릿으로 정리해줘.\n"
-        "반드시 OCR 텍스트에 제시된 내용을 정리하고 없는 정보를 만들어내지 마라.\n"
+        f"[OCR 텍스트]\n{text}\n"
     )
-    return [{"role": "system", "content": system}, {"role": "user", "content": user}]
 
 
-def _registry_summary_prompt(filename: str, text: str) -> list[dict[str, str]]:
-    system = (
-        "너는 등기부등본 OCR 텍스트를 사실 기반으로 요약하는 도우미다.\n"
-        "규칙:\n"
-        "1) 출력은 간결한 불릿 목록으로만 작성\n"
-        "2) 갑구의 현재 소유자 정보를 우선 요약\n"
-        "3) 을구의 현재 소유권 이외 권리를 우선 요약\n"
-        "4) 다음 단어가 나오면 반드시 요약에 포함: 가등기, 가처분, 예고등기, 가압류, 압류, 경매개시결정, 신탁, 근저당권\n"
-        "5) 비용/금액 정보가 보이면 함께 요약\n"
-        "6) OCR 텍스트에 없는 정보는 추측하거나 생성하지 말 것\n"
+def _page_group_summary_prompt(doc_type: str, pages: list[tuple[int, str]]) -> list[dict[str, str]]:
+    page_numbers = ", ".join(str(page_no) for page_no, _ in pages)
+    body = "\n\n".join(f"[페이지 {page_no}]\n{text}" for page_no, text in pages)
+    return PAGE_GROUP_SUMMARY_TEMPLATE.render(
+        f"[문서타입] {doc_type}\n"
+        f"[페이지] {page_numbers}\n"
+        f"[OCR 텍스트]\n{body}\n"
     )
-    user = (
-        "[문서타입] registry\n"
+
+
+def _split_page_group_summary(text: str, page_numbers: list[int]) -> dict[int, str]:
+    wanted = set(page_numbers)
+    matches = list(_PAGE_GROUP_HEADER.finditer(text or ""))
+    out: dict[int, str] = {}
+    for idx, match in enumerate(matches):
+        page_no = int(match.group(1))
+        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(text)
+        body = text[match.end() : end].strip()
+        if page_no in wanted and body and page_no not in out:
+            out[page_no] = body
+    return out
+
+
+def _group_short_pages(
+    pages: list[tuple[dict[str, Any], str]],
+    count_tokens: Callable[[str], int],
+    *,
+    short_page_tokens: int,
+    group_token_budget: int,
+) -> list[list[tuple[dict[str, Any], str]]]:
+    """같은 파일의 연속된 짧은 페이지를 토큰 예산 안에서 하나의 요약 요청으로 묶는다."""
+    groups: list[list[tuple[dict[str, Any], str]]] = []
+    current: list[tuple[dict[str, Any], str]] = []
+    current_tokens = 0
+
+    for page, text in pages:
+        tokens = count_tokens(text)
+        groupable = tokens <= short_page_tokens
+        if current and (
+            not groupable
+            or current[0][0]["file"] != page["file"]
+            or current_tokens + tokens > group_token_budget
+        ):
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append((page, text))
+        current_tokens += tokens
+        if not groupable:
+            groups.append(current)
+            current, current_tokens = [], 0
+
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _registry_summary_prompt(filename: str, text: str) -> list[dict[str, str]]:
+    return REGISTRY_SUMMARY_TEMPLATE.render(
         f"[파일] {filename}\n"
-        f"[OCR 텍스트 전체]\n{text}\n\n"
-        "위 텍스트 전체를 한 번에 읽고 갑구 현재 소유자와 을구 현재 소유권 이외 권리를 중심으로 요약해줘.\n"
-        "반드시 OCR 텍스트에 제시된 내용을 정리하고 없는 정보를 만들어내지 마라.\n"
+        f"[OCR 텍스트 전체]\n{text}\n"
     )
-    return [{"role": "system", "content": system}, {"role": "user", "content": user}]
 
 
-def _trim_registry_text(text: str, limit: int = 40000) -> str:
-    if len(text) <= limit:
-        return text
-    head_len = int(limit * 0.65)
-    tail_len = limit - head_len
-    return text[:head_len] + "\n\n...(중간 일부 생략)...\n\n" + text[-tail_len:]
+def _section_reduce_prompt(doc_type: str, section: list[dict[str, Any]]) -> list[dict[str, str]]:
+    lines = [f"- ({s['file']} p.{s['page']}) {s['summary']}".strip() for s in section]
+    return SECTION_REDUCE_TEMPLATE.render(
+        f"[문서타입] {doc_type}\n"
+        "[요약]\n"
+        + "\n".join(lines)
+        + "\n"
+    )
 
 
-def _final_markdown_prompt(page_summaries: list[dict[str, Any]]) -> list[dict[str, str]]:
-    system = (
-        "너는 주택 임대차 계약서를 쉽게 풀어서 설명하고 분석해서 마크다운으로 출력하는 도우미다.\n"
-        "규칙:\n"
-        "1) 출력은 마크다운만 (설명문/코드블록 금지)\n"
-        "2) 사실에 근거해 작성. 추측 금지\n"
-        "3) 섹션 예시(필요한 것만 포함):\n"
-        "   - 요약(다섯 문장 이하, 불릿)\n"
-        "   - 핵심 조건(표)\n"
-        "   - 중요 조항(불릿)\n"
-        "   - 위험/주의 포인트(불릿)\n"
-        "4) 금액/날짜/기간/당사자/주소 등은 가능한 한 원문 기반으로 명확히하고 월세와 관리비가 모두 있으면 실제 월 납부금액을 핵심조건(표)에 표시\n"
-        "5) 등기부등본 해석은 등기부에 기재된 사실만 설명\n"
-        "6) 시세/시장가/향후 경매 가능성은 추측하지 말 것\n"
-        "7) 위험성은 단정하지 말고 '가능성' 표현으로 제한할 것\n"
-        "8) 계약서 임대인과 등기부 갑구 소유자 비교 결과를 명시할 것\n"
-        "9) 공동소유로 보이면 소유자 전원 계약 여부 확인 필요를 명시할 것\n"
-        "10) 키워드(가등기/가처분/예고등기/가압류/압류/경매개시결정/신탁/근저당권)가 있으면 반드시 주의사항에 반영\n"
-        "11) 근저당권이 있으면 금액을 원문 그대로 표기하고, 시세 비교 없이 '보증금 반환이 어려울 수 있다' 수준으로 표현\n"
-    )
+def _section_label(section: list[dict[str, Any]]) -> tuple[str, str]:
+    files = list(dict.fromkeys(str(s["file"]) for s in section))
+    if len(files) == 1:
+        pages = [str(s["page"]) for s in section]
+        page_label = pages[0] if len(pages) == 1 else f"{pages[0]}-{pages[-1]}"
+        return files[0], page_label
+    return ", ".join(files), "-"
+
+
+def _group_summaries_into_sections(
+    page_summaries: list[dict[str, Any]],
+    count_tokens: Callable[[str], int],
+    *,
+    section_token_budget: int,
+) -> list[list[dict[str, Any]]]:
+    """같은 문서 타입의 연속된 요약을 토큰 예산 단위 섹션으로 나눈다."""
+    sections: list[list[dict[str, Any]]] = []
+    current: list[dict[str, Any]] = []
+    current_tokens = 0
+    for summary in page_summaries:
+        tokens = count_tokens(summary.get("summary") or "")
+        doc_type = _normalize_doc_type(summary.get("doc_type"))
+        if current and (
+            _normalize_doc_type(current[0].get("doc_type")) != doc_type
+            or current_tokens + tokens > section_token_budget
+        ):
+            sections.append(current)
+            current, current_tokens = [], 0
+        current.append(summary)
+        current_tokens += tokens
+    if current:
+        sections.append(current)
+    return sections
+
 
+def _final_markdown_prompt(page_summaries: list[dict[str, Any]]) -> list[dict[str, str]]:
     contract_lines: list[str] = []
     registry_lines: list[str] = []
     for s in page_summaries:
@@ -143,290 +386,45 @@ def _final_markdown_prompt(page_summaries: list[dict[str, Any]]) -> list[dict[st
         else:
             contract_lines.append(line)
 
-    user = (
+    return FINAL_MARKDOWN_TEMPLATE.render(
         "[계약서 페이지별 핵심 요약]\n"
         + ("\n".join(contract_lines) if contract_lines else "- 없음")
         + "\n\n"
         + "[등기부등본 요약]\n"
         + ("\n".join(registry_lines) if registry_lines else "- 없음")
-        + "\n\n"
-        + "위 요약들을 종합해 쉬운 계약서 결과를 마크다운으로 작성해줘.\n"
-        + "특히 위험/주의 포인트 섹션에는 아래를 반드시 반영해줘.\n"
-        + "- 과해석 금지: 등기부 기재 사실만 설명, 시세/시장/향후 경매 추측 금지, 위험은 가능성 표현\n"
-        + "- 계약서 임대인과 등기부 갑구 소유자 비교(일치/불일치/확인불가)\n"
-        + "- 불일치면 반드시 불일치로 표시\n"
-        + "- 공동소유일 경우 전원 계약 여부 확인 필요를 명시\n"
-        + "- 키워드(가등기/가처분/예고등기/가압류/압류/경매개시결정/신탁/근저당권) 존재 시 주의사항에 포함\n"
-        + "- 근저당 설정 시 금액을 그대로 표기하고 시세 비교는 하지 말 것\n"
-        + "반드시 제공된 요약만 근거로 작성하고 없는 정보를 만들어내지 마라.\n"
+        + "\n"
     )
-    return [{"role": "system", "content": system}, {"role": "user", "content": user}]
 
 
 class EasyContractService:
-    def __init__(self, vllm: VLLMClient, ocr: UpstageDocumentParseClient):
+    def __init__(
+        self,
+        vllm: VLLMClient,
+        ocr: UpstageDocumentParseClient,
+        budgeter: PromptBudgeter | None = None,
+        checkpoint_store: JobCheckpointStore | None = None,
+        cpu: CpuTaskExecutor | None = None,
+        executor: str = EXECUTOR_LANGGRAPH,
+    ):
         self.vllm = vllm
         self.ocr = ocr
-        self.graph = self._build_graph()
-
-    def _build_graph(self):
-        g = StateGraph(EasyContractState)
-
-        def _check_cancel(state: EasyContractState) -> None:
-            easy_contract_id = state.get("easy_contract_id")
-            if easy_contract_id is None:
-                return
-            checker = state.get("is_cancelled")
-            if checker and checker(easy_contract_id):
-                raise EasyContractCancelled(f"easy_contract_id={easy_contract_id}")
-
-        def _log_extra(state: EasyContractState, **kwargs: Any) -> dict[str, Any]:
-            extra = {
-                "easy_contract_id": state.get("easy_contract_id"),
-                "correlation_id": state.get("correlation_id"),
-                "event_time": now_utc_iso(),
-            }
-            extra.update(kwargs)
-            return extra
-
-        async def ocr_stage(state: EasyContractState) -> EasyContractState:
-            logger.info("문서 문자 인식 단계 시작", extra=_log_extra(state))
-            pages_text: list[dict[str, Any]] = []
-            remaining_pages_by_doc_type = OCR_PAGE_LIMITS_BY_DOC_TYPE.copy()
-
-            for doc in state["docs"]:
-                _check_cancel(state)
-                filename = doc["filename"]
-                doc_type = _normalize_doc_type(doc["doc_type"])
-                b = doc["bytes"]
-                page_budget = remaining_pages_by_doc_type.get(doc_type)
-
-                if page_budget is not None and page_budget <= 0:
-                    logger.info(
-                        "문서 타입 OCR 페이지 상한 도달로 문서 스킵",
-                        extra=_log_extra(state, doc_filename=filename, doc_type=doc_type),
-                    )
-                    continue
-
-                if filename.lower().endswith(".pdf"):
-                    from app.utils.pdf_images import pdf_bytes_to_png_pages
-
-                    try:
-                        logger.info("pdf 이미지 변환 중", extra=_log_extra(state, doc_filename=filename))
-                        page_images = pdf_bytes_to_png_pages(
-                            b,
-                            zoom=2.0,
-                            max_pages=page_budget,
-                        )
-                        logger.info(
-                            "pdf 이미지 변환 완료",
-                            extra=_log_extra(
-                                state,
-                                doc_filename=filename,
-                                page_count=len(page_images),
-                                page_limit=page_budget,
-                            ),
-                        )
-                    except Exception as e:
-                        raise RuntimeError("UNPROCESSABLE_DOCUMENT") from e
-
-                    for i, img in enumerate(page_images, start=1):
-                        _check_cancel(state)
-                        logger.info(
-                            "이미지 변환 후 문자 인식 요청",
-                            extra=_log_extra(state, doc_filename=filename, page=i),
-                        )
-                        data = await self.ocr.parse_image(img, filename=f"{filename}.p{i}.png")
-                        logger.info(
-                            "문자 인식 완료 후 텍스트 추출",
-                            extra=_log_extra(state, doc_filename=filename, page=i),
-                        )
-                        text = extract_plain_text_from_upstage_json(data)
-                        logger.debug(
-                            "문자 인식 결과",
-                            extra=_log_extra(state, doc_filename=filename, page=i, text_length=len(text)),
-                        )
-                        pages_text.append({"doc_type": doc_type, "file": filename, "page": i, "text": text})
-                        if doc_type in remaining_pages_by_doc_type:
-                            remaining_pages_by_doc_type[doc_type] = max(0, remaining_pages_by_doc_type[doc_type] - 1)
-                else:
-                    _check_cancel(state)
-                    logger.info("문자 인식 요청", extra=_log_extra(state, doc_filename=filename, page=1))
-                    data = await self.ocr.parse_image(b, filename=filename)
-                    logger.info(
-                        "문자 인식 완료 후 텍스트 추출",
-                        extra=_log_extra(state, doc_filename=filename, page=1),
-                    )
-                    text = extract_plain_text_from_upstage_json(data)
-                    logger.debug(
-                        "문자 인식 결과",
-                        extra=_log_extra(state, doc_filename=filename, page=1, text_length=len(text)),
-                    )
-                    pages_text.append({"doc_type": doc_type, "file": filename, "page": 1, "text": text})
-                    if doc_type in remaining_pages_by_doc_type:
-                        remaining_pages_by_doc_type[doc_type] = max(0, remaining_pages_by_doc_type[doc_type] - 1)
-
-            return {"pages_text": pages_text}
-
-        async def contract_page_summarize_stage(state: EasyContractState) -> EasyContractState:
-            logger.info("계약서 페이지별 요약 시작", extra=_log_extra(state))
-            summaries: list[dict[str, Any]] = []
-
-            for p in state.get("pages_text", []):
-                _check_cancel(state)
-                if _normalize_doc_type(p.get("doc_type")) != "contract":
-                    continue
-
-                txt = (p.get("text") or "").strip()
-                if not txt:
-                    continue
-
-                msgs = _page_summary_prompt(p["doc_type"], p["page"], txt[:20000])
-                logger.info(
-                    "계약서 페이지 요약 요청",
-                    extra=_log_extra(state, doc_filename=p["file"], page=p["page"]),
-                )
-                summary = await self.vllm.chat(
-                    msgs,
-                    temperature=0.2,
-                    max_tokens=1024,
-                    model=settings.VLLM_LORA_ADAPTER_EASYCONTRACT,
-                )
-                logger.info(
-                    "계약서 페이지 요약 완료",
-                    extra=_log_extra(
-                        state,
-                        doc_filename=p["file"],
-                        page=p["page"],
-                        summary_length=len(summary),
-                    ),
-                )
-                summaries.append(
-                    {
-                        "doc_type": p["doc_type"],
-                        "file": p["file"],
-                        "page": p["page"],
-                        "summary": summary.strip(),
-                    }
-                )
-
-            return {"contract_page_summaries": summaries}
-
-        def sanitize_and_guard_stage(state: EasyContractState) -> EasyContractState:
-            logger.info("OCR 텍스트 개인정보 마스킹 및 계약서 판별 시작", extra=_log_extra(state))
-            pages_text = state.get("pages_text", [])
-            sanitized_pages_text: list[dict[str, Any]] = []
-            contract_texts: list[str] = []
-            all_texts: list[str] = []
-
-            for page in pages_text:
-                raw_text = page.get("text") or ""
-                sanitized_text = redact_phone_and_account(raw_text)
-                sanitized_pages_text.append({**page, "text": sanitized_text})
-
-                normalized_doc_type = _normalize_doc_type(page.get("doc_type"))
-                text_for_check = sanitized_text.strip()
-                if not text_for_check:
-                    continue
-                all_texts.append(text_for_check)
-                if normalized_doc_type == "contract":
-                    contract_texts.append(text_for_check)
-
-            texts_for_guard = contract_texts if contract_texts else all_texts
-            guard = check_is_lease_contract(texts_for_guard)
-            logger.info(
-                "계약서 판별 결과",
-                extra=_log_extra(state, lease_guard_ok=guard.ok, lease_guard_score=guard.score),
-            )
-            if not guard.ok:
-                raise NotLeaseContract("입력하신 문서가 계약서가 아닙니다. 문서를 다시 확인해주세요.")
-
-            return {"pages_text": sanitized_pages_text}
-
-        async def registry_summarize_stage(state: EasyContractState) -> EasyContractState:
-            logger.info("등기부등본 요약 시작", extra=_log_extra(state))
-            summaries: list[dict[str, Any]] = []
-            pages_by_file: dict[str, list[dict[str, Any]]] = {}
-
-            for p in state.get("pages_text", []):
-                if _normalize_doc_type(p.get("doc_type")) != "registry":
-                    continue
-                pages_by_file.setdefault(p["file"], []).append(p)
-
-            for filename, pages in pages_by_file.items():
-                _check_cancel(state)
-                sorted_pages = sorted(pages, key=lambda item: int(item.get("page", 0)))
-                merged_chunks: list[str] = []
-                for p in sorted_pages:
-                    txt = (p.get("text") or "").strip()
-                    if not txt:
-                        continue
-                    merged_chunks.append(f"[페이지 {p['page']}]\n{txt}")
-
-                if not merged_chunks:
-                    continue
-
-                merged_text = _trim_registry_text("\n\n".join(merged_chunks))
-                msgs = _registry_summary_prompt(filename, merged_text)
-                logger.info(
-                    "등기부등본 요약 요청",
-                    extra=_log_extra(state, doc_filename=filename, page_count=len(sorted_pages)),
-                )
-                summary = await self.vllm.chat(
-                    msgs,
-                    temperature=0.2,
-                    max_tokens=1024,
-                    model=settings.VLLM_LORA_ADAPTER_EASYCONTRACT,
-                )
-                logger.info(
-                    "등기부등본 요약 완료",
-                    extra=_log_extra(state, doc_filename=filename, summary_length=len(summary)),
-                )
-                summaries.append({"doc_type": "registry", "file": filename, "page": 1, "summary": summary.strip()})
-
-            return {"registry_summaries": summaries}
-
-        def merge_summaries_stage(state: EasyContractState) -> EasyContractState:
-            contract_summaries = state.get("contract_page_summaries", [])
-            registry_summaries = state.get("registry_summaries", [])
-            return {"page_summaries": [*contract_summaries, *registry_summaries]}
-
-        async def final_stage(state: EasyContractState) -> EasyContractState:
-            _check_cancel(state)
-            msgs = _final_markdown_prompt(state.get("page_summaries", []))
-            logger.info("쉬운계약서 생성 요청", extra=_log_extra(state))
-            md = await self.vllm.chat(
-                msgs,
-                temperature=0.2,
-                max_tokens=2048,
-                model=settings.VLLM_LORA_ADAPTER_EASYCONTRACT,
-            )
-            logger.info("쉬운계약서 생성 완료", extra=_log_extra(state))
-            markdown = md.strip()
-            logger.debug("마크다운 생성 완료", extra=_log_extra(state, length=len(markdown)))
-            return {"markdown": markdown}
-
-        # ---- graph wiring ----
-        g.add_node("ocr", ocr_stage)
-        g.add_node("sanitize_and_guard", sanitize_and_guard_stage)
-        g.add_node("contract_page_summarize", contract_page_summarize_stage)
-        g.add_node("registry_summarize", registry_summarize_stage)
-        g.add_node("merge_summaries", merge_summaries_stage)
-        g.add_node("final", final_stage)
-
-        g.set_entry_point("ocr")
-
-        # guard + sanitize 이후 fan-out (병렬)
-        g.add_edge("ocr", "sanitize_and_guard")
-        g.add_edge("sanitize_and_guard", "contract_page_summarize")
-        g.add_edge("sanitize_and_guard", "registry_summarize")
+        self.checkpoint_store = checkpoint_store
+        self.cpu = cpu
+        self.executor = executor
+        self.budgeter = budgeter or PromptBudgeter(
+            TokenCounter(),
+            context_window=settings.VLLM_MAX_MODEL_LEN,
+            prompt_budget=settings.PROMPT_TOKEN_BUDGET,
+        )
 
-        # join
-        g.add_edge(["contract_page_summarize", "registry_summarize"], "merge_summaries")
-        g.add_edge("merge_summaries", "final")
-        g.add_edge("final", END)
+    @property
+    def graph(self) -> Any:
+        return easy_contract_graph()
 
-        return g.compile()
+    async def _run_cpu(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if self.cpu is None:
+            return fn(*args, **kwargs)
+        return await self.cpu.run(fn, *args, **kwargs)
 
     async def generate(
         self,
@@ -445,9 +443,11 @@ class EasyContractService:
             },
         )
 
+        bind_correlation_id(correlation_id)
         normalized_docs = [{**doc, "doc_type": _normalize_doc_type(doc.get("doc_type"))} for doc in docs]
 
         state: EasyContractState = {
+            "service": self,
             "easy_contract_id": easy_contract_id,
             "docs": normalized_docs,
             "pages_text": [],
@@ -460,7 +460,26 @@ class EasyContractService:
         if is_cancelled:
             state["is_cancelled"] = is_cancelled
 
-        out = await self.graph.ainvoke(state)
+        checkpoint = await self._open_checkpoint(easy_contract_id, correlation_id, normalized_docs)
+        state["checkpoint"] = checkpoint
+
+        try:
+            with start_span(
+                "easy_contract.generate",
+                attributes={
+                    "easy_contract.id": easy_contract_id,
+                    "easy_contract.doc_count": len(normalized_docs),
+                    "easy_contract.checkpoint": checkpoint is not None,
+                },
+            ):
+                out = await self._invoke(state)
+        except (NotLeaseContract, EasyContractCancelled):
+            # 재시도해도 결과가 같으므로 중간 결과를 남기지 않는다
+            if checkpoint is not None:
+                await checkpoint.clear()
+            raise
+        if checkpoint is not None:
+            await checkpoint.clear()
 
         logger.info(
             "쉬운 계약서 생성 완료",
@@ -472,3 +491,508 @@ class EasyContractService:
             },
         )
         return out.get("markdown", "")
+
+    async def _invoke(self, state: EasyContractState) -> dict[str, Any]:
+        if self.executor == EXECUTOR_INLINE:
+            job = await _run_inline(EasyContractJob(**state))
+            return job.to_dict()
+        return await self.graph.ainvoke(state)
+
+    async def _open_checkpoint(
+        self,
+        easy_contract_id: int,
+        correlation_id: str | None,
+        docs: list[dict[str, Any]],
+    ) -> JobCheckpoint | None:
+        # 동기 API(easy_contract_id < 0)처럼 재전달이 없는 요청은 체크포인트를 쓰지 않는다
+        if self.checkpoint_store is None or easy_contract_id < 0 or not correlation_id:
+            return None
+        key = _checkpoint_key(easy_contract_id, correlation_id)
+        return await JobCheckpoint.open(self.checkpoint_store, key, fingerprint_docs(docs))
+
+    async def discard_checkpoint(self, easy_contract_id: int, correlation_id: str | None) -> None:
+        """다시 처리되지 않을 작업(최종 실패 포함)의 체크포인트를 지운다. 없으면 아무것도 하지 않는다."""
+        if self.checkpoint_store is None or easy_contract_id < 0 or not correlation_id:
+            return
+        key = _checkpoint_key(easy_contract_id, correlation_id)
+        try:
+            await self.checkpoint_store.delete(key)
+        except Exception:
+            logger.exception("체크포인트 삭제 실패", extra={"checkpoint_key": key})
+
+
+def _checkpoint_key(easy_contract_id: int, correlation_id: str) -> str:
+    return f"easy-contract:{easy_contract_id}:{correlation_id}"
+
+
+@functools.cache
+def easy_contract_graph() -> Any:
+    """컴파일된 쉬운 계약서 그래프. 프로세스마다 처음 쓸 때 한 번만 만들고 모든 서비스 인스턴스가 같이 쓴다."""
+    return _build_graph()
+
+
+def _build_graph() -> Any:
+    # langgraph(langchain_core 포함) import 가 무거워 기동 시점이 아니라 그래프를 만들 때 불러온다
+    from langgraph.graph import END, StateGraph
+
+    nodes = _easy_contract_nodes()
+    g = StateGraph(EasyContractState)
+    for name, node in nodes.items():
+        g.add_node(name, node)
+
+    g.set_entry_point("ocr")
+
+    # guard + sanitize 이후 fan-out (병렬)
+    g.add_edge("ocr", "sanitize_and_guard")
+    g.add_edge("sanitize_and_guard", "contract_page_summarize")
+    g.add_edge("sanitize_and_guard", "registry_summarize")
+
+    # join
+    g.add_edge(["contract_page_summarize", "registry_summarize"], "merge_summaries")
+    g.add_edge("merge_summaries", "final")
+    g.add_edge("final", END)
+
+    return g.compile()
+
+
+async def _run_inline(job: EasyContractJob) -> EasyContractJob:
+    """_build_graph 와 같은 순서로 노드를 직접 호출한다 (inline 실행기)."""
+    nodes = _easy_contract_nodes()
+    job.apply(await nodes["ocr"](job))
+    job.apply(await nodes["sanitize_and_guard"](job))
+    updates = await run_parallel(nodes["contract_page_summarize"](job), nodes["registry_summarize"](job))
+    for update in updates:
+        job.apply(update)
+    job.apply(nodes["merge_summaries"](job))
+    job.apply(await nodes["final"](job))
+    return job
+
+
+@functools.cache
+def _easy_contract_nodes() -> dict[str, Callable[..., Any]]:
+    """그래프 노드 함수들 (span 으로 감싼 것). LangGraph 그래프와 inline 실행기가 같이 쓴다."""
+
+    def _check_cancel(state: EasyContractState) -> None:
+        easy_contract_id = state.get("easy_contract_id")
+        if easy_contract_id is None:
+            return
+        checker = state.get("is_cancelled")
+        if checker and checker(easy_contract_id):
+            raise EasyContractCancelled(f"easy_contract_id={easy_contract_id}")
+
+    def _log_extra(state: EasyContractState, **kwargs: Any) -> dict[str, Any]:
+        extra = {
+            "easy_contract_id": state.get("easy_contract_id"),
+            "correlation_id": state.get("correlation_id"),
+            "event_time": now_utc_iso(),
+        }
+        extra.update(kwargs)
+        return extra
+
+    async def ocr_page(
+        state: EasyContractState,
+        doc_type: str,
+        filename: str,
+        page_no: int,
+        image: bytes,
+        ocr_filename: str,
+    ) -> dict[str, Any]:
+        service = state["service"]
+        checkpoint = state.get("checkpoint")
+        restored = checkpoint.ocr_page(filename, page_no) if checkpoint is not None else None
+        if restored is not None:
+            logger.info(
+                "체크포인트의 페이지 OCR 결과 사용",
+                extra=_log_extra(state, doc_filename=filename, page=page_no),
+            )
+            return restored
+
+        logger.info("문자 인식 요청", extra=_log_extra(state, doc_filename=filename, page=page_no))
+        data = await service.ocr.parse_image(image, filename=ocr_filename)
+        logger.info(
+            "문자 인식 완료 후 텍스트 추출",
+            extra=_log_extra(state, doc_filename=filename, page=page_no),
+        )
+        page_text = await service._run_cpu(_build_page_text, doc_type, filename, page_no, data)
+        logger.debug(
+            "문자 인식 결과",
+            extra=_log_extra(
+                state,
+                doc_filename=filename,
+                page=page_no,
+                text_length=len(page_text["text"]),
+                focus_text_length=len(page_text["focus_text"]),
+            ),
+        )
+        # 작업이 중간에 넘겨져도 다른 레플리카가 OCR 을 다시 하지 않도록 페이지마다 남긴다 (마스킹본만 저장)
+        if checkpoint is not None:
+            await checkpoint.save_ocr_page(_redact_page(page_text))
+        return page_text
+
+    async def ocr_stage(state: EasyContractState) -> EasyContractState:
+        service = state["service"]
+        checkpoint = state.get("checkpoint")
+        if checkpoint is not None and checkpoint.pages_text is not None:
+            logger.info(
+                "체크포인트의 OCR 결과로 문자 인식 단계 생략",
+                extra=_log_extra(state, page_count=len(checkpoint.pages_text)),
+            )
+            return {"pages_text": checkpoint.pages_text}
+
+        logger.info("문서 문자 인식 단계 시작", extra=_log_extra(state))
+        pages_text: list[dict[str, Any]] = []
+        remaining_pages_by_doc_type = OCR_PAGE_LIMITS_BY_DOC_TYPE.copy()
+
+        for doc in state["docs"]:
+            _check_cancel(state)
+            filename = doc["filename"]
+            doc_type = _normalize_doc_type(doc["doc_type"])
+            b = doc["bytes"]
+            page_budget = remaining_pages_by_doc_type.get(doc_type)
+
+            if page_budget is not None and page_budget <= 0:
+                logger.info(
+                    "문서 타입 OCR 페이지 상한 도달로 문서 스킵",
+                    extra=_log_extra(state, doc_filename=filename, doc_type=doc_type),
+                )
+                continue
+
+            if filename.lower().endswith(".pdf"):
+                from app.utils.pdf_images import pdf_bytes_to_png_pages
+
+                try:
+                    logger.info("pdf 이미지 변환 중", extra=_log_extra(state, doc_filename=filename))
+                    page_images = await service._run_cpu(
+                        pdf_bytes_to_png_pages,
+                        b,
+                        zoom=2.0,
+                        max_pages=page_budget,
+                    )
+                    logger.info(
+                        "pdf 이미지 변환 완료",
+                        extra=_log_extra(
+                            state,
+                            doc_filename=filename,
+                            page_count=len(page_images),
+                            page_limit=page_budget,
+                        ),
+                    )
+                except Exception as e:
+                    raise RuntimeError("UNPROCESSABLE_DOCUMENT") from e
+
+                for i, img in enumerate(page_images, start=1):
+                    _check_cancel(state)
+                    page_text = await ocr_page(state, doc_type, filename, i, img, f"{filename}.p{i}.png")
+                    pages_text.append(page_text)
+                    if doc_type in remaining_pages_by_doc_type:
+                        remaining_pages_by_doc_type[doc_type] = max(0, remaining_pages_by_doc_type[doc_type] - 1)
+            else:
+                _check_cancel(state)
+                page_text = await ocr_page(state, doc_type, filename, 1, b, filename)
+                pages_text.append(page_text)
+                if doc_type in remaining_pages_by_doc_type:
+                    remaining_pages_by_doc_type[doc_type] = max(0, remaining_pages_by_doc_type[doc_type] - 1)
+
+        return {"pages_text": pages_text}
+
+    async def summarize_contract_page(state: EasyContractState, p: dict[str, Any], txt: str) -> dict[str, Any]:
+        service = state["service"]
+        msgs = _page_summary_prompt(p["doc_type"], p["page"], txt)
+        logger.info(
+            "계약서 페이지 요약 요청",
+            extra=_log_extra(state, doc_filename=p["file"], page=p["page"]),
+        )
+        summary = await service.vllm.chat(
+            msgs,
+            temperature=0.2,
+            max_tokens=SUMMARY_MAX_TOKENS,
+            model=settings.VLLM_LORA_ADAPTER_EASYCONTRACT,
+            priority_class=PRIORITY_BATCH,
+        )
+        logger.info(
+            "계약서 페이지 요약 완료",
+            extra=_log_extra(
+                state,
+                doc_filename=p["file"],
+                page=p["page"],
+                summary_length=len(summary),
+            ),
+        )
+        return {
+            "doc_type": p["doc_type"],
+            "file": p["file"],
+            "page": p["page"],
+            "summary": summary.strip(),
+        }
+
+    async def summarize_contract_page_group(
+        state: EasyContractState,
+        group: list[tuple[dict[str, Any], str]],
+    ) -> list[dict[str, Any]]:
+        service = state["service"]
+        first = group[0][0]
+        page_numbers = [p["page"] for p, _ in group]
+        msgs = _page_group_summary_prompt(first["doc_type"], [(p["page"], txt) for p, txt in group])
+        logger.info(
+            "계약서 페이지 묶음 요약 요청",
+            extra=_log_extra(state, doc_filename=first["file"], pages=page_numbers),
+        )
+        content = await service.vllm.chat(
+            msgs,
+            temperature=0.2,
+            max_tokens=min(SUMMARY_MAX_TOKENS * len(group), FINAL_MAX_TOKENS),
+            model=settings.VLLM_LORA_ADAPTER_EASYCONTRACT,
+            priority_class=PRIORITY_BATCH,
+        )
+        by_page = _split_page_group_summary(content, page_numbers)
+        missing_pages = [page_no for page_no in page_numbers if page_no not in by_page]
+        logger.info(
+            "계약서 페이지 묶음 요약 완료",
+            extra=_log_extra(
+                state,
+                doc_filename=first["file"],
+                pages=page_numbers,
+                missing_pages=missing_pages,
+                summary_length=len(content),
+            ),
+        )
+
+        summaries: list[dict[str, Any]] = []
+        for p, txt in group:
+            if p["page"] in by_page:
+                summaries.append(
+                    {"doc_type": p["doc_type"], "file": p["file"], "page": p["page"], "summary": by_page[p["page"]]}
+                )
+            else:
+                # 응답에서 페이지를 분리하지 못하면 해당 페이지만 단건 요청으로 보정
+                _check_cancel(state)
+                summaries.append(await summarize_contract_page(state, p, txt))
+        return summaries
+
+    async def contract_page_summarize_stage(state: EasyContractState) -> EasyContractState:
+        service = state["service"]
+        logger.info("계약서 페이지별 요약 시작", extra=_log_extra(state))
+        pages: list[tuple[dict[str, Any], str]] = []
+
+        for p in state.get("pages_text", []):
+            _check_cancel(state)
+            if _normalize_doc_type(p.get("doc_type")) != "contract":
+                continue
+
+            txt = _prompt_text(p)
+            if not txt:
+                continue
+
+            doc_type, page_no = p["doc_type"], p["page"]
+            txt = service.budgeter.fit(
+                txt,
+                build_messages=lambda t, dt=doc_type, no=page_no: _page_summary_prompt(dt, no, t),
+                max_tokens=SUMMARY_MAX_TOKENS,
+            )
+            pages.append((p, txt))
+
+        checkpoint = state.get("checkpoint")
+        done: dict[str, dict[str, Any]] = {}
+        pending: list[tuple[dict[str, Any], str]] = []
+        for p, txt in pages:
+            restored = checkpoint.summary(_summary_checkpoint_key(p)) if checkpoint is not None else None
+            if restored is not None:
+                done[_summary_checkpoint_key(p)] = restored
+            else:
+                pending.append((p, txt))
+        if done:
+            logger.info(
+                "체크포인트의 계약서 페이지 요약 복원",
+                extra=_log_extra(state, restored_count=len(done), pending_count=len(pending)),
+            )
+
+        if settings.EASY_CONTRACT_PAGE_GROUPING_ENABLED:
+            groups = _group_short_pages(
+                pending,
+                service.budgeter.counter.count,
+                short_page_tokens=settings.EASY_CONTRACT_SHORT_PAGE_TOKENS,
+                group_token_budget=settings.EASY_CONTRACT_PAGE_GROUP_TOKEN_BUDGET,
+            )
+        else:
+            groups = [[page] for page in pending]
+
+        for group in groups:
+            _check_cancel(state)
+            if len(group) == 1:
+                results = [await summarize_contract_page(state, *group[0])]
+            else:
+                results = await summarize_contract_page_group(state, group)
+            for result in results:
+                key = _summary_checkpoint_key(result)
+                done[key] = result
+                if checkpoint is not None:
+                    await checkpoint.save_summary(key, result)
+
+        summaries = [done[_summary_checkpoint_key(p)] for p, _ in pages]
+        return {"contract_page_summaries": summaries}
+
+    async def sanitize_and_guard_stage(state: EasyContractState) -> EasyContractState:
+        service = state["service"]
+        logger.info("OCR 텍스트 개인정보 마스킹 및 계약서 판별 시작", extra=_log_extra(state))
+        sanitized_pages_text, guard = await service._run_cpu(_sanitize_and_guard, state.get("pages_text", []))
+        logger.info(
+            "계약서 판별 결과",
+            extra=_log_extra(state, lease_guard_ok=guard.ok, lease_guard_score=guard.score),
+        )
+        if not guard.ok:
+            raise NotLeaseContract("입력하신 문서가 계약서가 아닙니다. 문서를 다시 확인해주세요.")
+
+        # 원문(개인정보 포함)이 아니라 마스킹된 텍스트만 체크포인트에 남긴다
+        checkpoint = state.get("checkpoint")
+        if checkpoint is not None and checkpoint.pages_text is None:
+            await checkpoint.save_pages_text(sanitized_pages_text)
+
+        return {"pages_text": sanitized_pages_text}
+
+    async def registry_summarize_stage(state: EasyContractState) -> EasyContractState:
+        service = state["service"]
+        logger.info("등기부등본 요약 시작", extra=_log_extra(state))
+        summaries: list[dict[str, Any]] = []
+        pages_by_file: dict[str, list[dict[str, Any]]] = {}
+
+        for p in state.get("pages_text", []):
+            if _normalize_doc_type(p.get("doc_type")) != "registry":
+                continue
+            pages_by_file.setdefault(p["file"], []).append(p)
+
+        checkpoint = state.get("checkpoint")
+        for filename, pages in pages_by_file.items():
+            _check_cancel(state)
+            checkpoint_key = f"registry:{filename}:1"
+            restored = checkpoint.summary(checkpoint_key) if checkpoint is not None else None
+            if restored is not None:
+                logger.info("체크포인트의 등기부등본 요약 복원", extra=_log_extra(state, doc_filename=filename))
+                summaries.append(restored)
+                continue
+
+            sorted_pages = sorted(pages, key=lambda item: int(item.get("page", 0)))
+            merged_chunks: list[str] = []
+            for p in sorted_pages:
+                txt = _prompt_text(p)
+                if not txt:
+                    continue
+                merged_chunks.append(f"[페이지 {p['page']}]\n{txt}")
+
+            if not merged_chunks:
+                continue
+
+            merged_text = service.budgeter.fit(
+                "\n\n".join(merged_chunks),
+                build_messages=lambda t, name=filename: _registry_summary_prompt(name, t),
+                max_tokens=SUMMARY_MAX_TOKENS,
+                head_ratio=REGISTRY_HEAD_RATIO,
+            )
+            msgs = _registry_summary_prompt(filename, merged_text)
+            logger.info(
+                "등기부등본 요약 요청",
+                extra=_log_extra(state, doc_filename=filename, page_count=len(sorted_pages)),
+            )
+            summary = await service.vllm.chat(
+                msgs,
+                temperature=0.2,
+                max_tokens=SUMMARY_MAX_TOKENS,
+                model=settings.VLLM_LORA_ADAPTER_EASYCONTRACT,
+                priority_class=PRIORITY_BATCH,
+            )
+            logger.info(
+                "등기부등본 요약 완료",
+                extra=_log_extra(state, doc_filename=filename, summary_length=len(summary)),
+            )
+            result = {"doc_type": "registry", "file": filename, "page": 1, "summary": summary.strip()}
+            summaries.append(result)
+            if checkpoint is not None:
+                await checkpoint.save_summary(checkpoint_key, result)
+
+        return {"registry_summaries": summaries}
+
+    def merge_summaries_stage(state: EasyContractState) -> EasyContractState:
+        contract_summaries = state.get("contract_page_summaries", [])
+        registry_summaries = state.get("registry_summaries", [])
+        return {"page_summaries": [*contract_summaries, *registry_summaries]}
+
+    async def reduce_section(state: EasyContractState, section: list[dict[str, Any]]) -> dict[str, Any]:
+        service = state["service"]
+        doc_type = _normalize_doc_type(section[0].get("doc_type"))
+        if len(section) == 1:
+            return section[0]
+        file_label, page_label = _section_label(section)
+        content = await service.vllm.chat(
+            _section_reduce_prompt(doc_type, section),
+            temperature=0.2,
+            max_tokens=SECTION_REDUCE_MAX_TOKENS,
+            model=settings.VLLM_LORA_ADAPTER_EASYCONTRACT,
+            priority_class=PRIORITY_BATCH,
+        )
+        logger.info(
+            "섹션 요약 축약 완료",
+            extra=_log_extra(
+                state,
+                doc_type=doc_type,
+                doc_filename=file_label,
+                pages=page_label,
+                input_count=len(section),
+                summary_length=len(content),
+            ),
+        )
+        return {"doc_type": doc_type, "file": file_label, "page": page_label, "summary": content.strip()}
+
+    async def hierarchical_reduce(
+        state: EasyContractState,
+        page_summaries: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        service = state["service"]
+        threshold = settings.EASY_CONTRACT_HIERARCHICAL_REDUCE_THRESHOLD_TOKENS
+        if threshold <= 0:
+            return page_summaries
+        count = service.budgeter.counter.count
+        total_tokens = sum(count(s.get("summary") or "") for s in page_summaries)
+        if total_tokens <= threshold:
+            return page_summaries
+
+        sections = _group_summaries_into_sections(
+            page_summaries,
+            count,
+            section_token_budget=settings.EASY_CONTRACT_REDUCE_SECTION_TOKENS,
+        )
+        if len(sections) <= 1:
+            return page_summaries
+
+        logger.info(
+            "요약 계층 축약 시작",
+            extra=_log_extra(state, summary_tokens=total_tokens, section_count=len(sections)),
+        )
+        _check_cancel(state)
+        return list(await asyncio.gather(*(reduce_section(state, section) for section in sections)))
+
+    async def final_stage(state: EasyContractState) -> EasyContractState:
+        service = state["service"]
+        _check_cancel(state)
+        page_summaries = await hierarchical_reduce(state, state.get("page_summaries", []))
+        _check_cancel(state)
+        msgs = _final_markdown_prompt(page_summaries)
+        logger.info("쉬운계약서 생성 요청", extra=_log_extra(state))
+        md = await service.vllm.chat(
+            msgs,
+            temperature=0.2,
+            max_tokens=FINAL_MAX_TOKENS,
+            model=settings.VLLM_LORA_ADAPTER_EASYCONTRACT,
+            priority_class=PRIORITY_BATCH,
+        )
+        logger.info("쉬운계약서 생성 완료", extra=_log_extra(state))
+        markdown = md.strip()
+        logger.debug("마크다운 생성 완료", extra=_log_extra(state, length=len(markdown)))
+        return {"markdown": markdown}
+
+    return {
+        "ocr": traced_node("ocr", ocr_stage),
+        "sanitize_and_guard": traced_node("sanitize_and_guard", sanitize_and_guard_stage),
+        "contract_page_summarize": traced_node("contract_page_summarize", contract_page_summarize_stage),
+        "registry_summarize": traced_node("registry_summarize", registry_summarize_stage),
+        "merge_summaries": traced_node("merge_summaries", merge_summaries_stage),
+        "final": traced_node("final", final_stage),
+    }
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyStore(Protocol):
+    # 처리권 락의 TTL. None 이면 락이 만료되지 않아 갱신할 필요가 없다
+    lock_ttl_sec: int | None
+
+    async def get(self, key: str) -> dict[str, Any] | None: ...
+
+    async def put(self, key: str, result: dict[str, Any]) -> None: ...
+
+    async def try_lock(self, key: str) -> bool:
+        """다른 프로세스와 같은 키를 동시에 처리하지 않도록 처리권을 잡는다. 이미 잡혀 있으면 False."""
+        ...
+
+    async def refresh_lock(self, key: str) -> None: ...
+
+    async def unlock(self, key: str) -> None: ...
+
+
+class InMemoryIdempotencyStore:
+    lock_ttl_sec: int | None = None
+
+    def __init__(self, ttl_sec: int, max_entries: int = 1024) -> None:
+        self._ttl_sec = ttl_sec
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expiry, result = entry
+        if expiry < time.time():
+            self._entries.pop(key, None)
+            return None
+        return result
+
+    async def put(self, key: str, result: dict[str, Any]) -> None:
+        self._entries[key] = (time.time() + self._ttl_sec, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def cleanup_expired(self) -> None:
+        now = time.time()
+        expired_keys = [key for key, (expiry, _) in self._entries.items() if expiry < now]
+        for key in expired_keys:
+            self._entries.pop(key, None)
+
+    # 프로세스 안의 중복은 IdempotencyGuard 가 합치고, 프로세스 사이에는 공유하지 않는다
+    async def try_lock(self, key: str) -> bool:
+        return True
+
+    async def refresh_lock(self, key: str) -> None:
+        return None
+
+    async def unlock(self, key: str) -> None:
+        return None
+
+
+# 토큰이 같을 때만 만료 연장/삭제 (락 TTL 이 지나 다른 프로세스가 가져간 락을 건드리지 않게)
+_REFRESH_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+_UNLOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisIdempotencyStore:
+    """결과는 TTL 동안 보관하고, 처리 중인 키는 SET NX 락(짧은 TTL, 처리하는 동안 갱신)으로 프로세스 간에 하나만 돌린다.
+
+    처리하던 프로세스가 죽으면 락은 lock_ttl_sec 안에 풀리고, 재전달된 메시지를 받은 프로세스가 이어서 처리한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        redis: Redis,
+        ttl_sec: int,
+        lock_ttl_sec: int = 30,
+        prefix: str = "dojangkok:idempotency:",
+    ) -> None:
+        self._redis = redis
+        self._ttl_sec = ttl_sec
+        self.lock_ttl_sec: int | None = max(1, lock_ttl_sec)
+        self._prefix = prefix
+        self._lock_tokens: dict[str, str] = {}
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        raw = await self._redis.get(self._prefix + key)
+        if not raw:
+            return None
+        return json.loads(raw)
+
+    async def put(self, key: str, result: dict[str, Any]) -> None:
+        await self._redis.set(
+            self._prefix + key,
+            json.dumps(result, ensure_ascii=False),
+            ex=self._ttl_sec if self._ttl_sec > 0 else None,
+        )
+
+    def _lock_key(self, key: str) -> str:
+        return f"{self._prefix}lock:{key}"
+
+    async def try_lock(self, key: str) -> bool:
+        token = uuid.uuid4().hex
+        acquired = await self._redis.set(self._lock_key(key), token, nx=True, ex=self.lock_ttl_sec)
+        if not acquired:
+            return False
+        self._lock_tokens[key] = token
+        return True
+
+    async def refresh_lock(self, key: str) -> None:
+        token = self._lock_tokens.get(key)
+        if token is not None:
+            await self._redis.eval(_REFRESH_LOCK_SCRIPT, 1, self._lock_key(key), token, self.lock_ttl_sec)
+
+    async def unlock(self, key: str) -> None:
+        token = self._lock_tokens.pop(key, None)
+        if token is not None:
+            await self._redis.eval(_UNLOCK_SCRIPT, 1, self._lock_key(key), token)
+
+
+class IdempotencyClaim:
+    __slots__ = ("key", "result", "owner")
+
+    def __init__(self, key: str, *, result: dict[str, Any] | None = None, owner: bool = False) -> None:
+        self.key = key
+        self.result = result
+        self.owner = owner
+
+    @property
+    def is_duplicate(self) -> bool:
+        return self.result is not None
+
+
+class IdempotencyGuard:
+    """요청 키별로 완료된 결과를 재사용하고, 동시에 들어온 중복 요청은 진행 중인 작업 하나에 합친다.
+
+    claim() 으로 소유권을 얻은 쪽만 실제 작업을 수행하고, 끝나면 반드시 complete() 를 호출해야 한다.
+    complete(result=None) 은 재시도 가능한 실패를 뜻하며, 대기 중이던 중복 요청 중 하나가 다시 소유권을 가져간다.
+    저장소가 처리권 락을 지원하면(Redis) 다른 프로세스가 처리 중인 키는 결과가 저장되거나 락이 풀릴 때까지 기다린다.
+    """
+
+    def __init__(self, store: IdempotencyStore, *, lock_poll_interval_sec: float = 1.0) -> None:
+        self.store = store
+        self.lock_poll_interval_sec = max(lock_poll_interval_sec, 0.01)
+        self._inflight: dict[str, asyncio.Future[dict[str, Any] | None]] = {}
+        self._lock_refreshers: dict[str, asyncio.Task[None]] = {}
+
+    async def claim(self, key: str) -> IdempotencyClaim:
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            logger.info("진행 중인 동일 요청에 합류", extra={"idempotency_key": key})
+            result = await asyncio.shield(inflight)
+            if result is not None:
+                return IdempotencyClaim(key, result=result)
+
+        future: asyncio.Future[dict[str, Any] | None] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            stored = await self._claim_across_processes(key)
+        except BaseException:
+            # 기다리던 중 취소되면 합류해 있던 같은 프로세스의 중복 요청이 다시 소유권을 잡게 한다
+            self._inflight.pop(key, None)
+            future.set_result(None)
+            raise
+
+        if stored is not None:
+            self._inflight.pop(key, None)
+            future.set_result(stored)
+            logger.info("이미 처리된 요청 결과 재사용", extra={"idempotency_key": key})
+            return IdempotencyClaim(key, result=stored)
+        self._start_lock_refresher(key)
+        return IdempotencyClaim(key, owner=True)
+
+    async def _claim_across_processes(self, key: str) -> dict[str, Any] | None:
+        """저장된 결과가 있으면 돌려주고, 없으면 처리권 락을 잡은 뒤 None 을 돌려준다."""
+        waiting = False
+        while True:
+            try:
+                locked = await self.store.try_lock(key)
+            except Exception:
+                # 락 저장소 장애로 처리가 멈추지 않도록 락 없이 진행한다 (동시 중복 처리 가능성만 남는다)
+                logger.exception("멱등성 처리권 락 획득 실패", extra={"idempotency_key": key})
+                locked = True
+            stored = await self._get_stored(key)
+            if stored is not None:
+                if locked:
+                    await self._unlock(key)
+                return stored
+            if locked:
+                return None
+            if not waiting:
+                waiting = True
+                logger.info("다른 프로세스에서 처리 중인 동일 요청 대기", extra={"idempotency_key": key})
+            await asyncio.sleep(self.lock_poll_interval_sec)
+
+    async def _get_stored(self, key: str) -> dict[str, Any] | None:
+        try:
+            return await self.store.get(key)
+        except Exception:
+            logger.exception("멱등성 저장소 조회 실패", extra={"idempotency_key": key})
+            return None
+
+    def _start_lock_refresher(self, key: str) -> None:
+        if self.store.lock_ttl_sec is None:
+            return
+        self._lock_refreshers[key] = asyncio.create_task(
+            self._refresh_lock_loop(key, self.store.lock_ttl_sec / 3), name=f"idempotency-lock:{key}"
+        )
+
+    async def _refresh_lock_loop(self, key: str, interval_sec: float) -> None:
+        while True:
+            await asyncio.sleep(interval_sec)
+            try:
+                await self.store.refresh_lock(key)
+            except Exception:
+                logger.exception("멱등성 처리권 락 갱신 실패", extra={"idempotency_key": key})
+
+    async def _unlock(self, key: str) -> None:
+        refresher = self._lock_refreshers.pop(key, None)
+        if refresher is not None:
+            refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await refresher
+        try:
+            await self.store.unlock(key)
+        except Exception:
+            # 풀지 못한 락은 lock TTL 이 지나면 풀린다
+            logger.exception("멱등성 처리권 락 해제 실패", extra={"idempotency_key": key})
+
+    async def complete(self, claim: IdempotencyClaim, result: dict[str, Any] | None) -> None:
+        if not claim.owner:
+            return
+        claim.owner = False
+        try:
+            if result is not None:
+                await self.store.put(claim.key, result)
+        except Exception:
+            logger.exception("멱등성 저장소 기록 실패", extra={"idempotency_key": claim.key})
+        finally:
+            # 결과를 먼저 저장한 뒤 락을 풀어야 기다리던 다른 프로세스가 결과를 재사용한다
+            await self._unlock(claim.key)
+            future = self._inflight.pop(claim.key, None)
+            if future is not None and not future.done():
+                future.set_result(result)
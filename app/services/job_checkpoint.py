@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class JobCheckpointStore(Protocol):
+    async def load(self, key: str) -> dict[str, Any] | None: ...
+
+    async def save(self, key: str, data: dict[str, Any]) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
+class LocalDiskCheckpointStore:
+    def __init__(self, *, directory: str, ttl_sec: int) -> None:
+        self._directory = Path(directory)
+        self._ttl_sec = ttl_sec
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self._directory / f"{digest}.json"
+
+    def _load_sync(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            if self._ttl_sec > 0 and path.stat().st_mtime + self._ttl_sec < time.time():
+                path.unlink(missing_ok=True)
+                return None
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+    def _save_sync(self, key: str, data: dict[str, Any]) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    async def load(self, key: str) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._load_sync, key)
+
+    async def save(self, key: str, data: dict[str, Any]) -> None:
+        await asyncio.to_thread(self._save_sync, key, data)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+    def _cleanup_expired_sync(self) -> int:
+        if self._ttl_sec <= 0:
+            return 0
+        deadline = time.time() - self._ttl_sec
+        removed = 0
+        try:
+            paths = list(self._directory.iterdir())
+        except FileNotFoundError:
+            return 0
+        for path in paths:
+            if path.suffix not in (".json", ".tmp"):
+                continue
+            try:
+                if path.stat().st_mtime < deadline:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+    async def cleanup_expired(self) -> int:
+        """TTL 이 지난 체크포인트 파일을 지운다. 다시 조회되지 않는 키(재전달이 없는 작업)도 여기서 정리된다."""
+        removed = await asyncio.to_thread(self._cleanup_expired_sync)
+        if removed:
+            logger.info("만료된 체크포인트 정리", extra={"removed": removed, "directory": str(self._directory)})
+        return removed
+
+
+class RedisCheckpointStore:
+    def __init__(self, *, redis: Redis, ttl_sec: int, prefix: str = "dojangkok:checkpoint:") -> None:
+        self._redis = redis
+        self._ttl_sec = ttl_sec
+        self._prefix = prefix
+
+    async def load(self, key: str) -> dict[str, Any] | None:
+        raw = await self._redis.get(self._prefix + key)
+        if not raw:
+            return None
+        return json.loads(raw)
+
+    async def save(self, key: str, data: dict[str, Any]) -> None:
+        await self._redis.set(
+            self._prefix + key,
+            json.dumps(data, ensure_ascii=False),
+            ex=self._ttl_sec if self._ttl_sec > 0 else None,
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(self._prefix + key)
+
+
+def fingerprint_docs(docs: list[dict[str, Any]]) -> str:
+    digest = hashlib.sha256()
+    for doc in docs:
+        digest.update(str(doc.get("filename")).encode("utf-8"))
+        digest.update(str(doc.get("doc_type")).encode("utf-8"))
+        digest.update(hashlib.sha256(doc.get("bytes") or b"").digest())
+    return digest.hexdigest()
+
+
+class JobCheckpoint:
+    """작업 하나의 단계별 중간 결과(마스킹된 OCR 텍스트, 요약)를 저장/복원한다.
+
+    OCR 단계가 끝나기 전에 중단되는 경우(드레인 시간 초과 등)를 위해 페이지별 OCR 결과도 마스킹해서 남긴다.
+
+    저장소 오류는 로그만 남기고 무시한다. 체크포인트가 없으면 처음부터 다시 계산하면 되기 때문이다.
+    """
+
+    def __init__(self, store: JobCheckpointStore, key: str, fingerprint: str) -> None:
+        self.store = store
+        self.key = key
+        self.fingerprint = fingerprint
+        self._data: dict[str, Any] = {
+            "fingerprint": fingerprint,
+            "pages_text": None,
+            "ocr_pages": {},
+            "summaries": {},
+        }
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def open(cls, store: JobCheckpointStore, key: str, fingerprint: str) -> JobCheckpoint:
+        checkpoint = cls(store, key, fingerprint)
+        try:
+            data = await store.load(key)
+        except Exception:
+            logger.exception("체크포인트 조회 실패", extra={"checkpoint_key": key})
+            data = None
+        if data and data.get("fingerprint") == fingerprint:
+            checkpoint._data = data
+            checkpoint._data.setdefault("summaries", {})
+            checkpoint._data.setdefault("ocr_pages", {})
+            logger.info(
+                "체크포인트 복원",
+                extra={
+                    "checkpoint_key": key,
+                    "has_pages_text": data.get("pages_text") is not None,
+                    "ocr_page_count": len(checkpoint._data["ocr_pages"]),
+                    "summary_count": len(checkpoint._data["summaries"]),
+                },
+            )
+        return checkpoint
+
+    @property
+    def pages_text(self) -> list[dict[str, Any]] | None:
+        return self._data.get("pages_text")
+
+    def ocr_page(self, filename: str, page_no: int) -> dict[str, Any] | None:
+        return self._data["ocr_pages"].get(f"{filename}:{page_no}")
+
+    def summary(self, summary_key: str) -> dict[str, Any] | None:
+        return self._data["summaries"].get(summary_key)
+
+    async def save_pages_text(self, pages_text: list[dict[str, Any]]) -> None:
+        async with self._lock:
+            self._data["pages_text"] = pages_text
+            # 전체 OCR 결과가 남았으므로 페이지별 결과는 더 필요 없다
+            self._data["ocr_pages"] = {}
+            await self._flush()
+
+    async def save_ocr_page(self, page_text: dict[str, Any]) -> None:
+        async with self._lock:
+            self._data["ocr_pages"][f"{page_text['file']}:{page_text['page']}"] = page_text
+            await self._flush()
+
+    async def save_summary(self, summary_key: str, summary: dict[str, Any]) -> None:
+        async with self._lock:
+            self._data["summaries"][summary_key] = summary
+            await self._flush()
+
+    async def clear(self) -> None:
+        try:
+            await self.store.delete(self.key)
+        except Exception:
+            logger.exception("체크포인트 삭제 실패", extra={"checkpoint_key": self.key})
+
+    async def _flush(self) -> None:
+        try:
+            await self.store.save(self.key, self._data)
+        except Exception:
+            logger.exception("체크포인트 저장 실패", extra={"checkpoint_key": self.key})
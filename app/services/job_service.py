@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import uuid4
+
+from app.resources.rabbitmq.codec import now_utc_iso
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+FINISHED_JOB_STATUSES = {JOB_SUCCEEDED, JOB_FAILED}
+
+
+class JobFailed(Exception):
+    """작업 실행 함수가 사용자에게 보여줄 오류 코드/메시지로 실패를 알릴 때 사용한다."""
+
+    def __init__(self, code: str, message: str) -> None:
+        self.code = code
+        self.message = message
+        super().__init__(message)
+
+
+class JobQueueFull(RuntimeError):
+    pass
+
+
+@dataclass
+class JobRecord:
+    job_id: str
+    kind: str
+    resource_id: str
+    status: str
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    result: str | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINISHED_JOB_STATUSES
+
+
+class JobStore(Protocol):
+    async def get(self, job_id: str) -> JobRecord | None: ...
+
+    async def save(self, record: JobRecord) -> None: ...
+
+
+class InMemoryJobStore:
+    def __init__(self, ttl_sec: int, max_entries: int = 1024) -> None:
+        self._ttl_sec = ttl_sec
+        self._max_entries = max(1, max_entries)
+        self._records: OrderedDict[str, tuple[float, JobRecord]] = OrderedDict()
+
+    async def get(self, job_id: str) -> JobRecord | None:
+        entry = self._records.get(job_id)
+        if entry is None:
+            return None
+        expiry, record = entry
+        if expiry < time.time():
+            self._records.pop(job_id, None)
+            return None
+        return record
+
+    async def save(self, record: JobRecord) -> None:
+        self._records[record.job_id] = (time.time() + self._ttl_sec, record)
+        self._records.move_to_end(record.job_id)
+        while len(self._records) > self._max_entries:
+            self._records.popitem(last=False)
+
+
+class RedisJobStore:
+    def __init__(self, *, redis: Redis, ttl_sec: int, prefix: str = "dojangkok:job:") -> None:
+        self._redis = redis
+        self._ttl_sec = ttl_sec
+        self._prefix = prefix
+
+    async def get(self, job_id: str) -> JobRecord | None:
+        raw = await self._redis.get(self._prefix + job_id)
+        if not raw:
+            return None
+        return JobRecord(**json.loads(raw))
+
+    async def save(self, record: JobRecord) -> None:
+        await self._redis.set(
+            self._prefix + record.job_id,
+            json.dumps(asdict(record), ensure_ascii=False),
+            ex=self._ttl_sec if self._ttl_sec > 0 else None,
+        )
+
+
+class JobService:
+    """HTTP 요청과 분리해 백그라운드로 실행하는 작업 관리 (프로세스 내 동시 실행 수 제한)."""
+
+    def __init__(self, store: JobStore, *, max_concurrency: int, max_pending: int) -> None:
+        self.store = store
+        self.max_pending = max(1, max_pending)
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._tasks)
+
+    async def submit(self, *, kind: str, resource_id: str, run: Callable[[], Awaitable[str]]) -> JobRecord:
+        if len(self._tasks) >= self.max_pending:
+            raise JobQueueFull("대기 중인 작업이 너무 많습니다.")
+
+        record = JobRecord(
+            job_id=uuid4().hex,
+            kind=kind,
+            resource_id=resource_id,
+            status=JOB_QUEUED,
+            created_at=now_utc_iso(),
+        )
+        await self.store.save(record)
+
+        task = asyncio.create_task(self._execute(record, run), name=f"job-{record.job_id}")
+        self._tasks[record.job_id] = task
+        task.add_done_callback(lambda _, job_id=record.job_id: self._tasks.pop(job_id, None))
+        logger.info(
+            "백그라운드 작업 접수",
+            extra={"job_id": record.job_id, "kind": kind, "resource_id": resource_id, "pending": len(self._tasks)},
+        )
+        return record
+
+    async def get(self, job_id: str) -> JobRecord | None:
+        return await self.store.get(job_id)
+
+    async def _execute(self, record: JobRecord, run: Callable[[], Awaitable[str]]) -> None:
+        try:
+            async with self._semaphore:
+                record.status = JOB_RUNNING
+                record.started_at = now_utc_iso()
+                await self._save(record)
+                record.result = await run()
+                record.status = JOB_SUCCEEDED
+        except JobFailed as exc:
+            self._mark_failed(record, exc.code, exc.message)
+        except asyncio.CancelledError:
+            self._mark_failed(record, "INTERRUPTED", "서버 종료로 작업이 중단되었습니다. 다시 요청해주세요.")
+            await self._save(record)
+            raise
+        except Exception:
+            logger.exception("백그라운드 작업 실패", extra={"job_id": record.job_id, "kind": record.kind})
+            self._mark_failed(record, "failed", "작업 처리 중 오류가 발생하였습니다.")
+
+        record.finished_at = now_utc_iso()
+        await self._save(record)
+        logger.info(
+            "백그라운드 작업 종료",
+            extra={"job_id": record.job_id, "kind": record.kind, "status": record.status},
+        )
+
+    def _mark_failed(self, record: JobRecord, code: str, message: str) -> None:
+        record.status = JOB_FAILED
+        record.result = None
+        record.error_code = code
+        record.error_message = message
+        record.finished_at = now_utc_iso()
+
+    async def _save(self, record: JobRecord) -> None:
+        try:
+            await self.store.save(record)
+        except Exception:
+            logger.exception("작업 상태 저장 실패", extra={"job_id": record.job_id, "status": record.status})
+
+    async def aclose(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"pending": len(self._tasks), "max_pending": self.max_pending}
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from typing import Any, ClassVar
+
+EXECUTOR_LANGGRAPH = "langgraph"
+EXECUTOR_INLINE = "inline"
+PIPELINE_EXECUTORS = (EXECUTOR_LANGGRAPH, EXECUTOR_INLINE)
+
+
+class PipelineState:
+    """LangGraph 없이(inline 실행기) 파이프라인을 돌릴 때 상태 dict 대신 쓰는 __slots__ 작업 상태.
+
+    노드 함수는 두 실행기에서 같은 것을 쓰므로 노드가 상태에 쓰는 get / [] / []= 만 dict 처럼 흉내 낸다.
+    노드가 돌려준 부분 결과는 apply 로 반영하고, 리듀서(list_concat)가 붙은 키는 LangGraph 처럼 이어 붙인다.
+    호출자가 넘긴 초기 리스트를 바꾸지 않도록 제자리에 덧붙이지 않고 새 리스트를 만든다 (키마다 몇 번뿐이다).
+    """
+
+    __slots__ = ()
+    _concat_keys: ClassVar[frozenset[str]] = frozenset()
+
+    def __init__(self, **values: Any) -> None:
+        for key, value in values.items():
+            self[key] = value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def apply(self, update: Any) -> None:
+        # 노드가 상태를 직접 고치고 자신을 돌려준 경우(체크리스트 노드)는 반영할 것이 없다
+        if update is None or update is self:
+            return
+        for key, value in update.items():
+            current = self.get(key)
+            if key in self._concat_keys and current is not None:
+                self[key] = [*current, *(value or [])]
+            else:
+                self[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {key: getattr(self, key) for key in self.__slots__ if hasattr(self, key)}
+
+
+async def run_parallel(*nodes: Awaitable[Any]) -> list[Any]:
+    """같은 단계의 노드를 동시에 돌린다. 하나가 실패하면 나머지를 취소한다 (LangGraph 의 같은 superstep 과 같게)."""
+    tasks = [asyncio.ensure_future(node) for node in nodes]
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+    if pending:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            exc = task.exception()
+            if exc is not None:
+                raise exc
+    return [task.result() for task in tasks]
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# vLLM automatic prefix caching 은 요청 간 토큰 접두부가 바이트 단위로 같아야 재사용된다.
+# 그래서 템플릿은 import 시점에 한 번만 만들고, 고정 지시문(system + user 앞부분)을 앞에,
+# 요청마다 달라지는 데이터는 항상 user 메시지 맨 끝에 둔다.
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    name: str
+    system: str
+    instruction: str
+
+    @property
+    def static_prefix(self) -> str:
+        return self.system + self.instruction
+
+    def render(self, data: str) -> list[dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system},
+            {"role": "user", "content": self.instruction + data},
+        ]
+
+
+PROMPT_TEMPLATES: dict[str, PromptTemplate] = {}
+
+
+def register_prompt_template(template: PromptTemplate) -> PromptTemplate:
+    existing = PROMPT_TEMPLATES.get(template.name)
+    if existing is not None and existing != template:
+        raise ValueError(f"프롬프트 템플릿 이름이 중복되었습니다: {template.name}")
+    PROMPT_TEMPLATES[template.name] = template
+    return template
+
+
+def get_prompt_template(name: str) -> PromptTemplate:
+    return PROMPT_TEMPLATES[name]
@@ -16,14 +16,35 @@ def _env_bool(key: str, default: bool = False) -> bool:
 @dataclass(frozen=True)
 class Settings:
     APP_ENV: str = os.getenv("APP_ENV", "")
+    # 배포 역할: all(API + 메시지 소비, 기존 방식) / api(HTTP 만) / worker(메시지 소비만, python -m app.workers)
+    APP_ROLE: str = os.getenv("APP_ROLE", "all").strip().lower()
 
     VLLM_BASE_URL: str = os.getenv("VLLM_BASE_URL", "")
+    # 여러 레플리카를 직접 분산할 때 콤마로 구분 (비우면 VLLM_BASE_URL 하나만 사용)
+    VLLM_BASE_URLS: str = os.getenv("VLLM_BASE_URLS", "")
+    VLLM_EJECT_FAILURE_THRESHOLD: int = int(os.getenv("VLLM_EJECT_FAILURE_THRESHOLD", "3"))
+    VLLM_EJECT_SEC: float = float(os.getenv("VLLM_EJECT_SEC", "30"))
     VLLM_API_KEY: str = os.getenv("VLLM_API_KEY", "")
     VLLM_MODEL: str = os.getenv("VLLM_MODEL", "LGAI-EXAONE/EXAONE-3.5-2.4B-Instruct")
 
     VLLM_LORA_ADAPTER_CHECKLIST: str = os.getenv("VLLM_LORA_ADAPTER_CHECKLIST", "")
     VLLM_LORA_ADAPTER_EASYCONTRACT: str = os.getenv("VLLM_LORA_ADAPTER_EASYCONTRACT", "")
 
+    # 프롬프트 토큰 예산 (vLLM --max-model-len 과 맞춰야 함)
+    VLLM_MAX_MODEL_LEN: int = int(os.getenv("VLLM_MAX_MODEL_LEN", "32768"))
+    PROMPT_TOKEN_BUDGET: int = int(os.getenv("PROMPT_TOKEN_BUDGET", "0"))
+    TOKENIZER_PATH: str = os.getenv("TOKENIZER_PATH", "")
+    TIKTOKEN_ENCODING: str = os.getenv("TIKTOKEN_ENCODING", "")
+
+    # vLLM 요청 스케줄러: 체크리스트(interactive)를 쉬운 계약서(batch)보다 먼저 처리
+    VLLM_MAX_IN_FLIGHT: int = int(os.getenv("VLLM_MAX_IN_FLIGHT", "16"))
+    VLLM_INTERACTIVE_WEIGHT: int = int(os.getenv("VLLM_INTERACTIVE_WEIGHT", "8"))
+    VLLM_BATCH_WEIGHT: int = int(os.getenv("VLLM_BATCH_WEIGHT", "1"))
+    VLLM_INTERACTIVE_MAX_IN_FLIGHT: int = int(os.getenv("VLLM_INTERACTIVE_MAX_IN_FLIGHT", "0"))
+    VLLM_BATCH_MAX_IN_FLIGHT: int = int(os.getenv("VLLM_BATCH_MAX_IN_FLIGHT", "12"))
+    # vLLM 서버가 --scheduling-policy priority 로 떠 있을 때만 켤 것
+    VLLM_PRIORITY_FIELD_ENABLED: bool = _env_bool("VLLM_PRIORITY_FIELD_ENABLED", False)
+
     UPSTAGE_API_KEY: str = os.getenv("OCR_API", "")
     UPSTAGE_DOCUMENT_PARSE_URL: str = "https://api.upstage.ai/v1/document-digitization"
 
@@ -31,15 +52,71 @@ class Settings:
     BACKEND_INTERNAL_TOKEN: str = os.getenv("BACKEND_INTERNAL_TOKEN", "")
 
     HTTP_TIMEOUT_SEC: float = float(os.getenv("HTTP_TIMEOUT_SEC", "300.0"))
+    HTTP_CONNECT_TIMEOUT_SEC: float = float(os.getenv("HTTP_CONNECT_TIMEOUT_SEC", "5.0"))
+    HTTP_POOL_TIMEOUT_SEC: float = float(os.getenv("HTTP_POOL_TIMEOUT_SEC", "30.0"))
+
+    # 의존성별 커넥션 풀 (느린 파일 다운로드가 vLLM 커넥션을 잡아먹지 않도록 분리)
+    VLLM_HTTP_MAX_CONNECTIONS: int = int(os.getenv("VLLM_HTTP_MAX_CONNECTIONS", "64"))
+    OCR_HTTP_MAX_CONNECTIONS: int = int(os.getenv("OCR_HTTP_MAX_CONNECTIONS", "16"))
+    OCR_HTTP_READ_TIMEOUT_SEC: float = float(os.getenv("OCR_HTTP_READ_TIMEOUT_SEC", "120.0"))
+    # HTTP/2 는 h2 패키지(httpx[http2])가 설치된 이미지에서만 켠다 (없으면 경고 후 HTTP/1.1)
+    OCR_HTTP2_ENABLED: bool = _env_bool("OCR_HTTP2_ENABLED", False)
+    DOWNLOAD_HTTP_MAX_CONNECTIONS: int = int(os.getenv("DOWNLOAD_HTTP_MAX_CONNECTIONS", "32"))
+    DOWNLOAD_HTTP_READ_TIMEOUT_SEC: float = float(os.getenv("DOWNLOAD_HTTP_READ_TIMEOUT_SEC", "60.0"))
+    CALLBACK_HTTP_MAX_CONNECTIONS: int = int(os.getenv("CALLBACK_HTTP_MAX_CONNECTIONS", "16"))
+    CALLBACK_HTTP_READ_TIMEOUT_SEC: float = float(os.getenv("CALLBACK_HTTP_READ_TIMEOUT_SEC", "30.0"))
     EXTERNAL_RETRY_MAX_ATTEMPTS: int = int(os.getenv("EXTERNAL_RETRY_MAX_ATTEMPTS", "3"))
     EXTERNAL_RETRY_BACKOFF_BASE_SEC: float = float(os.getenv("EXTERNAL_RETRY_BACKOFF_BASE_SEC", "0.5"))
 
+    # vLLM/Upstage/콜백 서킷 브레이커 (최근 WINDOW 동안 실패율 기준)
+    CIRCUIT_BREAKER_ENABLED: bool = _env_bool("CIRCUIT_BREAKER_ENABLED", True)
+    CIRCUIT_BREAKER_WINDOW_SEC: float = float(os.getenv("CIRCUIT_BREAKER_WINDOW_SEC", "30"))
+    CIRCUIT_BREAKER_MIN_CALLS: int = int(os.getenv("CIRCUIT_BREAKER_MIN_CALLS", "10"))
+    CIRCUIT_BREAKER_FAILURE_RATE: float = float(os.getenv("CIRCUIT_BREAKER_FAILURE_RATE", "0.5"))
+    CIRCUIT_BREAKER_OPEN_SEC: float = float(os.getenv("CIRCUIT_BREAKER_OPEN_SEC", "30"))
+
+    # 느린 vLLM 호출 헤지: 지연 percentile 을 넘기면 같은 요청을 한 번 더 보냄 (헤지 비율 상한 <= 1.0)
+    # Upstage OCR 은 처리율 제한(2초당 1건) 때문에 헤지가 다른 페이지를 늦출 뿐이라 헤지하지 않는다
+    VLLM_HEDGING_ENABLED: bool = _env_bool("VLLM_HEDGING_ENABLED", False)
+    HEDGING_PERCENTILE: float = float(os.getenv("HEDGING_PERCENTILE", "0.95"))
+    HEDGING_MIN_DELAY_SEC: float = float(os.getenv("HEDGING_MIN_DELAY_SEC", "0.5"))
+    HEDGING_MAX_RATIO: float = float(os.getenv("HEDGING_MAX_RATIO", "0.1"))
+    HEDGING_MIN_SAMPLES: int = int(os.getenv("HEDGING_MIN_SAMPLES", "20"))
+
     RABBITMQ_ENABLED: bool = _env_bool("RABBITMQ_ENABLED", True)
     RABBITMQ_URL: str = os.getenv("RABBITMQ_URL", "")
     RABBITMQ_PREFETCH_COUNT: int = int(os.getenv("RABBITMQ_PREFETCH_COUNT", "3"))
     RABBITMQ_DECLARE_PASSIVE: bool = _env_bool("RABBITMQ_DECLARE_PASSIVE", False)
     WORKER_RETRY_MAX_ATTEMPTS: int = int(os.getenv("WORKER_RETRY_MAX_ATTEMPTS", "3"))
     WORKER_RETRY_BACKOFF_BASE_SEC: float = float(os.getenv("WORKER_RETRY_BACKOFF_BASE_SEC", "0.5"))
+    # python -m app.workers 로 띄우는 컨슈머 프로세스 수 (0이면 CPU 코어 수)
+    WORKER_PROCESSES: int = int(os.getenv("WORKER_PROCESSES", "1"))
+    # 종료 신호 후 처리 중인 메시지를 기다리는 최대 시간 (넘기면 중단 후 재적재)
+    WORKER_DRAIN_TIMEOUT_SEC: float = float(os.getenv("WORKER_DRAIN_TIMEOUT_SEC", "25"))
+    # 컨슈머 프로세스별 /metrics 포트 (프로세스 i 는 포트 + i, 0이면 비활성)
+    WORKER_METRICS_PORT: int = int(os.getenv("WORKER_METRICS_PORT", "9100"))
+    # 브로커 연결이 이 시간 넘게 끊겨 있으면 프로세스를 종료해 supervisor 가 새로 띄우게 한다
+    WORKER_BROKER_DOWN_EXIT_SEC: float = float(os.getenv("WORKER_BROKER_DOWN_EXIT_SEC", "120"))
+
+    # 큐 적체/처리 시간/의존 서비스 포화도에 따라 prefetch 를 조절하고 권장 레플리카 수를 내보낸다
+    RABBITMQ_ADAPTIVE_PREFETCH_ENABLED: bool = _env_bool("RABBITMQ_ADAPTIVE_PREFETCH_ENABLED", False)
+    RABBITMQ_ADAPTIVE_PREFETCH_INTERVAL_SEC: float = float(os.getenv("RABBITMQ_ADAPTIVE_PREFETCH_INTERVAL_SEC", "15"))
+    RABBITMQ_PREFETCH_MIN: int = int(os.getenv("RABBITMQ_PREFETCH_MIN", "1"))
+    RABBITMQ_PREFETCH_MAX: int = int(os.getenv("RABBITMQ_PREFETCH_MAX", "16"))
+    # OCR 처리율 제한 대기열의 예상 대기 시간이 이 값을 넘으면 OCR 포화로 보고 prefetch 를 줄인다
+    OCR_SATURATION_WAIT_SEC: float = float(os.getenv("OCR_SATURATION_WAIT_SEC", "30"))
+    AUTOSCALE_TARGET_DRAIN_SEC: float = float(os.getenv("AUTOSCALE_TARGET_DRAIN_SEC", "300"))
+    AUTOSCALE_MIN_REPLICAS: int = int(os.getenv("AUTOSCALE_MIN_REPLICAS", "1"))
+    AUTOSCALE_MAX_REPLICAS: int = int(os.getenv("AUTOSCALE_MAX_REPLICAS", "10"))
+
+    # 체크리스트 메시지를 짧은 시간 창 단위로 모아 한 번에 처리 (같은 키워드 집합은 한 번만 생성)
+    CHECKLIST_BATCH_ENABLED: bool = _env_bool("CHECKLIST_BATCH_ENABLED", False)
+    CHECKLIST_BATCH_MAX_SIZE: int = int(os.getenv("CHECKLIST_BATCH_MAX_SIZE", "16"))
+    CHECKLIST_BATCH_MAX_WAIT_SEC: float = float(os.getenv("CHECKLIST_BATCH_MAX_WAIT_SEC", "0.2"))
+    # 배치 컨슈머 전용 채널 prefetch (0이면 CHECKLIST_BATCH_MAX_SIZE)
+    CHECKLIST_BATCH_PREFETCH_COUNT: int = int(os.getenv("CHECKLIST_BATCH_PREFETCH_COUNT", "0"))
+    # /api/checklists/batch 한 요청의 최대 항목 수
+    CHECKLIST_BATCH_API_MAX_ITEMS: int = int(os.getenv("CHECKLIST_BATCH_API_MAX_ITEMS", "64"))
 
     RABBITMQ_REQUEST_EXCHANGE_EASY_CONTRACT: str = os.getenv("RABBITMQ_REQUEST_EXCHANGE_EASY_CONTRACT", "")
     RABBITMQ_REQUEST_QUEUE_EASY_CONTRACT: str = os.getenv("RABBITMQ_REQUEST_QUEUE_EASY_CONTRACT", "")
@@ -60,4 +137,55 @@ class Settings:
     EASY_CONTRACT_CANCEL_TTL_SEC: int = int(os.getenv("EASY_CONTRACT_CANCEL_TTL_SEC", "3600"))
     EASY_CONTRACT_CANCEL_CLEANUP_INTERVAL_SEC: int = int(os.getenv("EASY_CONTRACT_CANCEL_CLEANUP_INTERVAL_SEC", "60"))
 
+    REDIS_URL: str = os.getenv("REDIS_URL", "")
+
+    # 재전달/중복 요청 결과 재사용 ("" 이면 비활성 | "memory" | "redis")
+    # memory 는 프로세스 안에서만 유효하고 재시작 시 사라진다. 컨슈머 프로세스/레플리카가 여럿이면 redis 를 쓴다
+    IDEMPOTENCY_BACKEND: str = os.getenv("IDEMPOTENCY_BACKEND", "memory").strip().lower()
+    IDEMPOTENCY_TTL_SEC: int = int(os.getenv("IDEMPOTENCY_TTL_SEC", "21600"))
+    IDEMPOTENCY_MAX_ENTRIES: int = int(os.getenv("IDEMPOTENCY_MAX_ENTRIES", "1024"))
+    # redis 처리권 락 TTL (처리 중에는 TTL/3 마다 갱신, 프로세스가 죽으면 이 시간 뒤 다른 프로세스가 이어받음)
+    IDEMPOTENCY_LOCK_TTL_SEC: int = int(os.getenv("IDEMPOTENCY_LOCK_TTL_SEC", "30"))
+
+    # HTTP 비동기 작업 API (/api/easycontract/{id}/jobs) ("memory" | "redis")
+    JOB_STORE_BACKEND: str = os.getenv("JOB_STORE_BACKEND", "memory").strip().lower()
+    JOB_TTL_SEC: int = int(os.getenv("JOB_TTL_SEC", "86400"))
+    JOB_MAX_CONCURRENCY: int = int(os.getenv("JOB_MAX_CONCURRENCY", "2"))
+    JOB_MAX_PENDING: int = int(os.getenv("JOB_MAX_PENDING", "32"))
+
+    # 워커 재시도/재전달 시 단계별 중간 결과 재사용 ("" | "disk" | "redis")
+    EASY_CONTRACT_CHECKPOINT_BACKEND: str = os.getenv("EASY_CONTRACT_CHECKPOINT_BACKEND", "").strip().lower()
+    EASY_CONTRACT_CHECKPOINT_DIR: str = os.getenv("EASY_CONTRACT_CHECKPOINT_DIR", "/tmp/dojangkok/checkpoints")
+    EASY_CONTRACT_CHECKPOINT_TTL_SEC: int = int(os.getenv("EASY_CONTRACT_CHECKPOINT_TTL_SEC", "86400"))
+
+    EASY_CONTRACT_FOCUS_SECTIONS_ENABLED: bool = _env_bool("EASY_CONTRACT_FOCUS_SECTIONS_ENABLED", True)
+    EASY_CONTRACT_PAGE_GROUPING_ENABLED: bool = _env_bool("EASY_CONTRACT_PAGE_GROUPING_ENABLED", False)
+    EASY_CONTRACT_SHORT_PAGE_TOKENS: int = int(os.getenv("EASY_CONTRACT_SHORT_PAGE_TOKENS", "800"))
+    EASY_CONTRACT_PAGE_GROUP_TOKEN_BUDGET: int = int(os.getenv("EASY_CONTRACT_PAGE_GROUP_TOKEN_BUDGET", "3000"))
+    # 페이지 요약 합계가 임계치를 넘으면 섹션 단위 부분 요약을 병렬로 만든 뒤 최종 생성 (0이면 비활성)
+    EASY_CONTRACT_HIERARCHICAL_REDUCE_THRESHOLD_TOKENS: int = int(
+        os.getenv("EASY_CONTRACT_HIERARCHICAL_REDUCE_THRESHOLD_TOKENS", "6000")
+    )
+    EASY_CONTRACT_REDUCE_SECTION_TOKENS: int = int(os.getenv("EASY_CONTRACT_REDUCE_SECTION_TOKENS", "2500"))
+
+    # OpenTelemetry 트레이싱 (OTLP gRPC, 로컬 collector 기본값)
+    TRACING_ENABLED: bool = _env_bool("TRACING_ENABLED", False)
+    OTEL_SERVICE_NAME: str = os.getenv("OTEL_SERVICE_NAME", "dojangkok-ai")
+    OTEL_EXPORTER_OTLP_ENDPOINT: str = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
+    TRACING_SAMPLE_RATIO: float = float(os.getenv("TRACING_SAMPLE_RATIO", "1.0"))
+
+    # 이벤트 루프 지연 감시 (임계치를 넘으면 멈춘 동안의 루프 스레드 스택을 샘플링해 로그로 남김)
+    LOOP_MONITOR_ENABLED: bool = _env_bool("LOOP_MONITOR_ENABLED", True)
+    LOOP_MONITOR_INTERVAL_SEC: float = float(os.getenv("LOOP_MONITOR_INTERVAL_SEC", "0.5"))
+    LOOP_LAG_THRESHOLD_SEC: float = float(os.getenv("LOOP_LAG_THRESHOLD_SEC", "0.25"))
+    LOOP_MONITOR_SAMPLE_INTERVAL_SEC: float = float(os.getenv("LOOP_MONITOR_SAMPLE_INTERVAL_SEC", "0.05"))
+
+    # PDF 렌더링/OCR 결과 파싱/마스킹 등 CPU 작업용 프로세스 풀 (0이면 CPU 코어 수, 비활성 시 이벤트 루프에서 바로 실행)
+    CPU_POOL_ENABLED: bool = _env_bool("CPU_POOL_ENABLED", False)
+    CPU_POOL_WORKERS: int = int(os.getenv("CPU_POOL_WORKERS", "0"))
+    CPU_POOL_MAX_PENDING: int = int(os.getenv("CPU_POOL_MAX_PENDING", "32"))
+
+    # 체크리스트/쉬운 계약서 파이프라인 실행기: langgraph(기본) 또는 inline(LangGraph 없이 노드를 직접 호출, 결과 동일)
+    PIPELINE_EXECUTOR: str = os.getenv("PIPELINE_EXECUTOR", "langgraph").strip().lower()
+
 settings = Settings()
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import httpx
+
+from app.core.errors import CircuitBreakerOpen
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+StateListener = Callable[["CircuitBreaker", str, str], None]
+
+
+def is_http_dependency_failure(exc: Exception) -> bool:
+    """의존 서비스 자체의 장애로 볼 오류 (타임아웃/연결 오류/5xx). 4xx 는 서비스가 살아 있다는 뜻이다."""
+    if isinstance(exc, httpx.TimeoutException | httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code if exc.response is not None else 0
+        return 500 <= status <= 599
+    return False
+
+
+class CircuitBreaker:
+    """외부 의존성 하나에 대한 서킷 브레이커 (closed -> open -> half_open -> closed).
+
+    최근 window_sec 동안 호출이 min_calls 이상이고 실패율이 failure_rate_threshold 이상이면 open.
+    open 상태에서는 호출하지 않고 CircuitBreakerOpen 을 던지며, open_sec 가 지나면 half_open 으로 바뀌어
+    시험 호출(half_open_max_calls 개)의 결과로 다시 닫거나 연다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        window_sec: float = 30.0,
+        min_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        open_sec: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.window_sec = max(window_sec, 1.0)
+        self.min_calls = max(1, min_calls)
+        self.failure_rate_threshold = failure_rate_threshold
+        self.open_sec = max(open_sec, 0.0)
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self._clock = clock
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        # 1초 단위 버킷: [초, 전체 호출 수, 실패 수]
+        self._buckets: deque[list[int]] = deque()
+        self._listeners: list[StateListener] = []
+
+    @property
+    def state(self) -> str:
+        if self._state == STATE_OPEN and self._clock() - self._opened_at >= self.open_sec:
+            self._transition(STATE_HALF_OPEN)
+        return self._state
+
+    @property
+    def retry_after_sec(self) -> float:
+        if self._state != STATE_OPEN:
+            return 0.0
+        return max(0.0, self.open_sec - (self._clock() - self._opened_at))
+
+    def add_listener(self, listener: StateListener) -> None:
+        self._listeners.append(listener)
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == STATE_OPEN:
+            raise CircuitBreakerOpen(service=self.name, retry_after_sec=self.retry_after_sec)
+        if state == STATE_HALF_OPEN:
+            if self._half_open_in_flight >= self.half_open_max_calls:
+                raise CircuitBreakerOpen(service=self.name, retry_after_sec=self.open_sec)
+            self._half_open_in_flight += 1
+
+    def record_success(self) -> None:
+        if self._state == STATE_HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+            self._buckets.clear()
+            self._transition(STATE_CLOSED)
+            return
+        self._record(failed=False)
+
+    def record_failure(self) -> None:
+        if self._state == STATE_HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+            self._open()
+            return
+        self._record(failed=True)
+        if self._state == STATE_CLOSED and self._should_open():
+            self._open()
+
+    def release(self) -> None:
+        """결과를 판정할 수 없는 호출(취소 등)이 half_open 시험 슬롯을 돌려준다."""
+        if self._state == STATE_HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    async def call(self, operation: Callable[[], Awaitable[T]], *, is_failure: Callable[[Exception], bool]) -> T:
+        self.before_call()
+        try:
+            result = await operation()
+        except Exception as exc:
+            if is_failure(exc):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.record_success()
+        return result
+
+    def _record(self, *, failed: bool) -> None:
+        now = int(self._clock())
+        if self._buckets and self._buckets[-1][0] == now:
+            bucket = self._buckets[-1]
+        else:
+            bucket = [now, 0, 0]
+            self._buckets.append(bucket)
+        bucket[1] += 1
+        if failed:
+            bucket[2] += 1
+        self._expire(now)
+
+    def _expire(self, now: int) -> None:
+        while self._buckets and self._buckets[0][0] <= now - self.window_sec:
+            self._buckets.popleft()
+
+    def _should_open(self) -> bool:
+        total = sum(b[1] for b in self._buckets)
+        if total < self.min_calls:
+            return False
+        failures = sum(b[2] for b in self._buckets)
+        return failures / total >= self.failure_rate_threshold
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._buckets.clear()
+        self._transition(STATE_OPEN)
+
+    def _transition(self, new_state: str) -> None:
+        old_state = self._state
+        if old_state == new_state and new_state != STATE_OPEN:
+            return
+        self._state = new_state
+        if new_state != STATE_HALF_OPEN:
+            self._half_open_in_flight = 0
+        logger.warning(
+            "서킷 브레이커 상태 변경",
+            extra={"service": self.name, "from_state": old_state, "to_state": new_state},
+        )
+        for listener in self._listeners:
+            try:
+                listener(self, old_state, new_state)
+            except Exception:
+                logger.exception("서킷 브레이커 리스너 실행 실패", extra={"service": self.name})
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyHistogram:
+    """로그 간격 버킷 기반 온라인 지연시간 히스토그램.
+
+    샘플이 max_samples 에 도달하면 모든 버킷을 절반으로 줄여 최근 분포에 가중치를 둔다.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_sec: float = 0.001,
+        max_sec: float = 1200.0,
+        growth: float = 1.2,
+        max_samples: int = 2000,
+    ) -> None:
+        count = int(math.ceil(math.log(max_sec / min_sec) / math.log(growth))) + 1
+        self._bounds = [min_sec * (growth**i) for i in range(count)]
+        self._counts = [0] * (count + 1)
+        self._total = 0
+        self._max_samples = max(10, max_samples)
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def record(self, latency_sec: float) -> None:
+        self._counts[bisect.bisect_left(self._bounds, latency_sec)] += 1
+        self._total += 1
+        if self._total >= self._max_samples:
+            self._counts = [c // 2 for c in self._counts]
+            self._total = sum(self._counts)
+
+    def percentile(self, q: float) -> float | None:
+        if self._total <= 0:
+            return None
+        rank = max(1, math.ceil(self._total * min(max(q, 0.0), 1.0)))
+        seen = 0
+        for idx, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return self._bounds[min(idx, len(self._bounds) - 1)]
+        return self._bounds[-1]
+
+
+class HedgingPolicy:
+    """느린 호출에 대한 헤지(중복 요청) 정책.
+
+    키별 지연시간의 percentile 만큼 기다려도 응답이 없으면 같은 요청을 한 번 더 보내고 먼저 끝난 결과를 쓴다.
+    헤지는 예산(요청당 max_hedge_ratio 토큰 적립, 헤지 1회에 1토큰)이 있을 때만 보내므로
+    max_hedge_ratio <= 1 이면 부하가 2배를 넘지 않는다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        percentile: float = 0.95,
+        min_delay_sec: float = 0.5,
+        max_hedge_ratio: float = 0.1,
+        min_samples: int = 20,
+        max_budget_tokens: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.percentile = percentile
+        self.min_delay_sec = max(min_delay_sec, 0.0)
+        self.max_hedge_ratio = min(max(max_hedge_ratio, 0.0), 1.0)
+        self.min_samples = max(1, min_samples)
+        self.max_budget_tokens = max(max_budget_tokens, 1.0)
+        self._clock = clock
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._budget_tokens = 0.0
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def _histogram(self, key: str) -> LatencyHistogram:
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram()
+        return histogram
+
+    def hedge_delay(self, key: str) -> float | None:
+        histogram = self._histograms.get(key)
+        if histogram is None or histogram.total < self.min_samples:
+            return None
+        value = histogram.percentile(self.percentile)
+        if value is None:
+            return None
+        return max(value, self.min_delay_sec)
+
+    def record(self, key: str, latency_sec: float) -> None:
+        self._histogram(key).record(latency_sec)
+
+    def _try_spend(self) -> bool:
+        if self._budget_tokens < 1.0:
+            return False
+        self._budget_tokens -= 1.0
+        return True
+
+    async def run(self, key: str, operation: Callable[[], Awaitable[T]]) -> T:
+        self.requests += 1
+        self._budget_tokens = min(self._budget_tokens + self.max_hedge_ratio, self.max_budget_tokens)
+
+        delay = self.hedge_delay(key)
+        started = self._clock()
+        primary = asyncio.ensure_future(operation())
+        if delay is None:
+            result = await primary
+            self.record(key, self._clock() - started)
+            return result
+
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done or not self._try_spend():
+            result = await primary
+            self.record(key, self._clock() - started)
+            return result
+
+        self.hedges += 1
+        logger.info("지연 요청 헤지 전송", extra={"hedge": self.name, "hedge_key": key, "delay_sec": delay})
+        hedge = asyncio.ensure_future(operation())
+        return await self._first_success(key, started, primary, hedge)
+
+    async def _first_success(self, key: str, started: float, primary: asyncio.Future[T], hedge: asyncio.Future[T]) -> T:
+        pending = {primary, hedge}
+        first_error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        first_error = first_error or (task.exception() if not task.cancelled() else None)
+                        continue
+                    if task is hedge:
+                        self.hedge_wins += 1
+                    # 원 요청이 percentile 을 넘겨 끝났다는 사실 자체가 분포 정보이므로 전체 경과 시간을 기록한다
+                    self.record(key, self._clock() - started)
+                    return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            for task in pending:
+                with contextlib.suppress(BaseException):
+                    await task
+        if first_error is not None:
+            raise first_error
+        raise asyncio.CancelledError()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+
+from app.resources.hf.tokenizer import TokenCounter
+
+_OMITTED_MARKER = "...(중간 일부 생략)..."
+
+_NOISE_LINE = re.compile(r"^[\W_]*$|^[-–—\s]*\d{1,3}[-–—\s]*$")
+_HAS_DIGIT = re.compile(r"\d")
+_KEY_TERMS = (
+    "보증금", "차임", "월세", "관리비", "특약", "위약", "해지", "해제", "원상복구", "수리", "하자",
+    "임대인", "임차인", "기간", "소유", "근저당", "가등기", "가처분", "가압류", "압류", "경매", "신탁",
+)
+
+
+def _line_value(line: str, seen: set[str]) -> int:
+    """줄의 정보 가치 (0: 잡음/중복, 1: 짧은 서술, 2: 일반, 3: 숫자/핵심어 포함)."""
+    stripped = line.strip()
+    if not stripped or _NOISE_LINE.match(stripped) or stripped in seen:
+        return 0
+    if _HAS_DIGIT.search(stripped) or any(term in stripped for term in _KEY_TERMS):
+        return 3
+    if len(stripped) < 8:
+        return 1
+    return 2
+
+
+class PromptBudgeter:
+    """토큰 예산(컨텍스트 길이 - max_tokens - 프롬프트 고정부)에 맞춰 본문을 줄 단위로 채운다."""
+
+    def __init__(
+        self,
+        counter: TokenCounter,
+        *,
+        context_window: int,
+        prompt_budget: int = 0,
+        safety_margin: int = 64,
+    ) -> None:
+        self.counter = counter
+        self.context_window = context_window
+        self.prompt_budget = prompt_budget
+        self.safety_margin = max(0, safety_margin)
+
+    def available_tokens(self, overhead_messages: list[dict[str, str]], max_tokens: int) -> int:
+        limit = self.context_window - max_tokens
+        if self.prompt_budget > 0:
+            limit = min(limit, self.prompt_budget)
+        return max(0, limit - self.counter.count_messages(overhead_messages) - self.safety_margin)
+
+    def fit(
+        self,
+        text: str,
+        *,
+        build_messages: Callable[[str], list[dict[str, str]]],
+        max_tokens: int,
+        head_ratio: float = 1.0,
+    ) -> str:
+        budget = self.available_tokens(build_messages(""), max_tokens)
+        if self.counter.count(text) <= budget:
+            return text
+
+        lines = text.split("\n")
+        seen: set[str] = set()
+        values: list[int] = []
+        for line in lines:
+            values.append(_line_value(line, seen))
+            seen.add(line.strip())
+        counts = [self.counter.count(line) + 1 for line in lines]
+
+        # 가치가 낮은 줄부터 버린다 (같은 가치면 뒤쪽 줄부터)
+        keep = [True] * len(lines)
+        total = sum(counts)
+        for idx in sorted(range(len(lines)), key=lambda i: (values[i], -i)):
+            if total <= budget or values[idx] >= 2:
+                break
+            keep[idx] = False
+            total -= counts[idx]
+
+        kept = [i for i in range(len(lines)) if keep[i]]
+        if total <= budget:
+            return "\n".join(lines[i] for i in kept)
+        return self._head_tail(lines, counts, kept, budget, head_ratio)
+
+    def _head_tail(
+        self,
+        lines: list[str],
+        counts: list[int],
+        kept: list[int],
+        budget: int,
+        head_ratio: float,
+    ) -> str:
+        budget = max(0, budget - self.counter.count(_OMITTED_MARKER) - 2)
+        head_budget = int(budget * min(max(head_ratio, 0.0), 1.0))
+        tail_budget = budget - head_budget
+
+        if len(kept) == 1:
+            # 한 줄이 예산보다 큰 경우: 글자 비율로 자른다
+            return _cut(lines[kept[0]], counts[kept[0]], budget)
+
+        # 앞/뒤에서 처음 만나는 줄이 혼자 예산을 넘으면 그 줄을 자기 몫만큼 잘라 넣고 나머지 줄로 반대쪽을 채운다
+        head: list[str] = []
+        head_set: set[int] = set()
+        truncated = False
+        used = 0
+        for i in kept:
+            if used + counts[i] > head_budget:
+                if not head and head_budget > 0:
+                    head.append(_cut(lines[i], counts[i], head_budget))
+                    head_set.add(i)
+                    truncated = True
+                break
+            head.append(lines[i])
+            head_set.add(i)
+            used += counts[i]
+
+        tail: list[str] = []
+        used = 0
+        for i in reversed(kept):
+            if i in head_set:
+                break
+            if used + counts[i] > tail_budget:
+                if not tail and tail_budget > 0:
+                    tail.append(_cut(lines[i], counts[i], tail_budget, keep_end=True))
+                break
+            tail.append(lines[i])
+            used += counts[i]
+        tail.reverse()
+
+        parts = head
+        if tail or truncated or len(head_set) < len(kept):
+            parts.append(_OMITTED_MARKER)
+        parts.extend(tail)
+        return "\n".join(parts)
+
+
+def _cut(line: str, count: int, budget: int, *, keep_end: bool = False) -> str:
+    """토큰 수 대비 글자 비율로 줄을 예산에 맞게 자른다 (keep_end 면 줄의 끝부분을 남긴다)."""
+    keep = int(len(line) * budget / max(count, 1))
+    return line[len(line) - keep :] if keep_end else line[:keep]
@@ -1,5 +1,4 @@
 import re
-from bs4 import BeautifulSoup
 
 def normalize_text(s: str) -> str:
     s = s.replace("\u00a0", " ")
@@ -23,6 +22,8 @@ def table_to_text(table_tag) -> str:
     return "\n".join(rows).strip()
 
 def html_to_plain_text(html: str) -> str:
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "lxml")
 
     for img in soup.find_all("img"):
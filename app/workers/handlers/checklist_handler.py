@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Any
 
 from aio_pika.abc import AbstractIncomingMessage
 
-from app.core.errors import ExternalServiceRetryExhausted
+from app.core.errors import CircuitBreakerOpen, ExternalServiceRetryExhausted
+from app.core.loop_monitor import bind_correlation_id
+from app.core.metrics import WORKER_HANDLER_OUTCOMES
 from app.resources.rabbitmq.codec import decode_json_message, now_utc_iso, parse_checklist_request
 from app.resources.rabbitmq.result_publisher import RabbitMQResultPublisher
+from app.services.checklist_batcher import ChecklistBatcher
 from app.services.checklist_service import ChecklistService
+from app.services.idempotency import IdempotencyClaim, IdempotencyGuard
 from app.utils.error_messages import format_task_error
 
 logger = logging.getLogger(__name__)
@@ -19,17 +25,36 @@ class ChecklistMessageHandler:
         *,
         checklist_service: ChecklistService,
         result_publisher: RabbitMQResultPublisher,
+        idempotency: IdempotencyGuard | None = None,
+        batcher: ChecklistBatcher | None = None,
     ) -> None:
         self.checklist_service = checklist_service
         self.result_publisher = result_publisher
+        self.idempotency = idempotency
+        self.batcher = batcher
 
     async def handle(self, message: AbstractIncomingMessage) -> None:
+        outcome = "error"
+        try:
+            outcome = await self._handle(message)
+        except CircuitBreakerOpen:
+            outcome = "breaker_open"
+            raise
+        except asyncio.CancelledError:
+            outcome = "interrupted"
+            raise
+        finally:
+            WORKER_HANDLER_OUTCOMES.labels("checklist", outcome).inc()
+
+    async def _handle(self, message: AbstractIncomingMessage) -> str:
         correlation_id = self._fallback_correlation_id(message)
         template_id = -1
         member_id = -1
         success = False
         checklists: list[str] = []
         error_message: str | None = "체크리스트 생성에 실패했습니다."
+        outcome = "failed"
+        claim: IdempotencyClaim | None = None
 
         logger.info(
             "체크리스트 요청 메시지 수신",
@@ -48,26 +73,53 @@ class ChecklistMessageHandler:
             member_id = self._extract_int_candidate(payload, "member_id", member_id)
             request = parse_checklist_request(payload)
             correlation_id = request["correlation_id"]
+            bind_correlation_id(correlation_id)
             template_id = request["template_id"]
             member_id = request["member_id"]
             keywords = request["keywords"]
 
-            checklists = await self.checklist_service.generate(template_id=template_id, keywords=keywords)
+            claim = await self._claim(correlation_id)
+            if claim is not None and claim.is_duplicate:
+                await self._publish_duplicate_result(claim.result, correlation_id=correlation_id, message=message)
+                return "duplicate"
+
+            checklists = await self._generate(template_id=template_id, keywords=keywords)
             success = True
             error_message = None
+            outcome = "success"
 
         except ValueError as exc:
             success = False
             checklists = []
             error_message = format_task_error("체크리스트 생성", exc)
+            outcome = "invalid_request"
         except ExternalServiceRetryExhausted as exc:
             success = False
             checklists = []
             error_message = str(exc)
+            outcome = "retry_exhausted"
+        except (asyncio.CancelledError, CircuitBreakerOpen):
+            await self._complete_claim(claim, None)
+            raise
         except Exception:
             logger.exception("체크리스트 메시지 처리 실패")
+            await self._complete_claim(claim, None)
             raise
 
+        # 외부 서비스 오류 등 실패 결과는 재처리 시 달라질 수 있어 성공 결과만 남긴다
+        await self._complete_claim(
+            claim,
+            {
+                "template_id": template_id,
+                "member_id": member_id,
+                "success": success,
+                "checklists": checklists,
+                "error_message": error_message,
+            }
+            if success
+            else None,
+        )
+
         publish_ok = await self._publish_result(
             correlation_id=correlation_id,
             template_id=template_id,
@@ -77,6 +129,55 @@ class ChecklistMessageHandler:
             error_message=error_message,
             message=message,
         )
+        await self._settle(message, publish_ok)
+        return outcome
+
+    async def _generate(self, *, template_id: int, keywords: list[str]) -> list[str]:
+        if self.batcher is not None:
+            return await self.batcher.generate(template_id=template_id, keywords=keywords)
+        return await self.checklist_service.generate(template_id=template_id, keywords=keywords)
+
+    async def _claim(self, correlation_id: str) -> IdempotencyClaim | None:
+        if self.idempotency is None:
+            return None
+        return await self.idempotency.claim(f"checklist:{correlation_id}")
+
+    async def _complete_claim(self, claim: IdempotencyClaim | None, result: dict[str, Any] | None) -> None:
+        if self.idempotency is not None and claim is not None:
+            await self.idempotency.complete(claim, result)
+
+    async def _publish_duplicate_result(
+        self,
+        result: dict[str, Any],
+        *,
+        correlation_id: str,
+        message: AbstractIncomingMessage,
+    ) -> None:
+        template_id = int(result.get("template_id", -1))
+        member_id = int(result.get("member_id", -1))
+        logger.info(
+            "중복 체크리스트 요청에 저장된 결과 재발행",
+            extra={
+                "correlation_id": correlation_id,
+                "template_id": template_id,
+                "member_id": member_id,
+                "message_id": message.message_id,
+                "redelivered": message.redelivered,
+                "event_time": now_utc_iso(),
+            },
+        )
+        publish_ok = await self._publish_result(
+            correlation_id=correlation_id,
+            template_id=template_id,
+            member_id=member_id,
+            success=bool(result.get("success")),
+            checklists=list(result.get("checklists") or []),
+            error_message=result.get("error_message"),
+            message=message,
+        )
+        await self._settle(message, publish_ok)
+
+    async def _settle(self, message: AbstractIncomingMessage, publish_ok: bool) -> None:
         if publish_ok and not message.processed:
             await message.ack()
         elif not publish_ok and not message.processed:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any
@@ -8,7 +9,10 @@ from urllib.parse import urlparse
 import httpx
 from aio_pika.abc import AbstractIncomingMessage
 
-from app.core.errors import ExternalServiceRetryExhausted
+from app.core.errors import CircuitBreakerOpen, ExternalServiceRetryExhausted
+from app.core.loop_monitor import bind_correlation_id
+from app.core.metrics import WORKER_HANDLER_OUTCOMES
+from app.core.tracing import start_span
 from app.resources.rabbitmq.codec import (
     decode_json_message,
     now_utc_iso,
@@ -21,6 +25,7 @@ from app.services.easy_contract_service import (
     EasyContractService,
     NotLeaseContract,
 )
+from app.services.idempotency import IdempotencyClaim, IdempotencyGuard
 from app.utils.error_messages import format_task_error
 
 logger = logging.getLogger(__name__)
@@ -34,20 +39,39 @@ class EasyContractMessageHandler:
         easy_contract_service: EasyContractService,
         result_publisher: RabbitMQResultPublisher,
         cancel_registry: CancelRegistry,
+        idempotency: IdempotencyGuard | None = None,
     ) -> None:
         self.http = http
         self.easy_contract_service = easy_contract_service
         self.result_publisher = result_publisher
         self.cancel_registry = cancel_registry
+        self.idempotency = idempotency
 
     async def handle(self, message: AbstractIncomingMessage) -> None:
+        outcome = "error"
+        try:
+            outcome = await self._handle(message)
+        except CircuitBreakerOpen:
+            outcome = "breaker_open"
+            raise
+        except asyncio.CancelledError:
+            outcome = "interrupted"
+            raise
+        finally:
+            WORKER_HANDLER_OUTCOMES.labels("easy_contract", outcome).inc()
+
+    async def _handle(self, message: AbstractIncomingMessage) -> str:
         correlation_id = self._fallback_correlation_id(message)
         easy_contract_id = -1
         member_id = -1
         success = False
         content: str | None = None
         error_message: str | None = "쉬운 계약서 생성에 실패했습니다."
+        outcome = "failed"
         cancelled = False
+        # 재처리해도 결과가 같은 경우(성공/계약서 아님)만 멱등성 저장소에 남긴다
+        terminal = False
+        claim: IdempotencyClaim | None = None
 
         logger.info(
             "쉬운 계약서 요청 메시지 수신",
@@ -66,8 +90,15 @@ class EasyContractMessageHandler:
             member_id = self._extract_int_candidate(payload, "member_id", member_id)
             request = parse_easy_contract_request(payload)
             correlation_id = request["correlation_id"]
+            bind_correlation_id(correlation_id)
             easy_contract_id = request["easy_contract_id"]
             member_id = request["member_id"]
+
+            claim = await self._claim(correlation_id)
+            if claim is not None and claim.is_duplicate:
+                await self._publish_duplicate_result(claim.result, correlation_id=correlation_id, message=message)
+                return "duplicate"
+
             docs = await self._extract_docs(request)
 
             if self.cancel_registry.is_cancelled(easy_contract_id):
@@ -104,6 +135,8 @@ class EasyContractMessageHandler:
                     success = True
                     content = markdown
                     error_message = None
+                    outcome = "success"
+                    terminal = True
 
         except EasyContractCancelled:
             cancelled = True
@@ -111,21 +144,46 @@ class EasyContractMessageHandler:
             success = False
             content = None
             error_message = str(exc)
+            outcome = "not_lease_contract"
+            terminal = True
         except ValueError as exc:
             success = False
             content = None
             error_message = format_task_error("쉬운 계약서 생성", exc)
+            outcome = "invalid_request"
         except ExternalServiceRetryExhausted as exc:
             success = False
             content = None
             error_message = str(exc)
+            outcome = "retry_exhausted"
+        except (asyncio.CancelledError, CircuitBreakerOpen):
+            await self._complete_claim(claim, None)
+            raise
         except Exception:
             logger.exception("쉬운 계약서 메시지 처리 실패")
+            await self._complete_claim(claim, None)
             raise
 
         if easy_contract_id >= 0 and self.cancel_registry.is_cancelled(easy_contract_id):
             cancelled = True
 
+        # 여기까지 온 메시지는 결과와 상관없이 다시 처리되지 않으므로 중간 결과를 남기지 않는다
+        # (성공/계약서 아님/취소는 서비스가 이미 지웠고, 최종 실패는 여기서 지운다)
+        await self.easy_contract_service.discard_checkpoint(easy_contract_id, correlation_id)
+
+        await self._complete_claim(
+            claim,
+            {
+                "easy_contract_id": easy_contract_id,
+                "member_id": member_id,
+                "success": success,
+                "content": content,
+                "error_message": error_message,
+            }
+            if terminal and not cancelled
+            else None,
+        )
+
         if cancelled:
             logger.info(
                 "취소된 쉬운 계약서 요청으로 응답 메시지 발행 생략",
@@ -138,7 +196,7 @@ class EasyContractMessageHandler:
             )
             if not message.processed:
                 await message.ack()
-            return
+            return "cancelled"
 
         publish_ok = await self._publish_result(
             correlation_id=correlation_id,
@@ -149,6 +207,55 @@ class EasyContractMessageHandler:
             error_message=error_message,
             message=message,
         )
+        await self._settle(message, publish_ok)
+        return outcome
+
+    async def _claim(self, correlation_id: str) -> IdempotencyClaim | None:
+        if self.idempotency is None:
+            return None
+        return await self.idempotency.claim(f"easy-contract:{correlation_id}")
+
+    async def _complete_claim(self, claim: IdempotencyClaim | None, result: dict[str, Any] | None) -> None:
+        if self.idempotency is not None and claim is not None:
+            await self.idempotency.complete(claim, result)
+
+    async def _publish_duplicate_result(
+        self,
+        result: dict[str, Any],
+        *,
+        correlation_id: str,
+        message: AbstractIncomingMessage,
+    ) -> None:
+        easy_contract_id = int(result.get("easy_contract_id", -1))
+        member_id = int(result.get("member_id", -1))
+        logger.info(
+            "중복 쉬운 계약서 요청에 저장된 결과 재발행",
+            extra={
+                "correlation_id": correlation_id,
+                "easy_contract_id": easy_contract_id,
+                "member_id": member_id,
+                "message_id": message.message_id,
+                "redelivered": message.redelivered,
+                "event_time": now_utc_iso(),
+            },
+        )
+        if self.cancel_registry.is_cancelled(easy_contract_id):
+            if not message.processed:
+                await message.ack()
+            return
+
+        publish_ok = await self._publish_result(
+            correlation_id=correlation_id,
+            easy_contract_id=easy_contract_id,
+            member_id=member_id,
+            success=bool(result.get("success")),
+            content=result.get("content"),
+            error_message=result.get("error_message"),
+            message=message,
+        )
+        await self._settle(message, publish_ok)
+
+    async def _settle(self, message: AbstractIncomingMessage, publish_ok: bool) -> None:
         if publish_ok and not message.processed:
             await message.ack()
         elif not publish_ok and not message.processed:
@@ -235,7 +342,9 @@ class EasyContractMessageHandler:
             url = file_meta["url"]
             doc_type = file_meta["doc_type"]
             filename = file_meta["filename"] or self._filename_from_url(url) or f"file_{idx}"
-            file_bytes = await self._download(url)
+            with start_span("download", attributes={"doc.index": idx, "doc.type": doc_type}) as span:
+                file_bytes = await self._download(url)
+                span.set_attribute("doc.bytes", len(file_bytes))
             if not file_bytes:
                 raise ValueError("비어있는 파일은 처리할 수 없습니다.")
             docs.append({"filename": filename, "bytes": file_bytes, "doc_type": doc_type})
@@ -2,20 +2,34 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from typing import Any
 
 from aio_pika.abc import AbstractIncomingMessage
+from opentelemetry.trace import SpanKind
 
+from app.core.errors import CircuitBreakerOpen
+from app.core.metrics import (
+    WORKER_HANDOFFS_TOTAL,
+    WORKER_MESSAGE_SECONDS,
+    WORKER_MESSAGES_IN_FLIGHT,
+)
+from app.core.tracing import extract_context, start_span
 from app.resources.rabbitmq.client import RabbitMQClient
 from app.resources.rabbitmq.codec import decode_json_message
 from app.resources.rabbitmq.result_publisher import RabbitMQResultPublisher
+from app.utils.circuit_breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, CircuitBreaker
 from app.utils.error_messages import format_task_error
 
 logger = logging.getLogger(__name__)
 
 MessageHandler = Callable[[AbstractIncomingMessage], Awaitable[None]]
 
+_LATENCY_EWMA_ALPHA = 0.2
+# 드레인 시간 초과 후 중단시킨 핸들러가 재적재(nack)를 마칠 때까지 기다리는 시간
+_HANDOFF_TIMEOUT_SEC = 5.0
+
 
 class RabbitMQWorker:
     def __init__(
@@ -31,6 +45,7 @@ class RabbitMQWorker:
         result_publisher: RabbitMQResultPublisher | None = None,
         retry_max_attempts: int = 3,
         retry_backoff_base_sec: float = 0.5,
+        prefetch_counts: dict[str, int] | None = None,
     ) -> None:
         self.client = client
         self.easy_contract_queue = easy_contract_queue
@@ -42,31 +57,242 @@ class RabbitMQWorker:
         self.result_publisher = result_publisher
         self.retry_max_attempts = max(1, retry_max_attempts)
         self.retry_backoff_base_sec = max(retry_backoff_base_sec, 0.0)
+        # 큐별 prefetch (없으면 클라이언트 기본 채널 prefetch 사용)
+        self.prefetch_counts = dict(prefetch_counts or {})
         self._consumer_tags: dict[str, str] = {}
         self._started = False
+        # prefetch 조절/오토스케일 판단용 큐별 처리 현황
+        self._in_flight: dict[str, int] = {}
+        self._latency_ewma_sec: dict[str, float] = {}
+        self._handlers: dict[str, MessageHandler] = {
+            easy_contract_queue: easy_contract_handler,
+            checklist_queue: checklist_handler,
+            easy_contract_cancel_queue: easy_contract_cancel_handler,
+        }
+        # 서킷 브레이커가 열려 있는 동안 소비를 멈출 큐 (브레이커 이름 -> 큐 목록)
+        self._breaker_queues: dict[str, list[str]] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        # half_open 시험 호출을 위해 prefetch 1 로 재개한 큐 (브레이커 이름 -> 큐)
+        self._probe_queues: dict[str, str] = {}
+        self._pause_reasons: dict[str, set[str]] = {}
+        self._breaker_tasks: set[asyncio.Task] = set()
+        self._consumer_lock = asyncio.Lock()
+        # 처리 중인 메시지가 하나도 없을 때 set (drain 대기용)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._handler_tasks: set[asyncio.Task] = set()
+        # drain 시간 초과로 처리 중인 메시지를 다른 레플리카에 넘기는 중
+        self._handing_off = False
+
+    def pause_while_open(self, breaker: CircuitBreaker, queue_names: list[str]) -> None:
+        """breaker 가 닫혀 있지 않은 동안 queue_names 소비를 멈춘다. half_open 시험 호출은 목록 앞쪽 큐가 맡는다."""
+        self._breaker_queues[breaker.name] = list(queue_names)
+        self._breakers[breaker.name] = breaker
+        breaker.add_listener(self._on_breaker_state_change)
 
     async def start(self) -> None:
         if self._started:
             return
 
-        self._consumer_tags[self.easy_contract_queue] = await self.client.consume(
-            self.easy_contract_queue,
-            self._wrap_handler(self.easy_contract_handler, queue_name=self.easy_contract_queue),
+        for queue_name in self._handlers:
+            if not self._pause_reasons.get(queue_name):
+                await self._consume(queue_name)
+        self._started = True
+        logger.info("래빗엠큐 워커 시작")
+
+    async def _consume(self, queue_name: str, *, prefetch_count: int | None = None) -> None:
+        self._consumer_tags[queue_name] = await self.client.consume(
+            queue_name,
+            self._wrap_handler(self._handlers[queue_name], queue_name=queue_name),
+            prefetch_count=prefetch_count or self.prefetch_counts.get(queue_name),
         )
-        self._consumer_tags[self.checklist_queue] = await self.client.consume(
-            self.checklist_queue,
-            self._wrap_handler(self.checklist_handler, queue_name=self.checklist_queue),
+
+    def in_flight(self, queue_name: str) -> int:
+        return self._in_flight.get(queue_name, 0)
+
+    def total_in_flight(self) -> int:
+        return sum(self._in_flight.values())
+
+    def latency_ewma_sec(self, queue_name: str) -> float | None:
+        return self._latency_ewma_sec.get(queue_name)
+
+    def prefetch_for(self, queue_name: str) -> int:
+        return self.prefetch_counts.get(queue_name) or self.client.prefetch_count
+
+    async def set_prefetch(self, queue_name: str, prefetch_count: int) -> None:
+        """큐 컨슈머의 prefetch 를 바꾼다. 새 값은 컨슈머를 다시 등록해야 적용된다."""
+        async with self._consumer_lock:
+            if self.prefetch_counts.get(queue_name) == prefetch_count:
+                return
+            self.prefetch_counts[queue_name] = prefetch_count
+            if queue_name in self._probe_queues.values():
+                # 시험 호출 중에는 prefetch 1 을 유지하고, 브레이커가 닫히면 새 값으로 재개한다
+                return
+            consumer_tag = self._consumer_tags.pop(queue_name, None)
+            if consumer_tag is None:
+                return
+            # 이미 받은 메시지는 같은 채널에서 그대로 ack 되므로 컨슈머만 바꿔 끼운다
+            await self.client.cancel_consumer(queue_name, consumer_tag)
+            await self._consume(queue_name)
+
+    def _record_done(self, queue_name: str, elapsed_sec: float) -> None:
+        self._in_flight[queue_name] = max(0, self._in_flight.get(queue_name, 1) - 1)
+        if self.total_in_flight() == 0:
+            self._idle.set()
+        previous = self._latency_ewma_sec.get(queue_name)
+        self._latency_ewma_sec[queue_name] = (
+            elapsed_sec if previous is None else previous + _LATENCY_EWMA_ALPHA * (elapsed_sec - previous)
         )
-        self._consumer_tags[self.easy_contract_cancel_queue] = await self.client.consume(
-            self.easy_contract_cancel_queue,
-            self._wrap_handler(self.easy_contract_cancel_handler, queue_name=self.easy_contract_cancel_queue),
+
+    def _on_breaker_state_change(self, breaker: CircuitBreaker, old_state: str, new_state: str) -> None:
+        if new_state == STATE_OPEN:
+            self._spawn_breaker_task(self._pause_for(breaker))
+        elif new_state == STATE_HALF_OPEN:
+            self._spawn_breaker_task(self._probe_for(breaker))
+        elif new_state == STATE_CLOSED:
+            self._spawn_breaker_task(self._resume_for(breaker))
+
+    def _spawn_breaker_task(self, coro: Awaitable[None]) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._breaker_tasks.add(task)
+        task.add_done_callback(self._breaker_tasks.discard)
+
+    async def _pause_for(self, breaker: CircuitBreaker) -> None:
+        queue_names = self._breaker_queues.get(breaker.name, [])
+        async with self._consumer_lock:
+            self._probe_queues.pop(breaker.name, None)
+            for queue_name in queue_names:
+                self._pause_reasons.setdefault(queue_name, set()).add(breaker.name)
+                consumer_tag = self._consumer_tags.pop(queue_name, None)
+                if consumer_tag is None:
+                    continue
+                try:
+                    await self.client.cancel_consumer(queue_name, consumer_tag)
+                except Exception:
+                    logger.exception("래빗엠큐 컨슈머 일시 중지 실패", extra={"queue": queue_name})
+        logger.warning(
+            "의존 서비스 차단으로 메시지 소비 일시 중지",
+            extra={"service": breaker.name, "queues": queue_names, "retry_after_sec": breaker.retry_after_sec},
         )
-        self._started = True
-        logger.info("래빗엠큐 워커 시작")
+
+        # open 시간이 지나면 half_open 으로 넘어가므로 시험 호출용 컨슈머만 등록한다
+        await asyncio.sleep(breaker.retry_after_sec)
+        if breaker.state == STATE_HALF_OPEN:
+            await self._probe_for(breaker)
+
+    async def _probe_for(self, breaker: CircuitBreaker) -> None:
+        """half_open 시험 호출용으로 큐 하나만 prefetch 1 로 재개한다. 나머지 큐는 브레이커가 닫힐 때까지 멈춰 둔다."""
+        async with self._consumer_lock:
+            await self._start_probe(breaker)
+
+    async def _start_probe(self, breaker: CircuitBreaker) -> None:
+        if not self._started or breaker.name in self._probe_queues or breaker.state != STATE_HALF_OPEN:
+            return
+        for queue_name in self._breaker_queues.get(breaker.name, []):
+            # 다른 브레이커 때문에도 멈춘 큐는 시험 호출 전에 막히므로 건너뛴다
+            if self._pause_reasons.get(queue_name) != {breaker.name} or queue_name in self._consumer_tags:
+                continue
+            try:
+                await self._consume(queue_name, prefetch_count=1)
+            except Exception:
+                logger.exception("래빗엠큐 시험 호출 컨슈머 등록 실패", extra={"queue": queue_name})
+                continue
+            self._probe_queues[breaker.name] = queue_name
+            logger.info("시험 호출용 메시지 소비 재개", extra={"service": breaker.name, "queue": queue_name})
+            return
+
+    async def _resume_for(self, breaker: CircuitBreaker) -> None:
+        resumed: list[str] = []
+        async with self._consumer_lock:
+            probe_queue = self._probe_queues.pop(breaker.name, None)
+            for queue_name in self._breaker_queues.get(breaker.name, []):
+                reasons = self._pause_reasons.get(queue_name)
+                if reasons is None or breaker.name not in reasons:
+                    continue
+                reasons.discard(breaker.name)
+                if queue_name == probe_queue:
+                    # prefetch 1 컨슈머를 원래 prefetch 로 바꿔 끼운다
+                    consumer_tag = self._consumer_tags.pop(queue_name, None)
+                    if consumer_tag is not None:
+                        try:
+                            await self.client.cancel_consumer(queue_name, consumer_tag)
+                        except Exception:
+                            logger.exception("래빗엠큐 컨슈머 중지 실패", extra={"queue": queue_name})
+                if reasons or not self._started or queue_name in self._consumer_tags:
+                    continue
+                try:
+                    await self._consume(queue_name)
+                    resumed.append(queue_name)
+                except Exception:
+                    logger.exception("래빗엠큐 컨슈머 재개 실패", extra={"queue": queue_name})
+            # 이 브레이커 때문에 시험 호출할 큐가 없던 다른 브레이커가 이제 시험 호출을 시작할 수 있다
+            for other in self._breakers.values():
+                if other.name != breaker.name:
+                    await self._start_probe(other)
+        if resumed:
+            logger.info("메시지 소비 재개", extra={"service": breaker.name, "queues": resumed})
+
+    def _blocking_breaker(self, queue_name: str) -> CircuitBreaker | None:
+        """이 큐의 메시지를 지금 처리하면 막힐 브레이커. half_open 이면 시험 호출 큐만 통과시킨다."""
+        for name, queue_names in self._breaker_queues.items():
+            if queue_name not in queue_names:
+                continue
+            breaker = self._breakers[name]
+            state = breaker.state
+            if state == STATE_OPEN or (state == STATE_HALF_OPEN and self._probe_queues.get(name) != queue_name):
+                return breaker
+        return None
+
+    async def drain(self, timeout_sec: float) -> bool:
+        """새 메시지 수신을 멈추고, 이미 받은 메시지의 처리(ack/nack)가 끝나길 timeout_sec 까지 기다린다.
+
+        시간 안에 모두 끝나면 True. 끝나지 않은 메시지는 핸들러를 중단시키고 큐에 되돌린다(False).
+        중단된 쉬운 계약서 작업은 단계별 체크포인트가 남아 있어 메시지를 받은 레플리카가 이어서 처리한다.
+        """
+        for task in list(self._breaker_tasks):
+            task.cancel()
+        async with self._consumer_lock:
+            # 브레이커 재개/prefetch 조절이 컨슈머를 다시 등록하지 않게 먼저 내린다
+            self._started = False
+            await self._cancel_consumers()
+
+        in_flight = self.total_in_flight()
+        logger.info("래빗엠큐 워커 드레인 시작", extra={"in_flight": in_flight, "timeout_sec": timeout_sec})
+        if in_flight == 0:
+            return True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=max(timeout_sec, 0.0))
+        except asyncio.TimeoutError:
+            logger.warning(
+                "래빗엠큐 워커 드레인 시간 초과, 처리 중인 메시지 재적재",
+                extra={"in_flight": dict(self._in_flight), "timeout_sec": timeout_sec},
+            )
+            await self._hand_off()
+            return False
+        logger.info("래빗엠큐 워커 드레인 완료")
+        return True
+
+    async def _hand_off(self) -> None:
+        tasks = [task for task in self._handler_tasks if not task.done()]
+        if not tasks:
+            return
+        self._handing_off = True
+        for task in tasks:
+            task.cancel()
+        _, pending = await asyncio.wait(tasks, timeout=_HANDOFF_TIMEOUT_SEC)
+        if pending:
+            logger.error("재적재하지 못한 메시지는 연결 종료 후 브로커가 재전달", extra={"count": len(pending)})
 
     async def stop(self) -> None:
+        for task in list(self._breaker_tasks):
+            task.cancel()
         if not self._started:
             return
+        await self._cancel_consumers()
+        self._started = False
+        logger.info("래빗엠큐 워커 종료")
+
+    async def _cancel_consumers(self) -> None:
         for queue_name, consumer_tag in list(self._consumer_tags.items()):
             try:
                 await self.client.cancel_consumer(queue_name, consumer_tag)
@@ -76,16 +302,63 @@ class RabbitMQWorker:
                     extra={"queue": queue_name, "consumer_tag": consumer_tag},
                 )
         self._consumer_tags.clear()
-        self._started = False
-        logger.info("래빗엠큐 워커 종료")
 
     def _wrap_handler(self, handler: MessageHandler, *, queue_name: str) -> MessageHandler:
+        async def traced(message: AbstractIncomingMessage) -> None:
+            started = time.perf_counter()
+            in_flight = WORKER_MESSAGES_IN_FLIGHT.labels(queue_name)
+            in_flight.inc()
+            self._in_flight[queue_name] = self._in_flight.get(queue_name, 0) + 1
+            self._idle.clear()
+            task = asyncio.current_task()
+            if task is not None:
+                self._handler_tasks.add(task)
+            try:
+                await observed(message)
+            finally:
+                if task is not None:
+                    self._handler_tasks.discard(task)
+                in_flight.dec()
+                # 재시도/백오프를 포함해 ack 또는 nack 이 끝날 때까지의 시간
+                elapsed_sec = time.perf_counter() - started
+                WORKER_MESSAGE_SECONDS.labels(queue_name).observe(elapsed_sec)
+                self._record_done(queue_name, elapsed_sec)
+
+        async def observed(message: AbstractIncomingMessage) -> None:
+            # 발행 측이 헤더에 넣은 trace context 를 부모로 삼는다
+            with start_span(
+                f"{queue_name} process",
+                kind=SpanKind.CONSUMER,
+                context=extract_context(message.headers),
+                attributes={
+                    "messaging.system": "rabbitmq",
+                    "messaging.destination.name": queue_name,
+                    "messaging.message.id": message.message_id,
+                    "messaging.message.conversation_id": message.correlation_id,
+                    "messaging.rabbitmq.redelivered": message.redelivered,
+                },
+            ):
+                await wrapped(message)
+
         async def wrapped(message: AbstractIncomingMessage) -> None:
+            # 컨슈머를 멈추기 전에 받아 둔 메시지는 다운로드/OCR 을 시작하기 전에 되돌린다
+            breaker = self._blocking_breaker(queue_name)
+            if breaker is not None:
+                await self._defer(message, queue_name, service=breaker.name, retry_after_sec=breaker.retry_after_sec)
+                return
             last_exc: Exception | None = None
             for attempt in range(1, self.retry_max_attempts + 1):
                 try:
                     await handler(message)
                     return
+                except CircuitBreakerOpen as exc:
+                    # 의존 서비스가 차단된 상태라 재시도/실패 응답 없이 큐로 되돌린다
+                    await self._defer(message, queue_name, service=exc.service, retry_after_sec=exc.retry_after_sec)
+                    return
+                except asyncio.CancelledError:
+                    if self._handing_off and not message.processed:
+                        await self._requeue_for_handoff(message, queue_name)
+                    raise
                 except Exception as exc:
                     last_exc = exc
                     logger.exception(
@@ -125,7 +398,36 @@ class RabbitMQWorker:
                     extra={"queue": queue_name, "fallback_publish_ok": publish_ok},
                 )
 
-        return wrapped
+        return traced
+
+    async def _defer(
+        self,
+        message: AbstractIncomingMessage,
+        queue_name: str,
+        *,
+        service: str,
+        retry_after_sec: float,
+    ) -> None:
+        # 해당 큐 컨슈머는 멈춰 있으므로 되돌린 메시지가 곧바로 다시 전달되지 않는다
+        logger.warning(
+            "의존 서비스 차단으로 메시지 재적재",
+            extra={"queue": queue_name, "service": service, "retry_after_sec": retry_after_sec},
+        )
+        if not message.processed:
+            await message.nack(requeue=True)
+
+    async def _requeue_for_handoff(self, message: AbstractIncomingMessage, queue_name: str) -> None:
+        # 연결 종료를 기다리지 않고 바로 되돌려 다른 레플리카가 곧바로 받게 한다
+        try:
+            await message.nack(requeue=True)
+        except Exception:
+            logger.exception("드레인 중 메시지 재적재 실패", extra={"queue": queue_name})
+            return
+        WORKER_HANDOFFS_TOTAL.labels(queue_name).inc()
+        logger.info(
+            "드레인 시간 초과로 처리 중이던 메시지 재적재",
+            extra={"queue": queue_name, "correlation_id": message.correlation_id, "message_id": message.message_id},
+        )
 
     async def _publish_fallback_error(
         self,
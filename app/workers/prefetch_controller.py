@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from app.core.metrics import AUTOSCALE_RECOMMENDED_REPLICAS, RABBITMQ_QUEUE_DEPTH, WORKER_PREFETCH
+from app.resources.rabbitmq.client import RabbitMQClient
+from app.utils.circuit_breaker import STATE_CLOSED, CircuitBreaker
+from app.workers.mq_worker import RabbitMQWorker
+
+logger = logging.getLogger(__name__)
+
+# 0 이면 여유, 1 이상이면 포화 (요청이 대기열에 쌓이거나 차단된 상태)
+SaturationProbe = Callable[[], float]
+
+
+def breaker_probe(breaker: CircuitBreaker) -> SaturationProbe:
+    return lambda: 0.0 if breaker.state == STATE_CLOSED else 1.0
+
+
+@dataclass
+class QueueControl:
+    queue_name: str
+    min_prefetch: int
+    max_prefetch: int
+    # 이 큐의 작업이 의존하는 서비스들의 포화도
+    probes: list[SaturationProbe] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class QueueDecision:
+    queue_name: str
+    depth: int
+    consumers: int
+    in_flight: int
+    saturation: float
+    prefetch: int
+    recommended_replicas: int
+
+
+class AdaptivePrefetchController:
+    """큐 적체량, 처리 시간, 의존 서비스 포화도를 보고 prefetch 와 권장 레플리카 수를 조절한다.
+
+    - 의존 서비스가 포화되면 prefetch 를 절반으로 줄인다 (더 받아봐야 대기만 길어진다).
+    - 적체가 있고 받은 만큼 모두 처리 중이면 prefetch 를 1씩 늘린다.
+    - 큐가 비고 여유 슬롯이 절반 이상이면 1씩 줄여 다른 레플리카가 메시지를 가져가게 한다.
+
+    권장 레플리카 수는 Little 법칙으로 (적체 + 처리 중) * 평균 처리 시간 / (prefetch * 목표 소진 시간) 이다.
+    의존 서비스가 포화된 동안에는 늘려도 처리량이 늘지 않으므로 현재 컨슈머 수 이상을 권하지 않는다.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: RabbitMQClient,
+        worker: RabbitMQWorker,
+        queues: list[QueueControl],
+        interval_sec: float,
+        target_drain_sec: float,
+        min_replicas: int = 1,
+        max_replicas: int = 10,
+    ) -> None:
+        self.client = client
+        self.worker = worker
+        self.queues = queues
+        self.interval_sec = max(interval_sec, 1.0)
+        self.target_drain_sec = max(target_drain_sec, 1.0)
+        self.min_replicas = max(1, min_replicas)
+        self.max_replicas = max(self.min_replicas, max_replicas)
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        for control in self.queues:
+            WORKER_PREFETCH.labels(control.queue_name).set(self.worker.prefetch_for(control.queue_name))
+        self._task = asyncio.create_task(self._run(), name="adaptive-prefetch")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_sec)
+            try:
+                await self.tick()
+            except Exception:
+                logger.exception("prefetch 조절 실패")
+
+    async def tick(self) -> list[QueueDecision]:
+        decisions: list[QueueDecision] = []
+        for control in self.queues:
+            depth, consumers = await self.client.queue_stats(control.queue_name)
+            decision = self._decide(control, depth=depth, consumers=consumers)
+            decisions.append(decision)
+
+            RABBITMQ_QUEUE_DEPTH.labels(control.queue_name).set(depth)
+            AUTOSCALE_RECOMMENDED_REPLICAS.labels(control.queue_name).set(decision.recommended_replicas)
+            current = self.worker.prefetch_for(control.queue_name)
+            if decision.prefetch != current:
+                await self.worker.set_prefetch(control.queue_name, decision.prefetch)
+                logger.info(
+                    "컨슈머 prefetch 조절",
+                    extra={
+                        "queue": control.queue_name,
+                        "prefetch_from": current,
+                        "prefetch_to": decision.prefetch,
+                        "queue_depth": depth,
+                        "in_flight": decision.in_flight,
+                        "saturation": decision.saturation,
+                    },
+                )
+            WORKER_PREFETCH.labels(control.queue_name).set(decision.prefetch)
+        return decisions
+
+    def _decide(self, control: QueueControl, *, depth: int, consumers: int) -> QueueDecision:
+        prefetch = self.worker.prefetch_for(control.queue_name)
+        in_flight = self.worker.in_flight(control.queue_name)
+        saturation = max((probe() for probe in control.probes), default=0.0)
+        saturated = saturation >= 1.0
+
+        if saturated:
+            new_prefetch = max(control.min_prefetch, prefetch // 2)
+        elif depth > 0 and in_flight >= prefetch:
+            new_prefetch = min(control.max_prefetch, prefetch + 1)
+        elif depth == 0 and in_flight * 2 <= prefetch:
+            new_prefetch = max(control.min_prefetch, prefetch - 1)
+        else:
+            new_prefetch = min(max(prefetch, control.min_prefetch), control.max_prefetch)
+
+        replicas = max(1, consumers)
+        latency_sec = self.worker.latency_ewma_sec(control.queue_name)
+        if latency_sec is not None:
+            # 모든 레플리카가 같은 prefetch 로 처리한다고 본다
+            work = depth + in_flight * replicas
+            needed = math.ceil(work * latency_sec / (new_prefetch * self.target_drain_sec))
+            recommended = min(needed, replicas) if saturated else needed
+        else:
+            recommended = replicas
+        recommended = min(max(recommended, self.min_replicas), self.max_replicas)
+
+        return QueueDecision(
+            queue_name=control.queue_name,
+            depth=depth,
+            consumers=consumers,
+            in_flight=in_flight,
+            saturation=saturation,
+            prefetch=new_prefetch,
+            recommended_replicas=recommended,
+        )
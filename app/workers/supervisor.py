@@ -0,0 +1,230 @@
+"""메시지 소비 전용 진입점. 컨슈머 프로세스 N 개를 띄우고 죽으면 다시 띄운다.
+
+    APP_ROLE=worker python -m app.workers [--processes 4]
+
+각 컨슈머 프로세스는 자기 AppContainer(브로커 연결, HTTP 풀, CPU 풀)를 가지고 따로 메시지를 소비한다.
+SIGTERM/SIGINT 를 받으면 supervisor 는 자식에게 SIGTERM 을 전달하고, 자식은 새 메시지 수신을 멈춘 뒤
+처리 중인 메시지가 끝날 때까지(WORKER_DRAIN_TIMEOUT_SEC) 기다렸다가 종료한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from dataclasses import dataclass
+from multiprocessing.process import BaseProcess
+from types import FrameType
+
+from app.resources.rabbitmq.client import RabbitMQClient
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 자식 프로세스 종료 코드
+EXIT_CONFIG_ERROR = 2
+EXIT_BROKER_DOWN = 3
+
+_RESTART_BACKOFF_BASE_SEC = 1.0
+_RESTART_BACKOFF_MAX_SEC = 30.0
+# 이 시간 넘게 돌다가 죽었으면 연속 실패로 보지 않고 backoff 를 초기화한다
+_HEALTHY_UPTIME_SEC = 60.0
+_BROKER_CHECK_INTERVAL_SEC = 5.0
+# drain 이후 연결/풀 정리에 주는 여유 시간
+_SHUTDOWN_GRACE_SEC = 10.0
+
+
+def run_consumer_process(index: int) -> None:
+    """spawn 된 자식 프로세스 진입점."""
+    from app.core.tracing import setup_tracing
+    from app.logging_config import setup_json_logging
+
+    setup_json_logging()
+    setup_tracing(
+        enabled=settings.TRACING_ENABLED,
+        service_name=settings.OTEL_SERVICE_NAME,
+        endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT,
+        sample_ratio=settings.TRACING_SAMPLE_RATIO,
+    )
+    raise SystemExit(asyncio.run(_serve(index)))
+
+
+async def _watch_broker(client: RabbitMQClient, down_exit_sec: float) -> None:
+    """브로커 연결이 down_exit_sec 넘게 복구되지 않으면 반환한다 (robust connection 재연결 실패)."""
+    down_since: float | None = None
+    while True:
+        await asyncio.sleep(_BROKER_CHECK_INTERVAL_SEC)
+        if client.is_connected:
+            down_since = None
+            continue
+        if down_since is None:
+            down_since = time.monotonic()
+            logger.warning("래빗엠큐 연결 끊김, 재연결 대기")
+        elif time.monotonic() - down_since >= down_exit_sec:
+            logger.error("래빗엠큐 재연결 실패로 컨슈머 프로세스 재시작", extra={"down_sec": down_exit_sec})
+            return
+
+
+async def _serve(index: int) -> int:
+    from app.bootstrap import create_container
+    from app.core.tracing import shutdown_tracing
+
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    if settings.WORKER_METRICS_PORT > 0:
+        from prometheus_client import start_http_server
+
+        start_http_server(settings.WORKER_METRICS_PORT + index)
+
+    container = await create_container()
+    if container.rabbitmq_worker is None or container.rabbitmq_client is None:
+        logger.error("메시지 소비 설정이 없습니다 (RABBITMQ_ENABLED, APP_ROLE 확인)")
+        await container.aclose()
+        return EXIT_CONFIG_ERROR
+
+    exit_code = 0
+    try:
+        await container.startup()
+        logger.info("컨슈머 프로세스 시작", extra={"worker_index": index, "pid": os.getpid()})
+        stop_task = asyncio.create_task(stop.wait())
+        watch_task = asyncio.create_task(
+            _watch_broker(container.rabbitmq_client, settings.WORKER_BROKER_DOWN_EXIT_SEC)
+        )
+        await asyncio.wait({stop_task, watch_task}, return_when=asyncio.FIRST_COMPLETED)
+        if watch_task.done():
+            exit_code = EXIT_BROKER_DOWN
+        for task in (stop_task, watch_task):
+            task.cancel()
+        logger.info("컨슈머 프로세스 종료 시작", extra={"worker_index": index, "exit_code": exit_code})
+        await container.drain(settings.WORKER_DRAIN_TIMEOUT_SEC)
+    finally:
+        await container.aclose()
+        shutdown_tracing()
+    return exit_code
+
+
+@dataclass
+class _Slot:
+    index: int
+    process: BaseProcess | None = None
+    started_at: float = 0.0
+    failures: int = 0
+    restart_at: float = 0.0
+
+
+class WorkerSupervisor:
+    def __init__(self, *, processes: int, shutdown_timeout_sec: float) -> None:
+        self.processes = max(1, processes)
+        self.shutdown_timeout_sec = max(shutdown_timeout_sec, 0.0)
+        self._ctx = multiprocessing.get_context("spawn")
+        self._slots = [_Slot(index=i) for i in range(self.processes)]
+        self._stopping = False
+        self._exit_code = 0
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self._on_signal)
+        signal.signal(signal.SIGINT, self._on_signal)
+        logger.info("컨슈머 supervisor 시작", extra={"processes": self.processes, "pid": os.getpid()})
+        for slot in self._slots:
+            self._start(slot)
+        while not self._stopping:
+            time.sleep(0.5)
+            self._reap()
+        self._shutdown()
+        return self._exit_code
+
+    def _on_signal(self, signum: int, frame: FrameType | None) -> None:
+        if not self._stopping:
+            logger.info("종료 신호 수신", extra={"signal": signal.Signals(signum).name})
+        self._stopping = True
+
+    def _start(self, slot: _Slot) -> None:
+        process = self._ctx.Process(
+            target=run_consumer_process,
+            args=(slot.index,),
+            name=f"consumer-{slot.index}",
+        )
+        process.start()
+        slot.process = process
+        slot.started_at = time.monotonic()
+        logger.info("컨슈머 프로세스 생성", extra={"worker_index": slot.index, "pid": process.pid})
+
+    def _reap(self) -> None:
+        now = time.monotonic()
+        for slot in self._slots:
+            process = slot.process
+            if process is not None and process.is_alive():
+                continue
+            if process is not None:
+                exit_code = process.exitcode
+                process.close()
+                slot.process = None
+                if exit_code == EXIT_CONFIG_ERROR:
+                    # 설정 오류는 다시 띄워도 같으므로 전체를 내린다
+                    logger.error("컨슈머 프로세스 설정 오류로 supervisor 종료", extra={"worker_index": slot.index})
+                    self._exit_code = EXIT_CONFIG_ERROR
+                    self._stopping = True
+                    return
+                uptime = now - slot.started_at
+                slot.failures = 1 if uptime >= _HEALTHY_UPTIME_SEC else slot.failures + 1
+                backoff = min(_RESTART_BACKOFF_MAX_SEC, _RESTART_BACKOFF_BASE_SEC * 2 ** (slot.failures - 1))
+                slot.restart_at = now + backoff
+                logger.warning(
+                    "컨슈머 프로세스 비정상 종료, 재시작 예약",
+                    extra={
+                        "worker_index": slot.index,
+                        "exit_code": exit_code,
+                        "uptime_sec": round(uptime, 1),
+                        "restart_in_sec": backoff,
+                    },
+                )
+            if now >= slot.restart_at:
+                self._start(slot)
+
+    def _shutdown(self) -> None:
+        alive = [slot.process for slot in self._slots if slot.process is not None and slot.process.is_alive()]
+        for process in alive:
+            if process.pid is not None:
+                os.kill(process.pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.shutdown_timeout_sec
+        for process in alive:
+            process.join(max(0.0, deadline - time.monotonic()))
+        for process in alive:
+            if process.is_alive():
+                logger.warning("컨슈머 프로세스 종료 시간 초과로 강제 종료", extra={"pid": process.pid})
+                process.kill()
+                process.join()
+        logger.info("컨슈머 supervisor 종료")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, default=settings.WORKER_PROCESSES, help="0이면 CPU 코어 수")
+    args = parser.parse_args()
+
+    from app.logging_config import setup_json_logging
+
+    setup_json_logging()
+    if settings.APP_ROLE == "api":
+        logger.error("APP_ROLE=api 에서는 컨슈머를 띄우지 않습니다 (worker 또는 all 로 설정)")
+        raise SystemExit(EXIT_CONFIG_ERROR)
+
+    processes = args.processes or os.cpu_count() or 1
+    if processes > 1 and settings.IDEMPOTENCY_BACKEND != "redis":
+        # 프로세스마다 따로인 memory 저장소로는 같은 메시지를 두 프로세스가 동시에 처리하는 것을 막지 못한다
+        logger.warning(
+            "컨슈머 프로세스가 여럿이면 IDEMPOTENCY_BACKEND=redis 를 권장합니다 (중복 처리 방지가 프로세스 단위로만 동작)",
+            extra={"processes": processes, "idempotency_backend": settings.IDEMPOTENCY_BACKEND},
+        )
+    supervisor = WorkerSupervisor(
+        processes=processes,
+        shutdown_timeout_sec=settings.WORKER_DRAIN_TIMEOUT_SEC + _SHUTDOWN_GRACE_SEC,
+    )
+    raise SystemExit(supervisor.run())
@@ -0,0 +1,147 @@
+"""벤치마크용 합성 한국어 임대차 계약서/등기부등본 픽스처.
+
+실제 문서를 저장소에 두지 않기 위해 고정 시드로 그럴듯한 문서를 생성한다. 같은 인자면 항상 같은 결과가 나온다.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+
+_NAMES = ["김민준", "이서연", "박지호", "최수아", "정도윤", "강하은", "조예준", "윤지우"]
+_BANKS = ["국민은행", "신한", "우리은행", "하나", "농협", "카카오뱅크"]
+_ADDRESSES = [
+    "서울특별시 마포구 월드컵북로 12길 34, 201호",
+    "경기도 성남시 분당구 판교역로 56, 1203동 704호",
+    "부산광역시 해운대구 센텀중앙로 78, 15층 1502호",
+]
+_CLAUSES = [
+    "임차인은 임대인의 동의 없이 목적물의 구조를 변경하거나 전대할 수 없다.",
+    "임차인이 2기의 차임액에 달하도록 연체하는 경우 임대인은 계약을 해지할 수 있다.",
+    "임대차 계약이 종료된 경우 임차인은 목적물을 원상으로 회복하여 임대인에게 반환한다.",
+    "계약 당사자가 채무를 이행하지 않으면 상대방은 서면으로 최고하고 계약을 해제할 수 있다.",
+    "중개보수는 본 계약 체결과 동시에 계약 당사자 쌍방이 각각 지불한다.",
+    "목적물의 하자로 인한 수선비는 임대인이 부담하되, 임차인의 과실로 인한 경우는 그러하지 아니하다.",
+]
+_SPECIAL_TERMS = [
+    "반려동물 사육은 소형견 1마리에 한하여 허용한다.",
+    "관리비는 월 120,000원이며 수도·전기·가스 요금은 별도로 임차인이 부담한다.",
+    "잔금일에 전입신고 및 확정일자를 받으며 임대인은 그 다음 날까지 근저당을 설정하지 않는다.",
+    "퇴실 시 도배·장판은 통상의 손모를 제외하고 원상복구한다.",
+    "계약 기간 중 임대인이 변경되는 경우 보증금 반환 채무는 새 임대인에게 승계된다.",
+]
+
+
+def _phone(rng: random.Random) -> str:
+    return f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}"
+
+
+def _account(rng: random.Random) -> str:
+    return f"{rng.choice(_BANKS)} {rng.randint(100, 999999)}-{rng.randint(10, 99)}-{rng.randint(100000, 9999999)}"
+
+
+def _won(rng: random.Random, low: int, high: int) -> str:
+    return f"{rng.randrange(low, high, 10) * 10000:,}원"
+
+
+def contract_page_html(page_no: int, *, seed: int = 0) -> str:
+    """Upstage document-parse 결과 모양의 계약서 한 페이지 HTML (표, 조항, 연락처/계좌 포함)."""
+    rng = random.Random(seed * 1000 + page_no)
+    lessor, lessee = rng.sample(_NAMES, 2)
+    parts = [f"<header id='0'>부동산 임대차 계약서 ({page_no}쪽)</header>"]
+    if page_no == 1:
+        parts.append("<h1 id='1'>주택 임대차 표준계약서</h1>")
+        parts.append(
+            "<table id='2'>"
+            f"<tr><th>소재지</th><td colspan='3'>{rng.choice(_ADDRESSES)}</td></tr>"
+            f"<tr><th>보증금</th><td>금 {_won(rng, 1000, 50000)}</td><th>차임</th><td>월 {_won(rng, 30, 200)}</td></tr>"
+            "<tr><th>임대차기간</th><td colspan='3'>2025년 3월 1일부터 2027년 2월 28일까지</td></tr>"
+            "</table>"
+        )
+    parts.append(f"<h2 id='3'>제{page_no}장 계약 조항</h2>")
+    for idx, clause in enumerate(rng.sample(_CLAUSES, 4), start=1):
+        parts.append(f"<p id='{3 + idx}'>제{(page_no - 1) * 4 + idx}조 {clause}</p>")
+    parts.append("<h2 id='8'>특약사항</h2>")
+    for idx, term in enumerate(rng.sample(_SPECIAL_TERMS, 3), start=1):
+        parts.append(f"<p id='{8 + idx}'>{idx}. {term}</p>")
+    parts.append(
+        "<table id='12'>"
+        f"<tr><th>임대인</th><td>{lessor}</td><th>연락처</th><td>{_phone(rng)}</td></tr>"
+        f"<tr><th>임차인</th><td>{lessee}</td><th>연락처</th><td>{_phone(rng)}</td></tr>"
+        f"<tr><th>입금계좌</th><td colspan='3'>{_account(rng)}</td></tr>"
+        "</table>"
+    )
+    parts.append("<img id='13' alt='서명' src='data:image/png;base64,AAAA'/>")
+    parts.append(f"<footer id='14'>- {page_no} -</footer>")
+    return "".join(parts)
+
+
+def contract_text(pages: int, *, seed: int = 0) -> str:
+    """OCR 후 평문으로 바뀐 계약서 본문 (가드/마스킹 입력 크기 용)."""
+    from app.utils.upstage_html import html_to_plain_text
+
+    return "\n\n".join(html_to_plain_text(contract_page_html(p, seed=seed)) for p in range(1, pages + 1))
+
+
+def registry_text(pages: int, *, seed: int = 0) -> str:
+    """등기부등본 갑구/을구 형태의 평문. 페이지가 많을수록 반복 이력과 잡음 줄이 늘어난다."""
+    rng = random.Random(seed + 7)
+    lines: list[str] = []
+    rank = 1
+    for page_no in range(1, pages + 1):
+        lines.append(f"[페이지 {page_no}]")
+        lines.append("등기사항전부증명서(말소사항 포함) - 집합건물")
+        lines.append(f"[집합건물] {rng.choice(_ADDRESSES)}")
+        lines.append("【 갑 구 】 ( 소유권에 관한 사항 )")
+        for _ in range(6):
+            year = rng.randint(2005, 2024)
+            owner = rng.choice(_NAMES)
+            lines.append(
+                f"{rank} | 소유권이전 | {year}년{rng.randint(1, 12)}월{rng.randint(1, 28)}일 제{rng.randint(1000, 99999)}호 "
+                f"| 매매 | 소유자 {owner} {rng.randint(600101, 991231)}-*******"
+            )
+            rank += 1
+        lines.append("【 을 구 】 ( 소유권 이외의 권리에 관한 사항 )")
+        for _ in range(4):
+            lines.append(
+                f"{rank} | 근저당권설정 | 채권최고액 금{rng.randint(10, 60) * 10_000_000:,}원 "
+                f"| 근저당권자 주식회사{rng.choice(_BANKS)} | 채무자 {rng.choice(_NAMES)}"
+            )
+            rank += 1
+        lines.append("이하여백")
+        lines.append("-" * 40)
+        lines.append(f"- {page_no} -")
+        lines.append("열람일시 : 2025년 02월 14일 10시 21분 33초")
+    return "\n".join(lines)
+
+
+def checklist_model_output(items: int, *, seed: int = 0) -> str:
+    """코드펜스와 앞뒤 설명이 붙은 체크리스트 모델 출력 (중복 항목 포함)."""
+    rng = random.Random(seed + 13)
+    base = [
+        "등기부등본의 근저당 채권최고액 확인",
+        "관리비 포함 항목과 금액 확인",
+        "반려동물 허용 여부를 특약에 기재",
+        "확정일자와 전입신고 일정 확인",
+        "누수·곰팡이 등 하자 사진 기록",
+        "중개보수 요율과 부가세 확인",
+    ]
+    data = [f"{rng.choice(base)} ({idx})" if idx % 3 else rng.choice(base) for idx in range(items)]
+    return "다음은 체크리스트입니다.\n```json\n" + json.dumps(data, ensure_ascii=False, indent=2) + "\n```\n이상입니다."
+
+
+def contract_pdf(pages: int) -> bytes:
+    """한글 텍스트가 들어간 A4 PDF (PyMuPDF 내장 CJK 글꼴 사용)."""
+    import fitz  # pymupdf
+
+    doc = fitz.open()
+    try:
+        for page_no in range(1, pages + 1):
+            page = doc.new_page(width=595, height=842)
+            y = 72.0
+            for line in contract_text(1, seed=page_no).split("\n")[:40]:
+                page.insert_text((56, y), line[:45], fontname="korea", fontsize=10)
+                y += 18
+        return doc.tobytes()
+    finally:
+        doc.close()
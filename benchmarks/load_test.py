@@ -0,0 +1,395 @@
+"""로컬 스텁으로 돌리는 오프라인 부하 테스트.
+
+vLLM(OpenAI 호환)·Upstage document-parse·파일 다운로드는 로컬 HTTP 스텁으로, RabbitMQ 는 인메모리 브로커로 대신하고
+실제 VLLMClient/UpstageDocumentParseClient/서비스/워커 코드를 지정한 동시성으로 돌린다.
+시나리오별 처리량과 지연 p50/p95/p99, 최대 RSS 를 출력하고, 단계별(LangGraph 노드, vLLM 호출, OCR 페이지) 지연은
+OpenTelemetry span 을 메모리에 모아 집계한다.
+
+    uv run python -m benchmarks.load_test [--scenario all] [--concurrency 8] [--requests 32]
+        [--vllm-latency 0.2] [--tokens-per-sec 400] [--ocr-latency 0.3] [--pages 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import sys
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from app.resources.ocr.upstage_client import UpstageDocumentParseClient
+from app.resources.rabbitmq.client import QueueBinding
+from app.resources.rabbitmq.result_publisher import RabbitMQResultPublisher
+from app.resources.vllm.client import VLLMClient
+from app.services import checklist_service, easy_contract_service
+from app.services.cancel_registry import CancelRegistry
+from app.services.checklist_service import ChecklistService
+from app.services.easy_contract_service import EasyContractService
+from app.workers.handlers import (
+    ChecklistMessageHandler,
+    EasyContractCancelMessageHandler,
+    EasyContractMessageHandler,
+)
+from app.workers.mq_worker import RabbitMQWorker
+from benchmarks.stubs import InMemoryBroker, StubFileServer, StubUpstageServer, StubVLLMServer
+
+SCENARIOS = ("easy_contract", "checklist", "worker")
+
+_EASY_CONTRACT_QUEUE = "bench.easy_contract.request"
+_CHECKLIST_QUEUE = "bench.checklist.request"
+_CANCEL_QUEUE = "bench.easy_contract.cancel"
+
+_SAMPLE_KEYWORDS = [["반려동물", "주차"], ["층간소음"], ["역세권", "채광", "보안"], ["관리비", "수압"], []]
+_PAGE_SUMMARY = "- 보증금 1억원, 월세 50만원\n- 임대차기간 2025.03.01 ~ 2027.02.28\n- 2기 연체 시 해지 가능"
+_FINAL_MARKDOWN = "## 계약 요약\n- 보증금 1억원, 월세 50만원\n## 주의할 조항\n- 차임 2기 연체 시 해지\n"
+_CHECKLIST_ITEMS = ["등기부등본 근저당 확인", "관리비 포함 항목 확인", "반려동물 허용 여부 특약 기재", "주차 가능 대수 확인"]
+
+
+def _stub_responder(payload: dict[str, Any]) -> str:
+    """프롬프트 종류에 맞는 모양의 응답을 만든다 (서비스 쪽 파서가 실제로 동작하도록)."""
+    messages = payload.get("messages") or []
+    user = str(messages[-1].get("content") or "") if messages else ""
+    system = str(messages[0].get("content") or "") if messages else ""
+    if system == checklist_service.CHECKLIST_TEMPLATE.system:
+        return json.dumps(_CHECKLIST_ITEMS, ensure_ascii=False)
+    pages = easy_contract_service._PAGE_GROUP_HEADER.findall(user)
+    if "[페이지] " in user and "," in user.split("[페이지] ", 1)[1].split("\n", 1)[0]:
+        return "\n".join(f"[페이지 {page}]\n{_PAGE_SUMMARY}" for page in pages)
+    if system == easy_contract_service.FINAL_MARKDOWN_TEMPLATE.system:
+        return _FINAL_MARKDOWN
+    return _PAGE_SUMMARY
+
+
+def _make_pdf(pages: int) -> bytes:
+    import fitz  # pymupdf
+
+    doc = fitz.open()
+    for page_no in range(1, pages + 1):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Lease contract page {page_no}")
+    try:
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _current_rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+class PeakRssSampler:
+    """시나리오 실행 중 RSS 를 주기적으로 읽어 최대값을 기록한다.
+
+    /proc 가 없는 환경에서는 프로세스 전체 기간의 최대값(ru_maxrss)으로 대신한다.
+    """
+
+    def __init__(self, interval_sec: float = 0.05) -> None:
+        self.interval_sec = interval_sec
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> PeakRssSampler:
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_sec):
+            self._sample()
+
+    def _sample(self) -> None:
+        rss = _current_rss_bytes()
+        if rss is None:
+            # linux 는 KiB, macOS 는 byte 단위
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            rss = maxrss if sys.platform == "darwin" else maxrss * 1024
+        self.peak_bytes = max(self.peak_bytes, rss)
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int
+    concurrency: int
+    elapsed_sec: float
+    latencies_sec: list[float]
+    errors: int
+    peak_rss_bytes: int
+    stages: dict[str, list[float]] = field(default_factory=dict)
+
+
+async def _run_concurrently(
+    total: int,
+    concurrency: int,
+    job: Callable[[int], Awaitable[None]],
+) -> tuple[float, list[float], int]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def one(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await job(index)
+            except Exception as exc:
+                errors += 1
+                print(f"  요청 {index} 실패: {type(exc).__name__}: {exc}", file=sys.stderr)
+                return
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return time.perf_counter() - started, latencies, errors
+
+
+@dataclass
+class _Clients:
+    http: httpx.AsyncClient
+    vllm: VLLMClient
+    upstage: UpstageDocumentParseClient
+
+
+def _build_clients(
+    args: argparse.Namespace,
+    vllm_stub: StubVLLMServer,
+    upstage_stub: StubUpstageServer,
+) -> _Clients:
+    limits = httpx.Limits(max_connections=max(args.concurrency * 4, 16))
+    http = httpx.AsyncClient(timeout=60.0, limits=limits)
+    vllm = VLLMClient(
+        http=http,
+        base_url=vllm_stub.base_url,
+        api_key="stub",
+        model="stub-model",
+        retry_max_attempts=1,
+    )
+    upstage = UpstageDocumentParseClient(
+        http=http,
+        api_key="stub",
+        url=f"{upstage_stub.base_url}/document-digitization",
+        retry_max_attempts=1,
+    )
+    return _Clients(http=http, vllm=vllm, upstage=upstage)
+
+
+async def _scenario_easy_contract(
+    args: argparse.Namespace,
+    clients: _Clients,
+    pdf: bytes,
+) -> tuple[float, list[float], int]:
+    service = EasyContractService(vllm=clients.vllm, ocr=clients.upstage)
+    docs = [{"doc_type": "contract", "filename": "contract.pdf", "bytes": pdf}]
+
+    async def job(index: int) -> None:
+        await service.generate(index + 1, docs, correlation_id=f"bench-{index}")
+
+    return await _run_concurrently(args.requests, args.concurrency, job)
+
+
+async def _scenario_checklist(args: argparse.Namespace, clients: _Clients) -> tuple[float, list[float], int]:
+    service = ChecklistService(vllm=clients.vllm)
+
+    async def job(index: int) -> None:
+        await service.generate(index + 1, _SAMPLE_KEYWORDS[index % len(_SAMPLE_KEYWORDS)])
+
+    return await _run_concurrently(args.requests, args.concurrency, job)
+
+
+async def _scenario_worker(
+    args: argparse.Namespace,
+    clients: _Clients,
+    file_stub: StubFileServer,
+) -> tuple[float, list[float], int]:
+    """easy_contract/checklist 메시지를 절반씩 섞어 넣고 워커가 모두 ack 할 때까지 돌린다.
+
+    지연은 메시지 적재부터 ack 까지의 시간이며, 동시성은 큐별 prefetch 로 준다.
+    """
+    broker = InMemoryBroker(prefetch_count=args.concurrency)
+    publisher = RabbitMQResultPublisher(client=broker, exchange_name="bench.result", routing_key="bench.result")
+    cancel_registry = CancelRegistry(ttl_sec=60)
+    easy_contract_handler = EasyContractMessageHandler(
+        http=clients.http,
+        easy_contract_service=EasyContractService(vllm=clients.vllm, ocr=clients.upstage),
+        result_publisher=publisher,
+        cancel_registry=cancel_registry,
+    )
+    checklist_handler = ChecklistMessageHandler(
+        checklist_service=ChecklistService(vllm=clients.vllm),
+        result_publisher=publisher,
+    )
+    worker = RabbitMQWorker(
+        client=broker,
+        easy_contract_queue=_EASY_CONTRACT_QUEUE,
+        checklist_queue=_CHECKLIST_QUEUE,
+        easy_contract_cancel_queue=_CANCEL_QUEUE,
+        easy_contract_handler=easy_contract_handler.handle,
+        checklist_handler=checklist_handler.handle,
+        easy_contract_cancel_handler=EasyContractCancelMessageHandler(cancel_registry=cancel_registry).handle,
+        result_publisher=publisher,
+        retry_max_attempts=1,
+    )
+    for queue_name in (_EASY_CONTRACT_QUEUE, _CHECKLIST_QUEUE, _CANCEL_QUEUE):
+        await broker.ensure_binding(
+            QueueBinding(queue_name=queue_name, exchange_name="bench.request", routing_key=queue_name)
+        )
+
+    file_url = file_stub.url_for("/contract.pdf")
+    started = time.perf_counter()
+    await worker.start()
+    try:
+        for index in range(args.requests):
+            correlation_id = f"bench-{index}"
+            if index % 2 == 0:
+                payload: dict[str, Any] = {
+                    "correlation_id": correlation_id,
+                    "easy_contract_id": index + 1,
+                    "member_id": 1,
+                    "files": [{"doc_type": "contract", "filename": "contract.pdf", "url": file_url}],
+                }
+                broker.put(_EASY_CONTRACT_QUEUE, payload, correlation_id=correlation_id)
+            else:
+                payload = {
+                    "correlation_id": correlation_id,
+                    "template_id": index + 1,
+                    "member_id": 1,
+                    "keywords": _SAMPLE_KEYWORDS[index % len(_SAMPLE_KEYWORDS)],
+                }
+                broker.put(_CHECKLIST_QUEUE, payload, correlation_id=correlation_id)
+        await broker.wait_drained([_EASY_CONTRACT_QUEUE, _CHECKLIST_QUEUE])
+    finally:
+        await worker.stop()
+        await broker.close()
+    elapsed = time.perf_counter() - started
+
+    latencies = [v for name in (_EASY_CONTRACT_QUEUE, _CHECKLIST_QUEUE) for v in broker.ack_latencies.get(name, [])]
+    errors = sum(1 for m in broker.published if not m["payload"].get("success"))
+    return elapsed, latencies, errors
+
+
+def _collect_stages(exporter: InMemorySpanExporter) -> dict[str, list[float]]:
+    stages: dict[str, list[float]] = {}
+    for span in exporter.get_finished_spans():
+        if span.start_time is None or span.end_time is None:
+            continue
+        stages.setdefault(span.name, []).append((span.end_time - span.start_time) / 1e9)
+    exporter.clear()
+    return stages
+
+
+def _print_result(result: ScenarioResult) -> None:
+    latencies = sorted(result.latencies_sec)
+    done = len(latencies)
+    throughput = done / result.elapsed_sec if result.elapsed_sec > 0 else 0.0
+    print(
+        f"\n[{result.name}] requests={result.requests} concurrency={result.concurrency} "
+        f"ok={done} errors={result.errors} elapsed={result.elapsed_sec:.2f}s "
+        f"throughput={throughput:.2f} req/s peak_rss={result.peak_rss_bytes / 1024 / 1024:.1f}MiB"
+    )
+    print(f"  {'stage':<40} {'count':>6} {'p50_ms':>9} {'p95_ms':>9} {'p99_ms':>9}")
+    rows = [("end_to_end", latencies)] + sorted((name, sorted(v)) for name, v in result.stages.items())
+    for name, values in rows:
+        print(
+            f"  {name:<40} {len(values):>6} {_percentile(values, 0.50) * 1000:>9.1f} "
+            f"{_percentile(values, 0.95) * 1000:>9.1f} {_percentile(values, 0.99) * 1000:>9.1f}"
+        )
+
+
+async def _run(args: argparse.Namespace, exporter: InMemorySpanExporter) -> list[ScenarioResult]:
+    pdf = _make_pdf(args.pages)
+    results: list[ScenarioResult] = []
+    vllm_stub = StubVLLMServer(
+        latency_sec=args.vllm_latency,
+        tokens_per_sec=args.tokens_per_sec,
+        responder=_stub_responder,
+    )
+    upstage_stub = StubUpstageServer(latency_sec=args.ocr_latency)
+    file_stub = StubFileServer({"/contract.pdf": pdf})
+    with vllm_stub, upstage_stub, file_stub:
+        clients = _build_clients(args, vllm_stub, upstage_stub)
+        try:
+            for name in SCENARIOS:
+                if args.scenario not in ("all", name):
+                    continue
+                exporter.clear()
+                with PeakRssSampler() as rss:
+                    if name == "easy_contract":
+                        elapsed, latencies, errors = await _scenario_easy_contract(args, clients, pdf)
+                    elif name == "checklist":
+                        elapsed, latencies, errors = await _scenario_checklist(args, clients)
+                    else:
+                        elapsed, latencies, errors = await _scenario_worker(args, clients, file_stub)
+                results.append(
+                    ScenarioResult(
+                        name=name,
+                        requests=args.requests,
+                        concurrency=args.concurrency,
+                        elapsed_sec=elapsed,
+                        latencies_sec=latencies,
+                        errors=errors,
+                        peak_rss_bytes=rss.peak_bytes,
+                        stages=_collect_stages(exporter),
+                    )
+                )
+        finally:
+            await clients.http.aclose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=("all", *SCENARIOS), default="all")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--vllm-latency", type=float, default=0.2, help="vLLM 첫 토큰까지 지연(초)")
+    parser.add_argument("--tokens-per-sec", type=float, default=400.0, help="vLLM 출력 속도 (0이면 즉시)")
+    parser.add_argument("--ocr-latency", type=float, default=0.3, help="Upstage 페이지당 지연(초)")
+    parser.add_argument("--pages", type=int, default=3, help="easy_contract 입력 PDF 페이지 수")
+    args = parser.parse_args()
+    args.concurrency = max(1, args.concurrency)
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+
+    for result in asyncio.run(_run(args, exporter)):
+        _print_result(result)
+
+
+if __name__ == "__main__":
+    main()
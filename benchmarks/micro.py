@@ -0,0 +1,251 @@
+"""이벤트 루프에서 동기로 도는 CPU 작업 마이크로 벤치마크.
+
+합성 한국어 계약서/등기부등본 픽스처(benchmarks.fixtures)로 함수별 호출 시간과 tracemalloc 할당량을 잰다.
+저장된 baseline 과 비교해 라운드 중 최소 시간이나 최대 할당량이 임계치 이상 늘면 종료 코드 1로 실패한다.
+(최소값은 다른 프로세스 간섭을 가장 덜 받아 중앙값보다 회귀 판정이 안정적이다.)
+
+    uv run python -m benchmarks.micro [--filter redact] [--rounds 7] [--time-threshold 0.25]
+    uv run python -m benchmarks.micro --save-baseline   # 현재 결과를 baseline 으로 저장
+
+시간 baseline 은 측정한 머신에 종속적이므로 CPU 가 다른 곳에서는 먼저 --save-baseline 으로 다시 만든다.
+pdf_bytes_to_png_pages 처럼 C 확장 안에서 잡는 메모리는 tracemalloc 에 잡히지 않는다 (Python 객체 할당만 집계).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from app.resources.hf.tokenizer import TokenCounter
+from app.services.checklist_service import _parse_model_output
+from app.services.easy_contract_service import (
+    REGISTRY_HEAD_RATIO,
+    SUMMARY_MAX_TOKENS,
+    _registry_summary_prompt,
+)
+from app.utils.lease_contract_guard import check_is_lease_contract
+from app.utils.pdf_images import pdf_bytes_to_png_pages
+from app.utils.pii_redaction import redact_phone_and_account
+from app.utils.prompt_budget import PromptBudgeter
+from app.utils.upstage_html import html_to_plain_text
+from benchmarks import fixtures
+
+DEFAULT_BASELINE = Path(__file__).with_name("baselines") / "micro.json"
+
+# 설정값(.env)에 따라 결과가 달라지지 않도록 고정한다
+_CONTEXT_WINDOW = 8192
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    fn: Callable[[], Any]
+
+
+@dataclass
+class CaseResult:
+    name: str
+    iterations: int
+    rounds: int
+    min_us: float
+    median_us: float
+    stdev_us: float
+    peak_alloc_kib: float
+    retained_kib: float
+
+
+def _fit_registry(text: str) -> str:
+    # 토큰 수 캐시가 데워진 상태를 재지 않도록 호출마다 새 카운터를 쓴다
+    budgeter = PromptBudgeter(TokenCounter(), context_window=_CONTEXT_WINDOW)
+    return budgeter.fit(
+        text,
+        build_messages=lambda t: _registry_summary_prompt("registry.pdf", t),
+        max_tokens=SUMMARY_MAX_TOKENS,
+        head_ratio=REGISTRY_HEAD_RATIO,
+    )
+
+
+def build_cases() -> list[Case]:
+    pdf_3p = fixtures.contract_pdf(3)
+    page_html = fixtures.contract_page_html(1)
+    contract_5p = fixtures.contract_text(5)
+    contract_pages = contract_5p.split("\n\n")
+    # 예산(약 6.9k 토큰)을 넘겨 줄 단위 정리와 head/tail 자르기까지 타도록 20쪽으로 만든다
+    registry_20p = fixtures.registry_text(20)
+    model_output = fixtures.checklist_model_output(30)
+    return [
+        Case("pdf_bytes_to_png_pages[3p,zoom2]", lambda: pdf_bytes_to_png_pages(pdf_3p, zoom=2.0)),
+        Case("html_to_plain_text[contract_page]", lambda: html_to_plain_text(page_html)),
+        Case("redact_phone_and_account[contract_5p]", lambda: redact_phone_and_account(contract_5p)),
+        Case("check_is_lease_contract[contract_5p]", lambda: check_is_lease_contract(contract_pages)),
+        Case("_parse_model_output[30_items]", lambda: _parse_model_output(model_output)),
+        Case("PromptBudgeter.fit[registry_20p]", lambda: _fit_registry(registry_20p)),
+    ]
+
+
+def _calibrate(fn: Callable[[], Any], min_round_sec: float) -> int:
+    iterations = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        if time.perf_counter() - started >= min_round_sec or iterations >= 1 << 20:
+            return iterations
+        iterations *= 2
+
+
+def _measure_alloc(fn: Callable[[], Any]) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return (peak - before) / 1024, (after - before) / 1024
+
+
+def run_case(case: Case, *, rounds: int, min_round_sec: float) -> CaseResult:
+    case.fn()  # warmup (지연 import, 정규식 컴파일 등)
+    iterations = _calibrate(case.fn, min_round_sec)
+    per_call: list[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                case.fn()
+            per_call.append((time.perf_counter() - started) / iterations * 1e6)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    peak_kib, retained_kib = _measure_alloc(case.fn)
+    return CaseResult(
+        name=case.name,
+        iterations=iterations,
+        rounds=rounds,
+        min_us=min(per_call),
+        median_us=statistics.median(per_call),
+        stdev_us=statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        peak_alloc_kib=peak_kib,
+        retained_kib=retained_kib,
+    )
+
+
+def _load_baseline(path: Path) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _save_baseline(path: Path, results: list[CaseResult]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python": platform.python_version(),
+        "results": {r.name: asdict(r) for r in results},
+    }
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def _compare(
+    results: list[CaseResult],
+    baseline: dict[str, Any],
+    *,
+    time_threshold: float,
+    alloc_threshold: float,
+) -> list[str]:
+    regressions: list[str] = []
+    base_results = baseline.get("results") or {}
+    for r in results:
+        base = base_results.get(r.name)
+        if base is None:
+            continue
+        time_ratio = r.min_us / base["min_us"] if base["min_us"] else 1.0
+        if time_ratio > 1 + time_threshold:
+            regressions.append(f"{r.name}: min {base['min_us']:.1f}us -> {r.min_us:.1f}us (x{time_ratio:.2f})")
+        # 할당량이 아주 작으면 비율이 크게 흔들리므로 4KiB 미만은 비교하지 않는다
+        if base["peak_alloc_kib"] >= 4 and r.peak_alloc_kib > base["peak_alloc_kib"] * (1 + alloc_threshold):
+            regressions.append(
+                f"{r.name}: peak alloc {base['peak_alloc_kib']:.1f}KiB -> {r.peak_alloc_kib:.1f}KiB"
+            )
+    return regressions
+
+
+def _print_results(results: list[CaseResult], baseline: dict[str, Any] | None) -> None:
+    base_results = (baseline or {}).get("results") or {}
+    print(
+        f"{'case':<42} {'iters':>7} {'min_us':>11} {'median_us':>11} {'stdev_us':>9} "
+        f"{'peak_KiB':>9} {'kept_KiB':>9} {'vs_base':>8}"
+    )
+    for r in results:
+        base = base_results.get(r.name)
+        delta = f"{r.min_us / base['min_us'] - 1:+.0%}" if base and base["min_us"] else "-"
+        print(
+            f"{r.name:<42} {r.iterations:>7} {r.min_us:>11.1f} {r.median_us:>11.1f} {r.stdev_us:>9.1f} "
+            f"{r.peak_alloc_kib:>9.1f} {r.retained_kib:>9.1f} {delta:>8}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="이름에 이 문자열이 들어간 케이스만 실행")
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--min-round-sec", type=float, default=0.05, help="라운드당 최소 측정 시간")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--time-threshold", type=float, default=0.25, help="허용하는 최소 시간 증가율")
+    parser.add_argument("--alloc-threshold", type=float, default=0.10, help="허용하는 최대 할당량 증가율")
+    args = parser.parse_args()
+
+    cases = [case for case in build_cases() if args.filter in case.name]
+    results = [run_case(case, rounds=max(2, args.rounds), min_round_sec=args.min_round_sec) for case in cases]
+
+    if args.save_baseline:
+        _print_results(results, None)
+        _save_baseline(args.baseline, results)
+        print(f"\nbaseline 저장: {args.baseline}")
+        return
+
+    baseline = _load_baseline(args.baseline)
+    _print_results(results, baseline)
+    if baseline is None:
+        print(f"\nbaseline 없음 ({args.baseline}) - --save-baseline 으로 먼저 만드세요.")
+        return
+    if baseline.get("machine") != platform.machine() or baseline.get("python") != platform.python_version():
+        print(
+            f"\n주의: baseline 측정 환경({baseline.get('machine')}, python {baseline.get('python')})이 "
+            "현재와 달라 시간 비교가 부정확할 수 있습니다."
+        )
+
+    regressions = _compare(
+        results,
+        baseline,
+        time_threshold=args.time_threshold,
+        alloc_threshold=args.alloc_threshold,
+    )
+    if regressions:
+        print("\n성능 회귀:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print("\n회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""파이프라인 실행기 오버헤드 비교 (LangGraph vs inline).
+
+vLLM/OCR 을 즉시 응답하는 인프로세스 가짜 클라이언트로 바꿔 네트워크 대기를 없애고, 같은 입력으로
+`PIPELINE_EXECUTOR=langgraph`(컴파일된 StateGraph)와 `inline`(노드 직접 호출 + __slots__ 작업 상태)을 번갈아 돌린다.
+작업 1건당 시간(라운드 중 최소/중앙값)과 tracemalloc 으로 잰 작업 중 Python 메모리 최대 증가량을 출력하고,
+두 실행기의 결과가 다르면 종료 코드 1로 실패한다.
+
+    uv run python -m benchmarks.pipeline [--scenario all] [--jobs 200] [--rounds 5] [--pages 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from app.resources.hf.tokenizer import TokenCounter
+from app.services.checklist_service import ChecklistService
+from app.services.easy_contract_service import EasyContractService
+from app.services.pipeline import EXECUTOR_INLINE, EXECUTOR_LANGGRAPH, PIPELINE_EXECUTORS
+from app.utils.prompt_budget import PromptBudgeter
+from benchmarks import fixtures
+from benchmarks.load_test import _stub_responder
+
+SCENARIOS = ("checklist", "checklist_no_keywords", "easy_contract")
+
+# 설정값(.env)에 따라 결과가 달라지지 않도록 고정한다
+_CONTEXT_WINDOW = 8192
+
+
+class _FakeVLLM:
+    """load_test 스텁과 같은 응답을 HTTP 없이 돌려준다."""
+
+    async def chat(self, messages: list[dict[str, str]], **kwargs: Any) -> str:
+        return _stub_responder({"messages": messages})
+
+
+class _FakeOCR:
+    """파일 이름으로 계약서/등기부등본 페이지를 골라 Upstage document-parse 모양으로 돌려준다."""
+
+    def __init__(self, pages: int) -> None:
+        registry = "".join(f"<p id='{i}'>{line}</p>" for i, line in enumerate(fixtures.registry_text(1).splitlines()))
+        self._html = {f"contract_p{n}.png": fixtures.contract_page_html(n) for n in range(1, pages + 1)}
+        self._html["registry.png"] = registry
+
+    async def parse_image(self, image_bytes: bytes, filename: str = "page.png") -> dict:
+        html = self._html[filename]
+        return {
+            "content": {"html": html, "markdown": "", "text": ""},
+            "elements": [{"id": 0, "category": "paragraph", "page": 1, "content": {"html": html}}],
+        }
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    # executor 를 받아 작업 1건을 돌리는 함수를 만든다
+    make_job: Callable[[str], Callable[[int], Awaitable[Any]]]
+
+
+@dataclass
+class Result:
+    scenario: str
+    executor: str
+    min_us: float
+    median_us: float
+    peak_bytes: int
+
+
+def _scenarios(pages: int) -> list[Scenario]:
+    vllm: Any = _FakeVLLM()
+    ocr: Any = _FakeOCR(pages)
+    budgeter = PromptBudgeter(TokenCounter(), context_window=_CONTEXT_WINDOW)
+    docs = [
+        *({"doc_type": "contract", "filename": f"contract_p{n}.png", "bytes": b"png"} for n in range(1, pages + 1)),
+        {"doc_type": "registry", "filename": "registry.png", "bytes": b"png"},
+    ]
+
+    def checklist(keywords: list[str]) -> Callable[[str], Callable[[int], Awaitable[Any]]]:
+        def make_job(executor: str) -> Callable[[int], Awaitable[Any]]:
+            service = ChecklistService(vllm=vllm, executor=executor)
+            return lambda index: service.generate(index, keywords)
+
+        return make_job
+
+    def easy_contract(executor: str) -> Callable[[int], Awaitable[Any]]:
+        service = EasyContractService(vllm=vllm, ocr=ocr, budgeter=budgeter, executor=executor)
+        return lambda index: service.generate(index + 1, docs)
+
+    return [
+        Scenario("checklist", checklist(["반려동물", "주차", "층간소음"])),
+        Scenario("checklist_no_keywords", checklist([])),
+        Scenario("easy_contract", easy_contract),
+    ]
+
+
+async def _time_jobs(job: Callable[[int], Awaitable[Any]], jobs: int) -> float:
+    started = time.perf_counter()
+    for index in range(jobs):
+        await job(index)
+    return (time.perf_counter() - started) / jobs
+
+
+async def _peak_per_job(job: Callable[[int], Awaitable[Any]], jobs: int) -> int:
+    """작업을 하나씩 돌리며 작업 시작 시점 대비 traced 메모리가 가장 크게 늘어난 양."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        peak = 0
+        for index in range(jobs):
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await job(index)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+async def run_scenario(scenario: Scenario, jobs: int, rounds: int) -> tuple[list[Result], bool]:
+    runners = {executor: scenario.make_job(executor) for executor in PIPELINE_EXECUTORS}
+    outputs = {executor: await job(0) for executor, job in runners.items()}  # 워밍업 (그래프 컴파일 포함)
+    same = outputs[EXECUTOR_LANGGRAPH] == outputs[EXECUTOR_INLINE]
+
+    samples: dict[str, list[float]] = {executor: [] for executor in runners}
+    for _ in range(rounds):
+        # 번갈아 돌려 머신 상태 변화가 한쪽에만 몰리지 않게 한다
+        for executor, job in runners.items():
+            samples[executor].append(await _time_jobs(job, jobs))
+
+    results: list[Result] = []
+    for executor, job in runners.items():
+        peak_bytes = await _peak_per_job(job, max(1, jobs // 4))
+        results.append(
+            Result(
+                scenario=scenario.name,
+                executor=executor,
+                min_us=min(samples[executor]) * 1e6,
+                median_us=statistics.median(samples[executor]) * 1e6,
+                peak_bytes=peak_bytes,
+            )
+        )
+    return results, same
+
+
+def _print_results(results: list[Result], same: bool) -> None:
+    base = results[0]
+    for r in results:
+        speedup = base.min_us / r.min_us if r.min_us else 0.0
+        print(
+            f"  {r.scenario:<24} {r.executor:<10} {r.min_us:>10.1f} {r.median_us:>10.1f} {speedup:>7.2f}x"
+            f" {r.peak_bytes / 1024:>10.1f}"
+        )
+    if not same:
+        print(f"  !! {base.scenario}: 실행기별 결과가 다릅니다")
+
+
+async def _run(args: argparse.Namespace) -> bool:
+    ok = True
+    print(f"{'scenario':<26} {'executor':<10} {'min_us':>10} {'median_us':>10} {'speedup':>8} {'peak_kib':>10}")
+    for scenario in _scenarios(args.pages):
+        if args.scenario not in ("all", scenario.name):
+            continue
+        results, same = await run_scenario(scenario, args.jobs, args.rounds)
+        _print_results(results, same)
+        ok = ok and same
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=("all", *SCENARIOS), default="all")
+    parser.add_argument("--jobs", type=int, default=200, help="라운드당 순차 실행할 작업 수")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--pages", type=int, default=3, help="easy_contract 계약서 페이지 수")
+    args = parser.parse_args()
+    args.jobs = max(1, args.jobs)
+    args.rounds = max(1, args.rounds)
+    if not asyncio.run(_run(args)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
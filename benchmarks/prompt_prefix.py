@@ -0,0 +1,107 @@
+"""프롬프트 템플릿별 prefix-cache 친화도 측정.
+
+로컬 vLLM 스텁 서버로 실제 VLLMClient 요청을 보내고, 템플릿별로 요청 간 공통 접두부 길이를 집계한다.
+공통 접두부가 길수록 vLLM automatic prefix caching(--enable-prefix-caching)의 재사용 구간이 길다.
+
+    uv run python -m benchmarks.prompt_prefix [--tokenizer-path /models/exaone]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from typing import Any
+
+import httpx
+
+from app.resources.hf.tokenizer import TokenCounter
+from app.resources.vllm.client import VLLMClient
+from app.services import checklist_service, easy_contract_service
+from app.services.prompt_templates import PROMPT_TEMPLATES
+from benchmarks.stubs import StubVLLMServer
+
+_SAMPLE_CONTRACT_PAGES = [
+    "# 부동산 임대차 계약서\n보증금 | 금 일억원정\n차임 | 금 오십만원정\n임대차기간 | 2025.03.01 ~ 2027.02.28",
+    "# 제5조 계약의 해지\n임차인이 2기의 차임액에 달하도록 연체하는 경우 임대인은 계약을 해지할 수 있다.",
+    "# 특약사항\n1. 반려동물 사육 금지\n2. 퇴실 시 도배·장판은 원상복구한다.",
+]
+_SAMPLE_REGISTRIES = [
+    ("registry_a.pdf", "# 갑구\n소유권이전 | 2019년3월2일 | 소유자 김OO\n# 을구\n근저당권설정 | 채권최고액 금240,000,000원"),
+    ("registry_b.pdf", "# 갑구\n소유권보존 | 2015년1월10일 | 소유자 이OO\n# 을구\n기록사항 없음"),
+]
+_SAMPLE_KEYWORDS = [["반려동물", "주차"], ["층간소음"], ["역세권", "채광", "보안"]]
+
+
+def _sample_requests() -> list[tuple[str, list[dict[str, str]]]]:
+    ec = easy_contract_service
+    requests: list[tuple[str, list[dict[str, str]]]] = []
+    for page_no, text in enumerate(_SAMPLE_CONTRACT_PAGES, start=1):
+        requests.append((ec.PAGE_SUMMARY_TEMPLATE.name, ec._page_summary_prompt("contract", page_no, text)))
+    requests.append(
+        (
+            ec.PAGE_GROUP_SUMMARY_TEMPLATE.name,
+            ec._page_group_summary_prompt("contract", list(enumerate(_SAMPLE_CONTRACT_PAGES[:2], start=1))),
+        )
+    )
+    requests.append(
+        (
+            ec.PAGE_GROUP_SUMMARY_TEMPLATE.name,
+            ec._page_group_summary_prompt("contract", list(enumerate(_SAMPLE_CONTRACT_PAGES[1:], start=2))),
+        )
+    )
+    for filename, text in _SAMPLE_REGISTRIES:
+        requests.append((ec.REGISTRY_SUMMARY_TEMPLATE.name, ec._registry_summary_prompt(filename, text)))
+    for idx in range(2):
+        summaries = [
+            {"doc_type": "contract", "file": f"job{idx}.pdf", "page": p, "summary": f"- 요약 {idx}-{p}"}
+            for p in range(1, 4)
+        ]
+        summaries.append({"doc_type": "registry", "file": f"reg{idx}.pdf", "page": 1, "summary": "- 근저당 있음"})
+        requests.append((ec.FINAL_MARKDOWN_TEMPLATE.name, ec._final_markdown_prompt(summaries)))
+    for keywords in _SAMPLE_KEYWORDS:
+        requests.append((checklist_service.CHECKLIST_TEMPLATE.name, checklist_service._build_prompt(keywords)))
+    return requests
+
+
+def _flatten(messages: list[dict[str, Any]]) -> str:
+    # chat template 의 role 구분자를 흉내 내 메시지 경계도 접두부 비교에 포함한다
+    return "".join(f"<|{m['role']}|>{m['content']}" for m in messages)
+
+
+async def _send_all(base_url: str, requests: list[tuple[str, list[dict[str, str]]]]) -> None:
+    async with httpx.AsyncClient(timeout=10.0) as http:
+        vllm = VLLMClient(http=http, base_url=base_url, api_key="stub", model="stub-model")
+        for _, messages in requests:
+            await vllm.chat(messages, max_tokens=16)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokenizer-path", default=os.getenv("TOKENIZER_PATH", ""))
+    args = parser.parse_args()
+
+    counter = TokenCounter.load(tokenizer_path=args.tokenizer_path)
+    requests = _sample_requests()
+
+    with StubVLLMServer() as stub:
+        asyncio.run(_send_all(stub.base_url, requests))
+        received = [_flatten(payload["messages"]) for payload in stub.requests]
+
+    by_template: dict[str, list[str]] = {}
+    for (name, _), prompt in zip(requests, received, strict=True):
+        by_template.setdefault(name, []).append(prompt)
+
+    print(f"tokenizer backend: {counter.backend}")
+    print(f"{'template':<36} {'reqs':>4} {'prefix_tok':>10} {'static_tok':>10} {'min_prompt_tok':>14} {'shared':>7}")
+    for name, prompts in by_template.items():
+        prefix = os.path.commonprefix(prompts)
+        prefix_tokens = counter.count(prefix)
+        static_tokens = counter.count(PROMPT_TEMPLATES[name].static_prefix)
+        min_tokens = min(counter.count(p) for p in prompts)
+        shared = prefix_tokens / min_tokens if min_tokens else 0.0
+        print(f"{name:<36} {len(prompts):>4} {prefix_tokens:>10} {static_tokens:>10} {min_tokens:>14} {shared:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""프로세스 기동 비용 측정 (import 프로파일 + 첫 결과까지 걸리는 시간).
+
+imports: `python -X importtime` 으로 모듈을 새 인터프리터에서 import 하고, 패키지별 자체 import 시간과
+         app.* 모듈별 누적 시간을 보여 준다. 여러 번 돌려 가장 빠른 회차를 쓴다 (디스크 캐시 영향 제외).
+ready:   새 인터프리터에서 app.bootstrap import -> create_container -> startup -> 첫 체크리스트 생성까지의
+         단계별 시간을 잰다. vLLM 은 로컬 스텁, RabbitMQ 는 끈다 (컨슈머가 첫 메시지를 처리할 수 있을 때까지의 근사치).
+         --cpu-workers 를 주면 CPU 작업 프로세스 풀을 켠 상태로 잰다.
+
+    uv run python -m benchmarks.startup [--mode all] [--module app.main] [--runs 5] [--top 15] [--cpu-workers 0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+MODES = ("imports", "ready")
+
+_READY_STAGES = ("import", "create_container", "startup", "first_result", "total")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def _parse_importtime(stderr: str) -> list[ImportRecord]:
+    records: list[ImportRecord] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|", 2)
+        records.append(ImportRecord(module.strip(), int(self_us), int(cumulative_us)))
+    return records
+
+
+def _child_env(**overrides: str) -> dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("APP_ENV", "prod")
+    env.update(overrides)
+    return env
+
+
+def profile_imports(module: str, runs: int) -> list[ImportRecord]:
+    best: list[ImportRecord] | None = None
+    best_total = 0
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            env=_child_env(),
+            check=True,
+        )
+        records = _parse_importtime(proc.stderr)
+        total = next((r.cumulative_us for r in records if r.module == module), 0)
+        if best is None or total < best_total:
+            best, best_total = records, total
+    return best or []
+
+
+def print_import_profile(module: str, records: list[ImportRecord], top: int) -> None:
+    total = next((r.cumulative_us for r in records if r.module == module), 0)
+    print(f"import {module}: {total / 1000:.1f}ms (모듈 {len(records)}개)")
+
+    by_package: dict[str, int] = defaultdict(int)
+    for r in records:
+        by_package[r.module.split(".")[0]] += r.self_us
+    print(f"\n패키지별 자체 import 시간 (상위 {top})")
+    for package, self_us in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        print(f"  {package:<32} {self_us / 1000:>8.1f}ms {self_us / max(total, 1):>6.1%}")
+
+    # 패키지 import 도중 하위 모듈이 다시 찍히는 경우가 있어 모듈별 첫 기록만 쓴다
+    app_records = {r.module: r for r in reversed(records) if r.module.startswith("app.")}
+    app_modules = sorted(app_records.values(), key=lambda r: -r.cumulative_us)
+    print(f"\napp 모듈별 누적 import 시간 (상위 {top}, 하위 import 포함)")
+    for r in app_modules[:top]:
+        print(f"  {r.module:<48} {r.cumulative_us / 1000:>8.1f}ms")
+
+
+def measure_ready(runs: int, cpu_workers: int) -> list[dict[str, float]]:
+    from benchmarks.load_test import _stub_responder
+    from benchmarks.stubs import StubVLLMServer
+
+    samples: list[dict[str, float]] = []
+    with StubVLLMServer(responder=_stub_responder) as vllm_stub:
+        env = _child_env(
+            RABBITMQ_ENABLED="false",
+            VLLM_BASE_URL=vllm_stub.base_url,
+            VLLM_BASE_URLS="",
+            VLLM_API_KEY="stub",
+            REDIS_URL="",
+            CPU_POOL_ENABLED="true" if cpu_workers > 0 else "false",
+            CPU_POOL_WORKERS=str(max(cpu_workers, 0)),
+        )
+        for _ in range(runs):
+            started = time.perf_counter()
+            proc = subprocess.run(
+                [sys.executable, "-m", "benchmarks.startup", "--child"],
+                capture_output=True,
+                text=True,
+                env=env,
+            )
+            total = time.perf_counter() - started
+            if proc.returncode != 0:
+                sys.exit(f"측정 프로세스 실패 (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+            sample = json.loads(proc.stdout.strip().splitlines()[-1])
+            sample["total"] = total
+            samples.append(sample)
+    return samples
+
+
+def print_ready(samples: list[dict[str, float]]) -> None:
+    print(f"\n기동~첫 결과 (새 인터프리터 {len(samples)}회, total 은 인터프리터 기동 포함)")
+    print(f"  {'stage':<18} {'median_ms':>10} {'min_ms':>10}")
+    for stage in _READY_STAGES:
+        values = [s[stage] for s in samples]
+        print(f"  {stage:<18} {statistics.median(values) * 1000:>10.1f} {min(values) * 1000:>10.1f}")
+
+
+async def _child() -> dict[str, float]:
+    timings: dict[str, float] = {}
+    started = time.perf_counter()
+    from app.bootstrap import create_container
+
+    timings["import"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    container = await create_container()
+    timings["create_container"] = time.perf_counter() - started
+    try:
+        started = time.perf_counter()
+        await container.startup()
+        timings["startup"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await container.checklist_service.generate(template_id=1, keywords=["주차", "반려동물"])
+        timings["first_result"] = time.perf_counter() - started
+    finally:
+        await container.aclose()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("all", *MODES), default="all")
+    parser.add_argument("--module", default="app.main", help="imports 모드에서 import 할 모듈")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--cpu-workers", type=int, default=0, help="ready 모드에서 켤 CPU 작업 프로세스 수")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(_child())))
+        return
+
+    runs = max(1, args.runs)
+    if args.mode in ("all", "imports"):
+        print_import_profile(args.module, profile_imports(args.module, runs), args.top)
+    if args.mode in ("all", "ready"):
+        print_ready(measure_ready(runs, args.cpu_workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from uuid import uuid4
+
+
+class StubServer:
+    """로컬 포트에 뜨는 HTTP 스텁 서버 (벤치마크 전용)."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.requests: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> StubServer:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> StubServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def record(self, request: dict[str, Any]) -> None:
+        with self._lock:
+            self.requests.append(request)
+
+    def handle_post(self, path: str, headers: dict[str, str], body: bytes) -> tuple[int, str, bytes]:
+        return 404, "application/json", b'{"error": "not found"}'
+
+    def handle_get(self, path: str, headers: dict[str, str]) -> tuple[int, str, bytes]:
+        return 404, "application/json", b'{"error": "not found"}'
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                self._respond(*server.handle_post(self.path, dict(self.headers), body))
+
+            def do_GET(self) -> None:  # noqa: N802
+                self._respond(*server.handle_get(self.path, dict(self.headers)))
+
+            def _respond(self, status: int, content_type: str, payload: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return
+
+        return _Handler
+
+
+class StubVLLMServer(StubServer):
+    """OpenAI 호환 /chat/completions 스텁. 요청 payload 를 기록하고 고정 응답을 돌려준다.
+
+    latency_sec 는 첫 토큰까지의 지연, tokens_per_sec 는 출력 생성 속도(0이면 즉시)를 흉내 낸다.
+    responder 를 주면 요청 payload 별로 응답 본문을 만든다.
+    """
+
+    def __init__(
+        self,
+        *,
+        content: str = "- 요약",
+        latency_sec: float = 0.0,
+        tokens_per_sec: float = 0.0,
+        responder: Callable[[dict[str, Any]], str] | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        super().__init__(host, port)
+        self.content = content
+        self.latency_sec = latency_sec
+        self.tokens_per_sec = tokens_per_sec
+        self.responder = responder
+
+    def handle_post(self, path: str, headers: dict[str, str], body: bytes) -> tuple[int, str, bytes]:
+        if not path.rstrip("/").endswith("/chat/completions"):
+            return 404, "application/json", b'{"error": "not found"}'
+        payload = json.loads(body)
+        self.record(payload)
+        content = self.responder(payload) if self.responder is not None else self.content
+        # 토큰 수는 대략 글자 수로 어림한다 (스텁이라 토크나이저를 쓰지 않는다)
+        prompt_tokens = sum(len(m.get("content") or "") for m in payload.get("messages") or [])
+        completion_tokens = len(content)
+        delay = self.latency_sec
+        if self.tokens_per_sec > 0:
+            delay += completion_tokens / self.tokens_per_sec
+        if delay > 0:
+            time.sleep(delay)
+        response = {
+            "id": f"stub-{len(self.requests)}",
+            "object": "chat.completion",
+            "model": payload.get("model"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+        return 200, "application/json", json.dumps(response, ensure_ascii=False).encode("utf-8")
+
+
+SAMPLE_CONTRACT_HTML = (
+    "<h1 id='0'>부동산 임대차 계약서</h1>"
+    "<table id='1'><tr><td>보증금</td><td>금 일억원정</td></tr>"
+    "<tr><td>차임</td><td>월 금 오십만원정, 매월 25일 지급</td></tr>"
+    "<tr><td>임대차기간</td><td>2025년 3월 1일부터 2027년 2월 28일까지</td></tr></table>"
+    "<p id='2'>제1조 임대인과 임차인은 위 부동산에 관하여 다음과 같이 임대차계약을 체결한다.</p>"
+    "<p id='3'>제5조 임차인이 2기의 차임액에 달하도록 연체하면 임대인은 계약을 해지할 수 있다.</p>"
+    "<p id='4'>특약사항: 퇴실 시 원상복구하며 관리비는 임차인이 부담한다. 확정일자는 잔금일에 받는다.</p>"
+)
+
+
+class StubUpstageServer(StubServer):
+    """Upstage document-parse 스텁. multipart 요청을 받아 고정 HTML 문서를 돌려준다."""
+
+    def __init__(
+        self,
+        *,
+        html: str = SAMPLE_CONTRACT_HTML,
+        latency_sec: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        super().__init__(host, port)
+        self.html = html
+        self.latency_sec = latency_sec
+
+    def handle_post(self, path: str, headers: dict[str, str], body: bytes) -> tuple[int, str, bytes]:
+        self.record({"path": path, "bytes": len(body)})
+        if self.latency_sec > 0:
+            time.sleep(self.latency_sec)
+        response = {
+            "api": "2.0",
+            "model": "document-parse",
+            "content": {"html": self.html, "markdown": "", "text": ""},
+            "elements": [{"id": 0, "category": "paragraph", "page": 1, "content": {"html": self.html}}],
+            "usage": {"pages": 1},
+        }
+        return 200, "application/json", json.dumps(response, ensure_ascii=False).encode("utf-8")
+
+
+class StubFileServer(StubServer):
+    """GET 요청에 등록된 파일 바이트를 돌려주는 다운로드 스텁 (S3 presigned URL 대용)."""
+
+    def __init__(self, files: dict[str, bytes], *, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__(host, port)
+        self.files = files
+
+    def handle_get(self, path: str, headers: dict[str, str]) -> tuple[int, str, bytes]:
+        data = self.files.get(path.split("?", 1)[0])
+        if data is None:
+            return 404, "application/octet-stream", b""
+        return 200, "application/octet-stream", data
+
+    def url_for(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+
+@dataclass
+class InMemoryMessage:
+    """aio_pika IncomingMessage 중 핸들러가 쓰는 부분만 흉내 낸 메시지."""
+
+    body: bytes
+    queue_name: str
+    broker: InMemoryBroker
+    message_id: str = field(default_factory=lambda: uuid4().hex)
+    correlation_id: str | None = None
+    headers: dict[str, Any] = field(default_factory=dict)
+    redelivered: bool = False
+    processed: bool = False
+    published_at: float = field(default_factory=time.perf_counter)
+
+    async def ack(self) -> None:
+        self._settle()
+
+    async def nack(self, requeue: bool = True) -> None:
+        self._settle()
+        if requeue:
+            self.broker.requeue(self)
+
+    async def reject(self, requeue: bool = False) -> None:
+        await self.nack(requeue=requeue)
+
+    def _settle(self) -> None:
+        if self.processed:
+            raise RuntimeError("이미 처리된 메시지입니다.")
+        self.processed = True
+        self.broker.settled(self)
+
+
+class InMemoryBroker:
+    """RabbitMQClient 대용 인메모리 브로커.
+
+    큐별 prefetch 만큼만 동시에 컨슈머에 전달하고, 발행된 메시지는 exchange/routing_key 별로 모아 둔다.
+    RabbitMQWorker/RabbitMQResultPublisher 가 쓰는 메서드만 구현한다.
+    """
+
+    def __init__(self, *, prefetch_count: int = 1) -> None:
+        self.prefetch_count = prefetch_count
+        self.published: list[dict[str, Any]] = []
+        self._queues: dict[str, deque[InMemoryMessage]] = {}
+        self._consumers: dict[str, tuple[str, Callable[[InMemoryMessage], Awaitable[None]], int]] = {}
+        self._unacked: dict[str, int] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._settled_event = asyncio.Event()
+        self.ack_latencies: dict[str, list[float]] = {}
+
+    async def connect(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+
+    async def ensure_binding(self, binding: Any) -> None:
+        self._queues.setdefault(binding.queue_name, deque())
+
+    def put(self, queue_name: str, payload: dict[str, Any], *, correlation_id: str | None = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._queues.setdefault(queue_name, deque()).append(
+            InMemoryMessage(body=body, queue_name=queue_name, broker=self, correlation_id=correlation_id)
+        )
+        self._dispatch(queue_name)
+
+    def requeue(self, message: InMemoryMessage) -> None:
+        message.processed = False
+        message.redelivered = True
+        self._queues.setdefault(message.queue_name, deque()).appendleft(message)
+        self._dispatch(message.queue_name)
+
+    def settled(self, message: InMemoryMessage) -> None:
+        self._unacked[message.queue_name] = self._unacked.get(message.queue_name, 1) - 1
+        self.ack_latencies.setdefault(message.queue_name, []).append(time.perf_counter() - message.published_at)
+        self._settled_event.set()
+        self._dispatch(message.queue_name)
+
+    async def consume(
+        self,
+        queue_name: str,
+        handler: Callable[..., Awaitable[None]],
+        *,
+        prefetch_count: int | None = None,
+    ) -> str:
+        consumer_tag = f"ctag-{uuid4().hex[:8]}"
+        self._consumers[queue_name] = (consumer_tag, handler, prefetch_count or self.prefetch_count)
+        self._queues.setdefault(queue_name, deque())
+        self._dispatch(queue_name)
+        return consumer_tag
+
+    async def cancel_consumer(self, queue_name: str, consumer_tag: str) -> None:
+        consumer = self._consumers.get(queue_name)
+        if consumer is not None and consumer[0] == consumer_tag:
+            self._consumers.pop(queue_name, None)
+
+    async def queue_stats(self, queue_name: str) -> tuple[int, int]:
+        return len(self._queues.get(queue_name, ())), 1 if queue_name in self._consumers else 0
+
+    async def publish_json(
+        self,
+        *,
+        exchange_name: str,
+        routing_key: str,
+        payload: dict[str, Any],
+        message_id: str | None = None,
+        correlation_id: str | None = None,
+        message_type: str | None = None,
+        headers: dict[str, Any] | None = None,
+    ) -> bool:
+        self.published.append(
+            {
+                "exchange": exchange_name,
+                "routing_key": routing_key,
+                "payload": payload,
+                "message_id": message_id,
+                "correlation_id": correlation_id,
+                "type": message_type,
+                "headers": headers or {},
+            }
+        )
+        return True
+
+    def pending(self, queue_name: str) -> int:
+        return len(self._queues.get(queue_name, ())) + self._unacked.get(queue_name, 0)
+
+    async def wait_drained(self, queue_names: list[str], timeout_sec: float | None = None) -> None:
+        async def _wait() -> None:
+            while any(self.pending(name) for name in queue_names):
+                self._settled_event.clear()
+                await self._settled_event.wait()
+
+        await asyncio.wait_for(_wait(), timeout=timeout_sec)
+
+    def _dispatch(self, queue_name: str) -> None:
+        consumer = self._consumers.get(queue_name)
+        if consumer is None:
+            return
+        _, handler, prefetch = consumer
+        queue = self._queues.get(queue_name)
+        while queue and self._unacked.get(queue_name, 0) < prefetch:
+            message = queue.popleft()
+            self._unacked[queue_name] = self._unacked.get(queue_name, 0) + 1
+            task = asyncio.get_running_loop().create_task(handler(message))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)